@@ -0,0 +1,125 @@
+# Benchmark: camera frame -> pygame surface path (target < 2 ms per 640x480 frame)
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import cv2
+import numpy as np
+import pygame
+
+FRAMES = 300
+TARGET_MS = 2.0
+
+
+def legacy_camera_feed(screen, frame, colors, x, y, width, height):
+    """Previous per-frame implementation, kept for comparison"""
+    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    frame_rgb = np.fliplr(frame_rgb)
+    frame_surface = pygame.surfarray.make_surface(np.transpose(frame_rgb, (1, 0, 2)))
+    frame_surface = pygame.transform.scale(frame_surface, (width, height))
+
+    for i in range(4, 0, -1):
+        glow_alpha = 30 - i * 5
+        glow_rect = pygame.Rect(x - i * 2, y - i * 2, width + i * 4, height + i * 4)
+        glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            glow_surface, (*colors.CYAN, glow_alpha),
+            glow_surface.get_rect(), border_radius=15
+        )
+        screen.blit(glow_surface, (glow_rect.x, glow_rect.y))
+
+    camera_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    camera_surface.blit(frame_surface, (0, 0))
+    mask_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(mask_surface, (255, 255, 255, 255), (0, 0, width, height), border_radius=12)
+    camera_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    screen.blit(camera_surface, (x, y))
+    pygame.draw.rect(screen, colors.CYAN, (x, y, width, height), width=3, border_radius=12)
+
+
+def check_frame_views(bgr, timeout=2.0):
+    """
+    Derived views of a fresh Frame must match direct conversions
+
+    The downscaled view is requested first, so it has to build the RGB view
+    itself. Runs on a thread so a deadlock fails the check instead of hanging.
+    """
+    from frame import Frame
+
+    errors = []
+
+    def check():
+        frame = Frame(bgr)
+        small = frame.downscaled_rgb(320)
+        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        if not np.array_equal(small, cv2.resize(rgb, (320, 240), interpolation=cv2.INTER_AREA)):
+            errors.append("downscaled_rgb")
+        if not np.array_equal(frame.rgb, rgb):
+            errors.append("rgb")
+        if not np.array_equal(frame.mirrored, cv2.flip(bgr, 1)):
+            errors.append("mirrored")
+
+    worker = threading.Thread(target=check, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), "Frame view build deadlocked"
+    assert not errors, f"Frame views do not match: {', '.join(errors)}"
+
+
+def time_per_frame(draw, frames):
+    """Average milliseconds per call of draw(frame)"""
+    start = time.perf_counter()
+    for frame in frames:
+        draw(frame)
+    return (time.perf_counter() - start) / len(frames) * 1000
+
+
+def run_benchmark():
+    """Compare legacy and presenter paths for the camera feed"""
+    from ui.constants import Colors, Dimensions
+    from ui.camera_presenter import CameraPresenter
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    colors = Colors()
+    width, height = Dimensions.CAMERA_WIDTH, Dimensions.CAMERA_HEIGHT
+    x, y = (1280 - width) // 2, 120
+
+    presenter = CameraPresenter(width, height, colors)
+    frames = [
+        np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(8)
+    ] * (FRAMES // 8)
+
+    # Presenter output must match a plain mirror + BGR->RGB of the frame
+    surface = presenter.update(frames[0])
+    expected = cv2.cvtColor(cv2.flip(frames[0], 1), cv2.COLOR_BGR2RGB)
+    actual = pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+    assert np.array_equal(actual, expected), "presenter output does not match frame"
+    check_frame_views(frames[0])
+
+    legacy_ms = time_per_frame(
+        lambda f: legacy_camera_feed(screen, f, colors, x, y, width, height), frames
+    )
+    update_ms = time_per_frame(presenter.update, frames)
+    draw_ms = time_per_frame(lambda f: presenter.draw(screen, f, x, y), frames)
+
+    print(f"Camera feed {width}x{height}, {len(frames)} frames")
+    print(f"  legacy path:          {legacy_ms:.2f} ms/frame")
+    print(f"  presenter update:     {update_ms:.2f} ms/frame")
+    print(f"  presenter full draw:  {draw_ms:.2f} ms/frame")
+
+    if update_ms > TARGET_MS:
+        print(f"❌ FAIL: frame conversion above {TARGET_MS} ms target")
+        return False
+    print(f"✅ PASS: frame conversion under {TARGET_MS} ms target")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)
@@ -0,0 +1,88 @@
+# Regression benchmark: gameplay frames must not touch the filesystem
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+import pygame
+
+FRAMES = 300
+
+opened_files = []
+
+
+def audit_hook(event, args):
+    """Record every file opened from Python code"""
+    if event == "open" and opened_files is not None:
+        opened_files.append(args[0])
+
+
+def read_bytes_from_proc():
+    """Bytes read by this process via read syscalls (Linux only)"""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def run_benchmark():
+    """Draw gameplay frames and count file I/O"""
+    from ui import UIManager
+
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+    ui_manager = UIManager(1280, 720)
+
+    frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    expressions = ["happy", "sad", "surprised", "neutral"]
+
+    def draw_frames():
+        for i in range(FRAMES):
+            ui_manager.draw_game_with_debug(
+                frame, expressions[i % len(expressions)], i, 20 - i / 30, "neutral"
+            )
+
+    # Warm up caches first: FreeType reads glyphs from the font file lazily
+    draw_frames()
+
+    global opened_files
+    rchar_before = read_bytes_from_proc()
+    opened_files = []
+    start = time.perf_counter()
+
+    draw_frames()
+
+    elapsed = time.perf_counter() - start
+    files = opened_files
+    opened_files = None
+    rchar_after = read_bytes_from_proc()
+
+    print(f"Frames: {FRAMES}, avg {elapsed / FRAMES * 1000:.2f} ms/frame")
+    print(f"Files opened during gameplay frames: {len(files)}")
+    if rchar_before is not None:
+        print(f"Bytes read during gameplay frames: {rchar_after - rchar_before}")
+
+    # /proc/self/io also counts this script's own reads of /proc, allow a few KB
+    if files or (rchar_before is not None and rchar_after - rchar_before > 4096):
+        print("❌ FAIL: gameplay frames performed file I/O")
+        for path in sorted(set(map(str, files)))[:10]:
+            print(f"   {path}")
+        return False
+
+    print("✅ PASS: zero file I/O per gameplay frame")
+    return True
+
+
+if __name__ == "__main__":
+    sys.addaudithook(audit_hook)
+    sys.exit(0 if run_benchmark() else 1)
@@ -0,0 +1,144 @@
+# Micro-benchmark: vectorized feature extraction vs the scalar protobuf path
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+import face_features as ff
+from face_features import classify_features, compute_features, landmarks_to_array
+
+REPEATS = 20
+
+
+def scalar_analyze(landmarks, image_shape):
+    """
+    Scalar reference (protobuf attribute access per landmark)
+
+    Same inter-ocular-normalized metrics and thresholds as face_features, so
+    labels must agree exactly; only the access pattern differs. This is not
+    the pre-normalization pixel-threshold classifier.
+    """
+    h, w = image_shape[:2]
+    left_eye_outer = landmarks.landmark[33]
+    right_eye_outer = landmarks.landmark[263]
+    iod = ((right_eye_outer.x - left_eye_outer.x) ** 2 * w * w
+           + (right_eye_outer.y - left_eye_outer.y) ** 2 * h * h) ** 0.5 + 1e-6
+    mouth_left = landmarks.landmark[61]
+    mouth_right = landmarks.landmark[291]
+    upper_lip = landmarks.landmark[13]
+    lower_lip = landmarks.landmark[14]
+    left_eyebrow_inner = landmarks.landmark[70]
+    right_eyebrow_inner = landmarks.landmark[300]
+    left_eye_top = landmarks.landmark[159]
+    left_eye_bottom = landmarks.landmark[145]
+    right_eye_top = landmarks.landmark[386]
+    right_eye_bottom = landmarks.landmark[374]
+
+    mouth_height = abs(lower_lip.y - upper_lip.y) * h
+    mouth_width = abs(mouth_right.x - mouth_left.x) * w
+    mar = mouth_height / (mouth_width + 1e-6)
+    mouth_center_y = (upper_lip.y + lower_lip.y) / 2
+    mouth_smile = -((mouth_left.y - mouth_center_y) + (mouth_right.y - mouth_center_y)) / 2 * h / iod
+    avg_eye_height = (
+        abs(left_eye_top.y - left_eye_bottom.y) * h
+        + abs(right_eye_top.y - right_eye_bottom.y) * h
+    ) / 2
+    avg_eyebrow_height = (
+        (left_eye_top.y - left_eyebrow_inner.y) * h
+        + (right_eye_top.y - right_eyebrow_inner.y) * h
+    ) / 2
+    avg_eye_height /= iod
+    avg_eyebrow_height /= iod
+
+    if mar > ff.SURPRISED_MAR and avg_eyebrow_height > ff.SURPRISED_EYEBROW and avg_eye_height > ff.SURPRISED_EYE:
+        return "surprised"
+    elif mouth_smile > ff.HAPPY_SMILE and mar > ff.HAPPY_MAR:
+        return "happy"
+    elif mouth_smile < ff.SAD_SMILE and avg_eyebrow_height < ff.SAD_EYEBROW:
+        return "sad"
+    return "neutral"
+
+
+def collect_landmarks(video_path):
+    """Run face mesh over a clip and keep the landmark lists"""
+    face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces=1, refine_landmarks=True)
+    cap = cv2.VideoCapture(video_path)
+    landmark_lists = []
+    shape = None
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        shape = frame.shape
+        results = face_mesh.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if results.multi_face_landmarks:
+            landmark_lists.append(results.multi_face_landmarks[0])
+    cap.release()
+    return landmark_lists, shape
+
+
+def per_call_us(fn, items):
+    """Average microseconds per item over REPEATS passes"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (REPEATS * len(items)) * 1e6
+
+
+def run_benchmark(video_path):
+    """Compare scalar and vectorized feature extraction"""
+    landmark_lists, shape = collect_landmarks(video_path)
+    if not landmark_lists:
+        print("❌ No faces found in clip")
+        return False
+
+    scalar_labels = [scalar_analyze(lms, shape) for lms in landmark_lists]
+    points = np.stack([landmarks_to_array(lms) for lms in landmark_lists])
+    batch_labels = classify_features(compute_features(points, shape))
+    single_labels = [classify_features(compute_features(face, shape)) for face in points]
+    agreement = min(
+        np.mean(np.asarray(scalar_labels) == batch_labels),
+        np.mean(np.asarray(scalar_labels) == np.asarray(single_labels)),
+    )
+
+    scalar_us = per_call_us(lambda lms: scalar_analyze(lms, shape), landmark_lists)
+    convert_us = per_call_us(landmarks_to_array, landmark_lists)
+    # Live path: FaceDetector already holds the landmark array (ROI tracking,
+    # rate control and the overlay need it), then classifies one face
+    live_us = per_call_us(
+        lambda face: classify_features(compute_features(face, shape)), list(points)
+    )
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        classify_features(compute_features(points, shape))
+    batch_us = (time.perf_counter() - start) / (REPEATS * len(points)) * 1e6
+
+    print(f"Faces: {len(landmark_lists)} ({shape[1]}x{shape[0]})")
+    print(f"  scalar reference path:        {scalar_us:8.1f} us/face")
+    print(f"  landmarks_to_array (478):     {convert_us:8.1f} us/face")
+    print(f"  live single face (features):  {live_us:8.1f} us/face")
+    print(f"  vectorized batch of {len(points):<4}:     {batch_us:8.1f} us/face")
+    print(f"  label agreement with scalar:  {agreement * 100:.1f}%")
+
+    if agreement != 1.0:
+        print("❌ Labels differ from the scalar reference")
+        return False
+    if live_us > scalar_us:
+        print("❌ Live single-face path is slower than the scalar reference")
+        return False
+    print(f"✅ Live single-face path {scalar_us / live_us:.1f}x the scalar reference speed")
+    return True
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/bench_features.py <video_with_face>")
+        sys.exit(2)
+    sys.exit(0 if run_benchmark(sys.argv[1]) else 1)
@@ -0,0 +1,230 @@
+# Benchmark: capture process -> inference process frame hand-over, SharedFrameRing vs a pickling Queue
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+
+from shared_frame_ring import SharedFrameRing
+
+WIDTH, HEIGHT = 640, 480
+FRAME_BYTES = WIDTH * HEIGHT * 3
+DURATION = 3.0  # Seconds per transport
+SLOTS = 4
+IDLE_SLEEP = 0.0002
+CAMERA_FPS = 30  # Capture rate with --detect (a real camera, not a flood)
+
+
+def make_consumer(profile):
+    """
+    Per-frame work of the inference process
+
+    Without a profile only the detector's input conversion runs (Frame.rgb),
+    so the transport dominates; with one, FaceDetector.detect_features runs.
+    """
+    if profile is None:
+        return lambda frame: frame.rgb
+    from face_detector import FaceDetector
+
+    detector = FaceDetector(profile=profile)
+    return detector.detect_features
+
+
+def pace(seq, start, fps):
+    """Sleep until frame seq is due (fps None = as fast as possible)"""
+    if fps:
+        delay = start + seq / fps - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def ring_capture(name, stop_event, fps):
+    """Capture side: fill the next slot in place; the first pixel carries seq % 256"""
+    ring = SharedFrameRing.attach(name, SLOTS, HEIGHT, WIDTH)
+    image = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    seq = 0
+    start = time.time()
+    while not stop_event.is_set():
+        seq += 1
+        pace(seq, start, fps)
+        slot = ring.begin_write()
+        np.copyto(slot, image)  # Stands in for cap.retrieve(slot)
+        slot[0, 0, 0] = seq % 256
+        ring.end_write()
+    ring.close()
+
+
+def ring_inference(name, profile, ready_event, results):
+    """Inference side: same loop as station_pool.run_station"""
+    ring = SharedFrameRing.attach(name, SLOTS, HEIGHT, WIDTH)
+    consume = make_consumer(profile)
+    ready_event.set()
+    while ring.latest_seq() == 0:
+        time.sleep(0.001)
+
+    processed = dropped = torn = 0
+    latency = 0.0
+    last_seq = 0
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        frame = ring.read_latest()
+        if frame.seq == last_seq:
+            time.sleep(IDLE_SLEEP)  # Don't spin on the capture process's core
+            continue
+        last_seq = frame.seq
+        latency += time.time() - frame.timestamp
+        stamp = frame.bgr[0, 0, 0]
+        consume(frame)
+        if not ring.is_current(frame):
+            dropped += 1  # Slot reused while analyzing: the station drops it too
+            continue
+        if stamp != frame.seq % 256:
+            torn += 1
+        processed += 1
+
+    frame = None
+    ring.close()
+    results.put((processed, dropped, torn, latency / max(1, processed + dropped)))
+
+
+def queue_capture(queue, stop_event, fps):
+    """Capture side through a multiprocessing.Queue (pickled, fresh array per frame)"""
+    image = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    seq = 0
+    start = time.time()
+    while not stop_event.is_set():
+        seq += 1
+        pace(seq, start, fps)
+        image[0, 0, 0] = seq % 256
+        try:
+            # A camera read returns a new array per frame; the queue pickles it
+            # later on its feeder thread, so the reused buffer must be copied
+            queue.put((seq, time.time(), image.copy()), timeout=0.1)
+        except Exception:
+            pass
+
+
+def queue_inference(queue, profile, ready_event, results):
+    """Inference side: unpickle each frame from the queue"""
+    from frame import Frame
+
+    consume = make_consumer(profile)
+    ready_event.set()
+    queue.get()  # Wait for the capture process
+
+    processed = torn = 0
+    latency = 0.0
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        seq, timestamp, image = queue.get()
+        latency += time.time() - timestamp
+        frame = Frame(image, timestamp, seq)
+        consume(frame)
+        if image[0, 0, 0] != seq % 256:
+            torn += 1
+        processed += 1
+    results.put((processed, 0, torn, latency / max(1, processed)))
+
+
+def bench_ring(context, profile, fps):
+    """Returns (processed, dropped, torn, mean hand-over latency) of the inference process"""
+    ring = SharedFrameRing(create=True, slots=SLOTS, height=HEIGHT, width=WIDTH)
+    stop_event, ready_event = context.Event(), context.Event()
+    results = context.Queue()
+    inference = context.Process(
+        target=ring_inference, args=(ring.name, profile, ready_event, results), daemon=True
+    )
+    inference.start()
+    ready_event.wait()  # Detector loaded before frames start flowing
+    capture = context.Process(
+        target=ring_capture, args=(ring.name, stop_event, fps), daemon=True
+    )
+    capture.start()
+
+    counts = results.get()
+    stop_event.set()
+    capture.join()
+    inference.join()
+    ring.close(unlink=True)
+    return counts
+
+
+def bench_queue(context, profile, fps):
+    """Same hand-over through a bounded Queue; returns (processed, dropped, torn, latency)"""
+    queue = context.Queue(maxsize=SLOTS)
+    stop_event, ready_event = context.Event(), context.Event()
+    results = context.Queue()
+    inference = context.Process(
+        target=queue_inference, args=(queue, profile, ready_event, results), daemon=True
+    )
+    inference.start()
+    ready_event.wait()
+    capture = context.Process(target=queue_capture, args=(queue, stop_event, fps), daemon=True)
+    capture.start()
+
+    counts = results.get()
+    stop_event.set()
+    while capture.is_alive():
+        try:
+            queue.get(timeout=0.1)
+        except Exception:
+            pass
+    capture.join()
+    inference.join()
+    return counts
+
+
+def report(name, processed, dropped, torn, latency):
+    fps = processed / DURATION
+    print(
+        f"  {name:<16} {fps:9.0f} frames/s  {fps * FRAME_BYTES / 1e6:9.0f} MB/s  "
+        f"hand-over {latency * 1000:6.2f} ms  dropped: {dropped}  torn: {torn}"
+    )
+    return fps, latency, torn
+
+
+def run_benchmark(profile=None):
+    """
+    Without a profile, capture floods the ring and throughput is compared;
+    with one, capture runs at CAMERA_FPS and hand-over latency is compared.
+    """
+    context = mp.get_context("spawn")
+    fps = CAMERA_FPS if profile else None
+    work = f"FaceDetector '{profile}', {fps} fps capture" if profile else "RGB conversion only"
+    print(f"{WIDTH}x{HEIGHT} BGR frames ({FRAME_BYTES / 1e6:.2f} MB), capture process -> "
+          f"inference process ({work}), {DURATION:.0f} s each, {os.cpu_count()} CPU(s)")
+    ring_fps, ring_latency, ring_torn = report(
+        "SharedFrameRing", *bench_ring(context, profile, fps)
+    )
+    queue_fps, queue_latency, _ = report("Queue (pickle)", *bench_queue(context, profile, fps))
+
+    if ring_torn:
+        print("❌ Inference process saw torn frames from the shared ring")
+        return False
+    if profile:
+        if ring_latency < queue_latency:
+            print(f"✅ Shared ring hands frames over {queue_latency / ring_latency:.1f}x "
+                  f"faster than a Queue")
+            return True
+        print("❌ Shared ring hand-over is not faster than a Queue")
+        return False
+    if ring_fps > queue_fps:
+        print(f"✅ Shared ring delivers {ring_fps / queue_fps:.1f}x the frames of a Queue")
+        return True
+    print("❌ Shared ring is not faster than a Queue")
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capture -> inference frame hand-over benchmark")
+    parser.add_argument(
+        "--detect", metavar="PROFILE",
+        help="Run FaceDetector with this profile in the inference process",
+    )
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.detect) else 1)
@@ -0,0 +1,142 @@
+# Benchmark: background particle frame cost vs particle count (legacy dicts vs SoA store)
+# The SoA sweep runs on one fixed-capacity system resized with set_particle_count()
+import math
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+WIDTH, HEIGHT = 1280, 720
+CAMERA_AREA = (320, 120, 640, 480)  # Game screen camera feed (particles culled there)
+COUNTS = (30, 100, 300, 1000, 3000, 5000)
+GATED_MIN_COUNT = 300  # Below this a frame costs ~1 ms and noise can flip the ratio: reported only
+FRAMES = 60
+SEED = 0
+
+
+class LegacyParticles:
+    """Reference: list of dicts, per-particle trig, three glow surfaces per particle"""
+
+    def __init__(self, width, height, colors, count):
+        self.width = width
+        self.height = height
+        color_choices = [
+            colors.PURPLE, colors.PINK, colors.CYAN,
+            colors.ORANGE, colors.YELLOW, colors.LIGHT_BLUE
+        ]
+        self.particles = [
+            {
+                "x": random.randint(0, width),
+                "y": random.randint(0, height),
+                "size": random.randint(3, 12),
+                "speed": random.uniform(0.5, 2),
+                "color": random.choice(color_choices),
+                "direction": random.uniform(0, 2 * math.pi),
+            }
+            for _ in range(count)
+        ]
+
+    def update_and_draw(self, screen, exclude_area=None):
+        for particle in self.particles:
+            particle["x"] += math.cos(particle["direction"]) * particle["speed"]
+            particle["y"] += math.sin(particle["direction"]) * particle["speed"]
+            if particle["x"] < 0:
+                particle["x"] = self.width
+            elif particle["x"] > self.width:
+                particle["x"] = 0
+            if particle["y"] < 0:
+                particle["y"] = self.height
+            elif particle["y"] > self.height:
+                particle["y"] = 0
+
+            if exclude_area:
+                ex, ey, ew, eh = exclude_area
+                margin = 30
+                if (ex - margin <= particle["x"] <= ex + ew + margin and
+                        ey - margin <= particle["y"] <= ey + eh + margin):
+                    continue
+
+            for i in range(3, 0, -1):
+                size = particle["size"] * i
+                alpha_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(
+                    alpha_surface, (*particle["color"], 50 // i), (size, size), size
+                )
+                screen.blit(
+                    alpha_surface, (int(particle["x"]) - size, int(particle["y"]) - size)
+                )
+
+
+def time_system(system, screen, exclude_area):
+    """Frame times in ms for one particle system"""
+    system.update_and_draw(screen, exclude_area)  # Warm-up, not timed
+    times = []
+    for _ in range(FRAMES):
+        screen.fill((20, 20, 40))
+        start = time.perf_counter()
+        system.update_and_draw(screen, exclude_area)
+        times.append(time.perf_counter() - start)
+    return np.asarray(times) * 1000
+
+
+def run_benchmark():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from ui.animations import ParticleSystem
+    from ui.constants import Colors
+
+    colors = Colors()
+    print(f"{WIDTH}x{HEIGHT}, {FRAMES} frames per run, camera area culled")
+    print(f"{'particles':>9} {'legacy ms':>10} {'SoA ms':>8} {'SoA p95':>8} "
+          f"{'no cull ms':>11} {'speedup':>8}")
+
+    random.seed(SEED)
+    system = ParticleSystem(WIDTH, HEIGHT, colors, 0, capacity=max(COUNTS))
+    store = system.store
+    arrays = (store.x, store.y, store.vx, store.vy, store.sprite)
+
+    all_faster = True
+    for count in COUNTS:
+        random.seed(SEED)
+        legacy = time_system(LegacyParticles(WIDTH, HEIGHT, colors, count), screen, CAMERA_AREA)
+        system.set_particle_count(count)
+        soa = time_system(system, screen, CAMERA_AREA)
+        unculled = time_system(system, screen, None)
+
+        speedup = legacy.mean() / soa.mean()
+        if count >= GATED_MIN_COUNT:
+            all_faster &= speedup > 1
+        note = "" if count >= GATED_MIN_COUNT else "  (not gated)"
+        print(f"{count:>9} {legacy.mean():10.2f} {soa.mean():8.2f} "
+              f"{np.percentile(soa, 95):8.2f} {unculled.mean():11.2f} {speedup:7.1f}x{note}")
+
+    # Shrink back down, then past capacity: counts follow, arrays are never reallocated
+    resized = True
+    for count in (*reversed(COUNTS), 0, max(COUNTS) * 2):
+        system.set_particle_count(count)
+        resized &= store.count == min(count, store.capacity)
+    resized &= all(a is b for a, b in zip(arrays, (store.x, store.y, store.vx, store.vy, store.sprite)))
+    pygame.quit()
+
+    if not resized:
+        print("❌ set_particle_count() did not resize the store in place")
+        return False
+    if all_faster:
+        print(f"✅ SoA particle store is faster from {GATED_MIN_COUNT} particles up")
+        return True
+    print(f"❌ SoA particle store is slower than the legacy particles at "
+          f"{GATED_MIN_COUNT}+ particles")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)
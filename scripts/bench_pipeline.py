@@ -0,0 +1,107 @@
+# Benchmark: headless detection -> filter -> scoring pipeline on a recorded session
+import hashlib
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# GameLogic loads sounds through pygame.mixer; no audio/video device on CI
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from expression_filter import ExpressionFilter
+from face_detector import DEFAULT_PROFILE, FaceDetector
+from frame_source import ReplaySource
+from game_logic import GameLogic
+
+DIFFICULTY = "medium"
+SEED = 0
+
+
+def run_pipeline(path, profile):
+    """
+    Play the whole recording through detector, filter and game logic
+
+    Every frame is processed (synchronous replay) and the game runs on the
+    recording's media clock, so the result only depends on the input.
+    """
+    source = ReplaySource(path, realtime=False)
+    detector = FaceDetector(profile=profile)
+    game_logic = GameLogic(difficulty=DIFFICULTY, clock=source.clock)
+    expression_filter = ExpressionFilter(**game_logic.filter_settings)
+    detector.configure_roi(**game_logic.roi_settings)
+
+    random.seed(SEED)
+    detect_times = []
+    score_times = []
+    decisions = []
+    started = False
+    for frame in source.frames():
+        if not started:
+            game_logic.start_game()
+            started = True
+
+        start = time.perf_counter()
+        features = detector.detect_features(frame)
+        detect_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        expression = expression_filter.update(features, frame.timestamp)
+        scored = game_logic.update(expression, frame.timestamp)
+        score_times.append(time.perf_counter() - start)
+
+        decisions.append(f"{frame.seq}:{expression}:{int(scored)}")
+    source.release()
+
+    digest = hashlib.sha1("\n".join(decisions).encode()).hexdigest()[:12]
+    labels = [decision.split(":")[1] for decision in decisions]
+    return {
+        "frames": len(decisions),
+        "fps": source.fps,
+        "detect_ms": np.asarray(detect_times) * 1000,
+        "score_ms": np.asarray(score_times) * 1000,
+        "score": game_logic.score,
+        "labels": {label: labels.count(label) for label in sorted(set(labels))},
+        "digest": digest,
+    }
+
+
+def run_benchmark(path, profile=DEFAULT_PROFILE):
+    """Run the pipeline twice and check that both runs decide the same"""
+    if not os.path.exists(path):
+        print(f"❌ Recording not found: {path}")
+        return False
+
+    first = run_pipeline(path, profile)
+    if not first["frames"]:
+        print(f"❌ Could not read frames from {path}")
+        return False
+
+    detect_ms = first["detect_ms"]
+    total_s = (detect_ms.sum() + first["score_ms"].sum()) / 1000
+    print(f"Recording: {first['frames']} frames at {first['fps']:.0f} fps, profile {profile}")
+    print(f"  Pipeline:  {first['frames'] / total_s:7.1f} frames/s")
+    print(f"  Detect:    {detect_ms.mean():7.2f} ms mean  {np.percentile(detect_ms, 95):7.2f} ms p95")
+    print(f"  Filter+score: {first['score_ms'].mean() * 1000:7.1f} us mean")
+    print(f"  Labels:    {first['labels']}")
+    print(f"  Score:     {first['score']}  decisions {first['digest']}")
+
+    second = run_pipeline(path, profile)
+    if second["digest"] != first["digest"] or second["score"] != first["score"]:
+        print(f"❌ Replay is not reproducible ({first['digest']} vs {second['digest']})")
+        return False
+    print("✅ Two replays produced identical decisions")
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/bench_pipeline.py <video file | frame directory> [profile]")
+        sys.exit(1)
+    profile = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PROFILE
+    sys.exit(0 if run_benchmark(sys.argv[1], profile) else 1)
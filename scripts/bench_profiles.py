@@ -0,0 +1,72 @@
+# Benchmark: per-profile face detector latency and agreement with "accurate"
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import cv2
+import numpy as np
+
+from face_detector import DETECTOR_PROFILES, FaceDetector
+from frame import Frame
+
+REFERENCE_PROFILE = "accurate"
+
+
+def load_frames(video_path):
+    """Read every frame of the clip into memory"""
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def run_profile(profile, frames):
+    """Run one detector profile over the clip (fresh tracking state)"""
+    detector = FaceDetector(profile=profile)
+    labels = []
+    times = []
+    for i, image in enumerate(frames):
+        frame = Frame(image, seq=i + 1)
+        start = time.perf_counter()
+        labels.append(detector.detect_expression(frame))
+        times.append(time.perf_counter() - start)
+    return np.asarray(labels), np.asarray(times) * 1000
+
+
+def run_benchmark(video_path):
+    """Compare all profiles against the reference profile"""
+    frames = load_frames(video_path)
+    if not frames:
+        print(f"❌ Could not read frames from {video_path}")
+        return False
+
+    h, w = frames[0].shape[:2]
+    print(f"Clip: {len(frames)} frames ({w}x{h})")
+    print(f"{'profile':<10} {'mean ms':>8} {'p95 ms':>8} {'agreement':>10}")
+
+    # Agreement is informational: profiles without iris refinement place the
+    # eye/lip contours slightly differently, so borderline frames can flip
+    reference_labels, _ = run_profile(REFERENCE_PROFILE, frames)
+    for profile in DETECTOR_PROFILES:
+        labels, times = run_profile(profile, frames)
+        agreement = np.mean(labels == reference_labels)
+        print(
+            f"{profile:<10} {times.mean():8.2f} {np.percentile(times, 95):8.2f} "
+            f"{agreement * 100:9.1f}%"
+        )
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/bench_profiles.py <recorded_clip>")
+        sys.exit(2)
+    sys.exit(0 if run_benchmark(sys.argv[1]) else 1)
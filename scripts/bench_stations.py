@@ -0,0 +1,90 @@
+# Benchmark: StationPool scaling, N stations replaying a clip at its frame rate on one host
+import argparse
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+
+from station_pool import StationPool
+
+WARMUP_TIMEOUT = 60.0  # Seconds for every station to load MediaPipe
+EFFICIENCY_TARGET = 0.9  # Share of captured frames inferred, per station
+
+
+def measure(clip, stations, profile, duration):
+    """
+    Run a pool and count frames over `duration` seconds after warm-up
+
+    Returns:
+        dict: captured/inferred frames per second (all stations) and mean
+              inference time in ms
+    """
+    pool = StationPool([clip] * stations, profile=profile).start()
+    try:
+        deadline = time.time() + WARMUP_TIMEOUT
+        while any(pool.get_latest(i) is None for i in range(stations)):
+            if time.time() > deadline:
+                raise RuntimeError("stations did not start")
+            time.sleep(0.1)
+
+        before = pool.get_stats()
+        start = time.perf_counter()
+        inference_ms = []
+        while time.perf_counter() - start < duration:
+            time.sleep(0.1)
+            for station in range(stations):
+                inference_ms.append(pool.get_latest(station).inference_time * 1000)
+        elapsed = time.perf_counter() - start
+        after = pool.get_stats()
+    finally:
+        pool.stop()
+
+    captured = sum(a["frames_captured"] - b["frames_captured"] for a, b in zip(after, before))
+    inferred = sum(a["frames_processed"] - b["frames_processed"] for a, b in zip(after, before))
+    return {
+        "captured_fps": captured / elapsed,
+        "inferred_fps": inferred / elapsed,
+        "inference_ms": float(np.mean(inference_ms)),
+    }
+
+
+def run_benchmark(clip, counts, profile, duration):
+    cpus = os.cpu_count() or 1
+    print(f"Clip {clip}, profile '{profile}', {duration:.0f} s per run, {cpus} CPU(s)")
+    print(f"{'stations':>8} {'captured/s':>11} {'inferred/s':>11} {'inferred %':>11} "
+          f"{'infer ms':>9}")
+
+    scaled = True
+    for stations in counts:
+        result = measure(clip, stations, profile, duration)
+        share = result["inferred_fps"] / max(result["captured_fps"], 1e-9)
+        print(f"{stations:>8} {result['captured_fps']:11.1f} {result['inferred_fps']:11.1f} "
+              f"{share * 100:10.0f}% {result['inference_ms']:9.2f}")
+        # Stations beyond the core count share CPUs: reported, not judged
+        if stations <= cpus:
+            scaled &= share >= EFFICIENCY_TARGET
+
+    checked = [n for n in counts if n <= cpus]
+    if scaled:
+        print(f"✅ Stations kept up with capture up to {max(checked)} station(s) "
+              f"(cross-core scaling checked up to {cpus} CPU(s) only)")
+        return True
+    print(f"❌ Stations fell below {EFFICIENCY_TARGET * 100:.0f}% of captured frames "
+          f"within the core count")
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="StationPool scaling benchmark")
+    parser.add_argument("clip", help="Video file or frame directory with a face")
+    parser.add_argument(
+        "--stations", type=int, nargs="+", default=[1, 2, 4], help="Station counts to run"
+    )
+    parser.add_argument("--profile", default="accurate", help="FaceDetector profile")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.clip, args.stations, args.profile, args.duration) else 1)
@@ -0,0 +1,229 @@
+# Benchmark: headless frame times and Python allocations for every UI screen
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# Render off-screen: no window, no audio device (CI machines have neither)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from frame import Frame
+from leaderboard_manager import LeaderboardManager
+
+WIDTH, HEIGHT = 1280, 720
+CAMERA_WIDTH, CAMERA_HEIGHT = 640, 480
+WARMUP_FRAMES = 30
+SEED = 0
+
+
+def make_camera_images(count=8):
+    """Synthetic camera images: moving gradient plus sensor noise"""
+    rng = np.random.default_rng(SEED)
+    ys, xs = np.mgrid[0:CAMERA_HEIGHT, 0:CAMERA_WIDTH]
+    images = []
+    for i in range(count):
+        base = ((xs + ys + i * 16) % 256).astype(np.uint8)
+        image = np.dstack([base, base[::-1], np.roll(base, i * 8, axis=1)])
+        noise = rng.integers(0, 24, image.shape, dtype=np.uint8)
+        images.append(image + noise)
+    return images
+
+
+def make_landmarks():
+    """Synthetic face mesh (468 points on an ellipse-ish blob in the centre)"""
+    rng = np.random.default_rng(SEED)
+    angles = rng.uniform(0, 2 * np.pi, 468)
+    radius = np.sqrt(rng.uniform(0, 1, 468))
+    landmarks = np.zeros((468, 3), dtype=np.float32)
+    landmarks[:, 0] = 0.5 + 0.15 * radius * np.cos(angles)
+    landmarks[:, 1] = 0.5 + 0.2 * radius * np.sin(angles)
+    return landmarks
+
+
+def make_leaderboard():
+    """Leaderboard with full top-10 lists, never saved to disk"""
+    leaderboard = LeaderboardManager()
+    leaderboard.leaderboard = {
+        difficulty: [
+            {"name": f"Player {rank}", "score": 20 - rank, "date": "2024-01-01 12:00"}
+            for rank in range(10)
+        ]
+        for difficulty in ("easy", "medium", "hard")
+    }
+    return leaderboard
+
+
+def build_screens(ui_manager):
+    """Map screen name -> draw(i) callable, mirroring Expressify.run()"""
+    images = make_camera_images()
+    landmarks = make_landmarks()
+    leaderboard = make_leaderboard()
+
+    def camera_frame(i):
+        # New Frame per call, like the capture thread: no cached views
+        return Frame(images[i % len(images)], time.time(), i + 1)
+
+    def draw_game(i, landmarks=None, player_scores=None):
+        ui_manager.draw_game_with_debug(
+            camera_frame(i), "happy", i // 30, max(0.0, 20 - i / 30),
+            ("happy", "sad", "surprised", "neutral")[i // 15 % 4],
+            landmarks, player_scores,
+        )
+
+    return {
+        "menu": lambda i: ui_manager.draw_menu(i // 60 % 3),
+        "name_input": lambda i: ui_manager.draw_name_input("PLAYER"[: i // 10 % 7]),
+        "difficulty": lambda i: ui_manager.draw_difficulty_selection(i // 60 % 3),
+        "game": draw_game,
+        "game_landmarks": lambda i: draw_game(i, landmarks=landmarks),
+        "game_party": lambda i: draw_game(i, player_scores={0: 3, 1: 5, 2: 1}),
+        "results": lambda i: ui_manager.draw_results(12, 20),
+        "leaderboard": lambda i: ui_manager.draw_leaderboard(
+            leaderboard, ("easy", "medium", "hard")[i // 60 % 3]
+        ),
+    }
+
+
+def time_screen(draw, frames):
+    """Frame times in ms (draw + flip) after a warm-up"""
+    for i in range(WARMUP_FRAMES):
+        draw(i)
+        pygame.display.flip()
+    times = []
+    for i in range(WARMUP_FRAMES, WARMUP_FRAMES + frames):
+        start = time.perf_counter()
+        draw(i)
+        pygame.display.flip()
+        times.append(time.perf_counter() - start)
+    return np.asarray(times) * 1000
+
+
+def trace_screen(draw, frames):
+    """
+    Python heap traffic per frame (tracemalloc)
+
+    Returns:
+        tuple: (mean KB allocated at peak per frame, KB retained after the run)
+
+    SDL pixel buffers are allocated outside the Python allocator and are not
+    counted; this tracks the Python objects a frame creates (rects, tuples,
+    temporary surfaces' wrappers, cache entries).
+    """
+    tracemalloc.start()
+    start_current, _ = tracemalloc.get_traced_memory()
+    peaks = []
+    for i in range(frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        draw(i)
+        pygame.display.flip()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    end_current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return np.mean(peaks) / 1024, (end_current - start_current) / 1024
+
+
+def check_baseline(results, baseline_path, tolerance):
+    """Compare p95 frame times against a saved baseline"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference and stats["p95_ms"] > reference["p95_ms"] * tolerance:
+            regressions.append(
+                f"{name}: p95 {stats['p95_ms']:.2f} ms vs baseline {reference['p95_ms']:.2f} ms"
+            )
+    return regressions
+
+
+def run_benchmark(frames, screens=None, baseline=None, save=None, tolerance=1.5):
+    """Render every screen headless and report frame time percentiles"""
+    random.seed(SEED)
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    # Imported after the display exists (UIManager grabs the display surface)
+    from ui import UIManager
+
+    ui_manager = UIManager(WIDTH, HEIGHT)
+    available = build_screens(ui_manager)
+    names = screens or list(available)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        print(f"❌ Unknown screen(s): {', '.join(unknown)} (choose from {', '.join(available)})")
+        return False
+
+    print(f"{WIDTH}x{HEIGHT}, {frames} frames per screen, SDL driver "
+          f"{pygame.display.get_driver()}")
+    print(f"{'screen':<15} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+          f"{'alloc KB/f':>11} {'retained KB':>12}")
+    results = {}
+    for name in names:
+        draw = available[name]
+        times = time_screen(draw, frames)
+        alloc_kb, retained_kb = trace_screen(draw, min(frames, 60))
+        results[name] = {
+            "p50_ms": float(np.percentile(times, 50)),
+            "p95_ms": float(np.percentile(times, 95)),
+            "p99_ms": float(np.percentile(times, 99)),
+            "max_ms": float(times.max()),
+            "alloc_kb_per_frame": float(alloc_kb),
+            "retained_kb": float(retained_kb),
+        }
+        stats = results[name]
+        print(f"{name:<15} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} "
+              f"{stats['p99_ms']:8.2f} {stats['max_ms']:8.2f} "
+              f"{alloc_kb:11.1f} {retained_kb:12.1f}")
+    pygame.quit()
+
+    if save:
+        with open(save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline saved to {save}")
+
+    if baseline:
+        regressions = check_baseline(results, baseline, tolerance)
+        if regressions:
+            for line in regressions:
+                print(f"❌ {line}")
+            return False
+        print(f"✅ No screen slower than {tolerance:.2f}x its baseline p95")
+        return True
+
+    slowest = max(results, key=lambda name: results[name]["p95_ms"])
+    print(f"✅ All screens rendered (slowest p95: {slowest}, "
+          f"{results[slowest]['p95_ms']:.2f} ms)")
+    return True
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Headless UI render benchmark")
+    parser.add_argument("--frames", type=int, default=300, help="Timed frames per screen")
+    parser.add_argument("--screen", action="append", help="Only run this screen (repeatable)")
+    parser.add_argument("--save", metavar="JSON", help="Write results as a baseline file")
+    parser.add_argument("--baseline", metavar="JSON", help="Fail if p95 regresses vs this file")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5,
+        help="Allowed p95 slowdown factor against the baseline",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(0 if run_benchmark(
+        args.frames, args.screen, args.baseline, args.save, args.tolerance
+    ) else 1)
@@ -0,0 +1,151 @@
+"""
+Camera Capture Module
+Reads camera frames on a background thread so the render loop never blocks
+"""
+
+import threading
+import time
+
+import cv2
+
+from frame import Frame
+from frame_profiler import profiler
+
+
+class CameraCapture:
+    """
+    Owns a cv2.VideoCapture and keeps the latest frames in a small ring buffer
+
+    The capture thread is the only writer: it fills the next slot and then
+    publishes it by bumping the sequence number. Readers only look at the slot
+    of the latest published sequence number, so no lock is needed on the hot
+    path (a single attribute assignment is atomic under the GIL).
+    """
+
+    def __init__(self, source=0, width=640, height=480, ring_size=4):
+        """
+        Initialize camera capture
+
+        Args:
+            source: Camera index or video path passed to cv2.VideoCapture
+            width: Requested frame width
+            height: Requested frame height
+            ring_size: Number of frame slots kept in the ring buffer
+        """
+        self.source = source
+        self.width = width
+        self.height = height
+        self.ring_size = max(2, ring_size)
+
+        self.cap = cv2.VideoCapture(source)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        # Ring buffer slots: Frame objects
+        self.slots = [None] * self.ring_size
+        self.seq = 0  # Sequence number of the latest published frame
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_dropped = 0  # Frames overwritten before read_latest() took them
+        self.read_failures = 0
+        self.last_read_seq = 0
+
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        """Start the background capture thread"""
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(
+            target=self._capture_loop, name="CameraCapture", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def _capture_loop(self):
+        """Continuously grab frames into the ring buffer"""
+        while self.running:
+            with profiler.span("capture"):
+                ret, frame = self.cap.read()
+            if not ret:
+                self.read_failures += 1
+                time.sleep(0.01)
+                continue
+
+            next_seq = self.seq + 1
+            self.slots[next_seq % self.ring_size] = Frame(frame, time.time(), next_seq)
+
+            # Previous frame was never picked up by a reader
+            if self.seq > self.last_read_seq:
+                self.frames_dropped += 1
+
+            self.frames_captured += 1
+            self.seq = next_seq
+
+    def read_latest(self):
+        """
+        Get the freshest frame without blocking
+
+        Returns:
+            Frame: Latest frame (with timestamp and seq) or None if no frame yet
+        """
+        seq = self.seq
+        if seq == 0:
+            return None
+
+        frame = self.slots[seq % self.ring_size]
+        self.last_read_seq = seq
+        return frame
+
+    def peek(self):
+        """
+        Get the freshest frame without marking it as read (for display)
+
+        Returns:
+            Frame: Latest frame or None if no frame yet
+        """
+        seq = self.seq
+        if seq == 0:
+            return None
+        return self.slots[seq % self.ring_size]
+
+    def read(self):
+        """
+        cv2.VideoCapture compatible read
+
+        Returns:
+            tuple: (ret, Frame) with the freshest available frame
+        """
+        frame = self.read_latest()
+        return frame is not None, frame
+
+    def get_frame_age(self):
+        """Get age of the latest frame in milliseconds (None if no frame yet)"""
+        seq = self.seq
+        if seq == 0:
+            return None
+        return (time.time() - self.slots[seq % self.ring_size].timestamp) * 1000
+
+    def get_stats(self):
+        """Get capture latency and drop counters"""
+        return {
+            "frame_age_ms": self.get_frame_age(),
+            "frames_captured": self.frames_captured,
+            "frames_dropped": self.frames_dropped,
+            "read_failures": self.read_failures,
+        }
+
+    def isOpened(self):
+        """Check whether the underlying camera is open"""
+        return self.cap.isOpened()
+
+    def release(self):
+        """Stop the capture thread and release the camera"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        self.cap.release()
@@ -0,0 +1,123 @@
+"""
+Expression Filter Module
+Temporal smoothing and hysteresis between face detection and game scoring
+"""
+
+from collections import deque
+
+from face_features import classify_features
+
+# Metrics smoothed by the EMA (the ones classify_features looks at)
+SMOOTHED_METRICS = ("mar", "smile", "eye_height", "eyebrow_height")
+
+
+class ExpressionFilter:
+    """
+    Turns noisy per-frame metrics into a stable expression decision
+
+    1. EMA over the raw metrics removes landmark jitter.
+    2. The smoothed metrics are classified into a vote.
+    3. The stable label only switches once a different label holds at least
+       `votes_required` of the last `vote_window` votes (hysteresis: a single
+       flickering frame can never change the decision).
+    """
+
+    def __init__(self, ema_alpha=0.5, vote_window=5, votes_required=3, debug_mode=False):
+        """
+        Initialize expression filter
+
+        Args:
+            ema_alpha: Weight of the newest metrics (1.0 = no smoothing)
+            vote_window: Number of recent votes considered (M)
+            votes_required: Votes needed to switch the stable label (N)
+            debug_mode: Print decision latency on every label switch
+        """
+        self.debug_mode = debug_mode
+        self.configure(ema_alpha, vote_window, votes_required)
+
+    def configure(self, ema_alpha=0.5, vote_window=5, votes_required=3):
+        """Set smoothing/voting windows and reset state"""
+        self.ema_alpha = min(1.0, max(0.0, ema_alpha))
+        self.vote_window = max(1, vote_window)
+        self.votes_required = min(self.vote_window, max(1, votes_required))
+        self.reset()
+
+    def spawn(self):
+        """Create a new filter with the same configuration (e.g. one per face)"""
+        return ExpressionFilter(
+            self.ema_alpha, self.vote_window, self.votes_required, self.debug_mode
+        )
+
+    def reset(self):
+        """Forget smoothed metrics, votes and latency history"""
+        self.smoothed = None
+        self.votes = deque(maxlen=self.vote_window)  # (label, frame_index, timestamp)
+        self.stable_label = "neutral"
+        self.frame_index = 0
+
+        # Decision latency: first vote for a label -> label becomes stable
+        self.latencies = deque(maxlen=100)  # (frames, ms)
+        self.switches = 0
+
+    def update(self, features, timestamp=None):
+        """
+        Feed one frame of metrics
+
+        Args:
+            features: compute_features() dict, or None when no face was found
+            timestamp: Capture time of the frame (seconds)
+
+        Returns:
+            str: Stable expression label
+        """
+        if features is None:
+            # No face: nothing to smooth, vote for the detector's default
+            self.smoothed = None
+            vote = "neutral"
+        else:
+            if self.smoothed is None:
+                self.smoothed = {name: features[name] for name in SMOOTHED_METRICS}
+            else:
+                alpha = self.ema_alpha
+                for name in SMOOTHED_METRICS:
+                    self.smoothed[name] += alpha * (features[name] - self.smoothed[name])
+            vote = classify_features(self.smoothed)
+
+        self.frame_index += 1
+        self.votes.append((vote, self.frame_index, timestamp))
+
+        if vote != self.stable_label:
+            matching = [entry for entry in self.votes if entry[0] == vote]
+            if len(matching) >= self.votes_required:
+                self._switch(vote, matching[0], timestamp)
+
+        return self.stable_label
+
+    def _switch(self, label, first_vote, timestamp):
+        """Make label the stable decision and record how long it took"""
+        _, first_index, first_timestamp = first_vote
+        latency_frames = self.frame_index - first_index
+        latency_ms = None
+        if timestamp is not None and first_timestamp is not None:
+            latency_ms = (timestamp - first_timestamp) * 1000
+
+        self.stable_label = label
+        self.switches += 1
+        self.latencies.append((latency_frames, latency_ms))
+
+        if self.debug_mode:
+            ms_text = f"{latency_ms:.0f} ms" if latency_ms is not None else "n/a"
+            print(f"Expression -> {label} after {latency_frames} frames ({ms_text})")
+
+    def get_stats(self):
+        """Get window configuration and average decision latency"""
+        frames = [f for f, _ in self.latencies]
+        ms = [m for _, m in self.latencies if m is not None]
+        return {
+            "ema_alpha": self.ema_alpha,
+            "vote_window": self.vote_window,
+            "votes_required": self.votes_required,
+            "switches": self.switches,
+            "decision_latency_frames": sum(frames) / len(frames) if frames else None,
+            "decision_latency_ms": sum(ms) / len(ms) if ms else None,
+        }
@@ -0,0 +1,34 @@
+"""
+Expression Registry
+Shared expression metadata used by game logic and UI
+"""
+
+# Expression keys in display order
+EXPRESSIONS = ["happy", "sad", "surprised", "neutral"]
+
+# Expression names in Indonesian (emoji + label)
+EXPRESSION_NAMES = {
+    "happy": "😊 SENYUM LEBAR!",
+    "sad": "😢 CEMBERUT SEDIH!",
+    "surprised": "😲 KAGET MAKSIMAL!",
+    "neutral": "😐 WAJAH DATAR!",
+}
+
+
+def get_expression_name(expression, default=""):
+    """Get display name for an expression key"""
+    return EXPRESSION_NAMES.get(expression, default)
+
+
+def split_expression_name(full_text):
+    """
+    Split a display name into its leading emoji and label
+
+    Returns:
+        tuple: (emoji or None, label text)
+    """
+    if " " in full_text:
+        possible_emoji, remainder = full_text.split(" ", 1)
+        if not possible_emoji.isascii():
+            return possible_emoji, remainder
+    return None, full_text
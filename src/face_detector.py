@@ -7,174 +7,448 @@ import cv2
 import mediapipe as mp
 import numpy as np
 
+from face_features import classify_features, compute_features, landmarks_to_array
+from face_tracker import FaceTracker
+from frame import Frame
+from frame_profiler import profiler
+
+# Detector profiles: face mesh settings traded against inference time.
+# Iris landmarks (refine_landmarks) are not used by the expression metrics.
+DETECTOR_PROFILES = {
+    "fast": {
+        "refine_landmarks": False,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.3,  # Re-detect less often
+        "input_width": 320,  # Downscale before inference (None = full frame)
+    },
+    "balanced": {
+        "refine_landmarks": False,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.5,
+        "input_width": None,
+    },
+    "accurate": {
+        "refine_landmarks": True,
+        "min_detection_confidence": 0.5,
+        "min_tracking_confidence": 0.5,
+        "input_width": None,
+    },
+}
+# "balanced" and "fast" label borderline sad/neutral faces differently
+# (about 87% agreement with "accurate" on the test clip), so they are opt-in
+DEFAULT_PROFILE = "accurate"
+
 
 class FaceDetector:
-    def __init__(self, debug_mode=False):
-        """Initialize MediaPipe Face Mesh"""
+    def __init__(self, debug_mode=False, profile=DEFAULT_PROFILE, max_faces=1):
+        """
+        Initialize MediaPipe Face Mesh
+
+        Args:
+            debug_mode: Print metrics for every analyzed frame
+            profile: Name of a DETECTOR_PROFILES entry
+            max_faces: Faces detected per frame (> 1 enables multi-face mode,
+                       see detect_faces)
+        """
+        if profile not in DETECTOR_PROFILES:
+            raise ValueError(
+                f"Unknown detector profile '{profile}' "
+                f"(choose from: {', '.join(DETECTOR_PROFILES)})"
+            )
+        self.profile = profile
+        self.profile_settings = DETECTOR_PROFILES[profile]
+        self.input_width = self.profile_settings["input_width"]
+        self.max_faces = max(1, max_faces)
+
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.drawing_spec = self.mp_drawing.DrawingSpec(thickness=1, circle_radius=1)
+        self.face_mesh = self._create_face_mesh()
 
         # Debug mode
         self.debug_mode = debug_mode
         
         # Store last detection metrics for debugging
         self.last_metrics = {}
-        
-        # Expression detection parameters
-        self.expressions = {
-            "happy": False,
-            "sad": False,
-            "surprised": False,
-            "neutral": True,
+        self.last_points = None  # (N, 3) landmarks of the last detect call
+                                 # ((faces, N, 3) in multi-face mode)
+        self.last_features = None  # compute_features() dict of the last detect call
+        self.last_result_reused = False  # Last call was answered by the motion gate
+
+        # Multi-face mode: stable IDs and last per-face results
+        self.face_tracker = FaceTracker(max_ids=self.max_faces)
+        self.last_faces = {}  # {face_id: expression}
+        self.last_face_features = {}  # {face_id: compute_features() dict}
+
+        # Region-of-interest tracking (crop around the previous face)
+        self.roi_enabled = False
+        self.roi_padding = 0.3  # Extra margin around the face box (fraction)
+        self.roi_reacquire_interval = 30  # Force a full-frame pass every N frames
+        self.roi_box = None  # (x0, y0, x1, y1) in pixels
+        self.roi_face_mesh = None  # Separate instance: tracking state is per input size
+        self.frames_since_full = 0
+        self.reset_roi_stats()
+
+        # Motion gate (reuse the last result while the image does not change)
+        self.motion_gate_enabled = False
+        self.motion_gate_threshold = 2.0  # Mean abs gray difference (0-255)
+        self.motion_gate_width = 64  # Width of the grayscale image compared
+        self.motion_gate_max_reuse = 15  # Force inference after N reuses in a row
+        self.gate_reference = None  # Small gray image of the last inferred frame
+        self.gate_region = None  # Face box in gate_reference coordinates
+        self.gate_reused = 0
+        self.reset_gate_stats()
+
+    def configure_roi(self, enabled=True, padding=0.3, reacquire_interval=30):
+        """
+        Configure region-of-interest tracking
+
+        Args:
+            enabled: Crop inference input around the last detected face
+                     (single-face mode only)
+            padding: Margin added around the face box, as a fraction of its size
+            reacquire_interval: Frames between forced full-frame passes
+        """
+        enabled = enabled and self.max_faces == 1
+        self.roi_enabled = enabled
+        self.roi_padding = padding
+        self.roi_reacquire_interval = reacquire_interval
+        self.roi_box = None
+        self.reset_roi_stats()
+
+        if enabled and self.roi_face_mesh is None:
+            self.roi_face_mesh = self._create_face_mesh()
+
+    def _create_face_mesh(self):
+        """Create a FaceMesh instance with the profile settings"""
+        settings = self.profile_settings
+        return self.mp_face_mesh.FaceMesh(
+            max_num_faces=self.max_faces,
+            refine_landmarks=settings["refine_landmarks"],
+            min_detection_confidence=settings["min_detection_confidence"],
+            min_tracking_confidence=settings["min_tracking_confidence"],
+        )
+
+    def reset_roi_stats(self):
+        """Reset ROI hit/re-acquisition counters"""
+        self.roi_attempts = 0
+        self.roi_hits = 0
+        self.roi_reacquisitions = 0  # Every full-frame pass while tracking is on
+        self.roi_lost = 0  # ...because the face was lost inside the crop
+        self.roi_edge_drops = 0  # ...because the face touched the crop edge
+        self.roi_periodic = 0  # ...because the re-acquire interval was reached
+
+    def get_roi_stats(self):
+        """Get ROI hit-rate and re-acquisition counters"""
+        return {
+            "roi_hit_rate": (
+                self.roi_hits / self.roi_attempts if self.roi_attempts else 0.0
+            ),
+            "roi_reacquisitions": self.roi_reacquisitions,
+            "roi_lost": self.roi_lost,
+            "roi_edge_drops": self.roi_edge_drops,
+            "roi_periodic": self.roi_periodic,
+        }
+
+    def configure_motion_gate(self, enabled=True, threshold=2.0, width=64, max_reuse=15):
+        """
+        Configure the pre-inference motion gate
+
+        Args:
+            enabled: Reuse the last result when the frame barely changed
+            threshold: Mean absolute grayscale difference (0-255) below which
+                       the frame counts as unchanged
+            width: Width of the downscaled grayscale image that is compared
+            max_reuse: Consecutive reuses before inference is forced
+        """
+        self.motion_gate_enabled = enabled
+        self.motion_gate_threshold = threshold
+        self.motion_gate_width = width
+        self.motion_gate_max_reuse = max_reuse
+        self.gate_reference = None
+        self.gate_region = None
+        self.gate_reused = 0
+        self.reset_gate_stats()
+
+    def reset_gate_stats(self):
+        """Reset motion gate hit/miss counters"""
+        self.gate_hits = 0
+        self.gate_misses = 0
+
+    def get_gate_stats(self):
+        """Get motion gate hit/miss counters"""
+        total = self.gate_hits + self.gate_misses
+        return {
+            "gate_hits": self.gate_hits,
+            "gate_misses": self.gate_misses,
+            "gate_hit_rate": self.gate_hits / total if total else 0.0,
         }
 
     def detect_expression(self, frame):
         """
-        Detect facial expression from frame
+        Detect facial expression from frame (Frame or BGR array)
         Returns: detected expression string
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
-
-        if not results.multi_face_landmarks:
+        features = self.detect_features(frame)
+        if features is None:
             return "neutral"
+        return classify_features(features)
 
-        face_landmarks = results.multi_face_landmarks[0]
+    def detect_features(self, frame):
+        """
+        Measure expression metrics on frame (Frame or BGR array)
+        Returns: compute_features() dict, or None when no face is found
+        """
+        frame = Frame.wrap(frame)
+
+        # Frame nearly identical to the last inferred one: reuse its result
+        if self._gate_hit(frame):
+            return self.last_features
 
-        # Draw landmarks on frame (turn it on for debugging)
-        # self.mp_drawing.draw_landmarks(
-        #     image=frame,
-        #     landmark_list=face_landmarks,
-        #     connections=self.mp_face_mesh.FACEMESH_TESSELATION,
-        #     landmark_drawing_spec=None,
-        #     connection_drawing_spec=self.mp_drawing.DrawingSpec(
-        #         color=(0, 255, 0), thickness=1
-        #     ),
-        # )
+        # RGB view is converted once per frame and shared with other consumers
+        points = self._find_face(frame)
+        self.last_points = points
+        if self.motion_gate_enabled:
+            self._update_gate_region(points)
+
+        if points is None:
+            self.last_features = None
+            return None
 
         # Analyze landmarks for expressions
-        expression = self._analyze_landmarks(face_landmarks, frame.shape)
+        with profiler.span("features"):
+            self.last_features = self._analyze_landmarks(points, frame.shape)
+        return self.last_features
+
+    def detect_faces(self, frame):
+        """
+        Detect the expression of every face in frame (multi-face mode)
+
+        Features of all faces are computed in one batched call; faces keep
+        their ID across frames (see FaceTracker).
+
+        Returns:
+            dict: {face_id: expression}, ordered by face ID
+        """
+        frame = Frame.wrap(frame)
+        if self._gate_hit(frame):
+            return self.last_faces
+
+        with profiler.span("color_convert"):
+            rgb = self._inference_rgb(frame)
+        with profiler.span("face_mesh"):
+            results = self.face_mesh.process(rgb)
+        landmark_lists = results.multi_face_landmarks or []
+        points = self._stack_faces(landmark_lists)
+
+        self.last_points = points
+        if self.motion_gate_enabled:
+            self._update_gate_region(None if points is None else points.reshape(-1, 3))
+
+        if points is None:
+            self.face_tracker.update(np.empty((0, 2)), np.empty(0))
+            self.last_faces = {}
+            self.last_face_features = {}
+            return self.last_faces
+
+        h, w = frame.shape[:2]
+        with profiler.span("features"):
+            features = compute_features(points, frame.shape)
+            expressions = classify_features(features)
+        centroids = points[..., :2].mean(axis=1) * (w, h)
+        face_ids = self.face_tracker.update(centroids, features["interocular_px"])
+
+        order = np.argsort(face_ids)
+        self.last_faces = {face_ids[i]: str(expressions[i]) for i in order}
+        self.last_face_features = {
+            face_ids[i]: {name: float(values[i]) for name, values in features.items()}
+            for i in order
+        }
+        if self.debug_mode:
+            print(f"Faces: {self.last_faces}")
+        return self.last_faces
 
-        return expression
+    def _stack_faces(self, landmark_lists):
+        """Stack landmark lists into one (faces, N, 3) array (None when empty)"""
+        if not landmark_lists:
+            return None
+        return np.stack([landmarks_to_array(lms) for lms in landmark_lists])
 
-    def _analyze_landmarks(self, landmarks, image_shape):
+    def _inference_rgb(self, frame):
+        """RGB input at the profile's inference resolution"""
+        # Landmarks are normalized and metrics resolution independent
+        if self.input_width:
+            return frame.downscaled_rgb(self.input_width)
+        return frame.rgb
+
+    def _gate_hit(self, frame):
+        """
+        Run the motion gate on frame
+        Returns: True when the last result can be reused
+        """
+        if not self.motion_gate_enabled:
+            self.last_result_reused = False
+            return False
+
+        small = frame.small_gray(self.motion_gate_width)
+        if self._gate_unchanged(small):
+            self.gate_hits += 1
+            self.gate_reused += 1
+            self.last_result_reused = True
+            return True
+
+        self.gate_misses += 1
+        self.gate_reused = 0
+        self.gate_reference = small
+        self.last_result_reused = False
+        return False
+
+    def _gate_unchanged(self, small):
+        """Check whether small gray frame matches the last inferred one"""
+        reference = self.gate_reference
+        if (
+            reference is None
+            or reference.shape != small.shape
+            or self.gate_reused >= self.motion_gate_max_reuse
+        ):
+            return False
+
+        # Compare the face region when known: expression changes are small
+        # relative to the whole frame
+        region = self.gate_region if self.gate_region else (slice(None), slice(None))
+        diff = cv2.absdiff(small[region], reference[region])
+        return cv2.mean(diff)[0] < self.motion_gate_threshold
+
+    def _update_gate_region(self, points):
+        """Store the face box (in gate image coordinates) for the next comparison"""
+        if points is None:
+            self.gate_region = None
+            return
+        h, w = self.gate_reference.shape[:2]
+        x0, y0 = np.floor(points[:, :2].min(axis=0) * (w, h)).astype(int)
+        x1, y1 = np.ceil(points[:, :2].max(axis=0) * (w, h)).astype(int)
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(w, x1), min(h, y1)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self.gate_region = None
+            return
+        self.gate_region = (slice(y0, y1), slice(x0, x1))
+
+    def _find_face(self, frame):
         """
-        Analyze face landmarks to determine expression
-        Using face landmark positions to detect:
+        Run face mesh, on the ROI crop when tracking and on the full frame otherwise
+        Returns: (478, 3) landmark array in full-frame normalized coordinates (or None);
+                 468 rows when the profile skips iris refinement
+        """
+        with profiler.span("color_convert"):
+            rgb = self._inference_rgb(frame)
+        h, w = rgb.shape[:2]
+
+        use_roi = (
+            self.roi_enabled
+            and self.roi_box is not None
+            and self.frames_since_full < self.roi_reacquire_interval
+        )
+
+        if use_roi:
+            self.roi_attempts += 1
+            x0, y0, x1, y1 = self.roi_box
+            crop = np.ascontiguousarray(rgb[y0:y1, x0:x1])
+            with profiler.span("face_mesh"):
+                results = self.roi_face_mesh.process(crop)
+
+            if results.multi_face_landmarks:
+                self.roi_hits += 1
+                self.frames_since_full += 1
+                points = landmarks_to_array(results.multi_face_landmarks[0])
+                self._crop_to_frame_coords(points, self.roi_box, w, h)
+                self._update_roi(points, w, h, crop_box=self.roi_box)
+                return points
+
+            # Lost the face inside the crop: re-acquire on the full frame
+            self.roi_lost += 1
+        elif self.roi_enabled and self.roi_box is not None:
+            self.roi_periodic += 1
+
+        if self.roi_enabled:
+            self.roi_reacquisitions += 1
+        with profiler.span("face_mesh"):
+            results = self.face_mesh.process(rgb)
+        self.frames_since_full = 0
+
+        if not results.multi_face_landmarks:
+            self.roi_box = None
+            return None
+
+        points = landmarks_to_array(results.multi_face_landmarks[0])
+        if self.roi_enabled:
+            self._update_roi(points, w, h)
+        return points
+
+    def _crop_to_frame_coords(self, points, box, frame_w, frame_h):
+        """Convert points normalized to the crop into full-frame coordinates (in place)"""
+        x0, y0, x1, y1 = box
+        crop_w = x1 - x0
+        crop_h = y1 - y0
+        points[:, 0] = (x0 + points[:, 0] * crop_w) / frame_w
+        points[:, 1] = (y0 + points[:, 1] * crop_h) / frame_h
+        points[:, 2] *= crop_w / frame_w
+
+    def _update_roi(self, points, frame_w, frame_h, crop_box=None):
+        """Compute the next ROI box from the current landmark points"""
+        fx0, fy0 = points[:, :2].min(axis=0) * (frame_w, frame_h)
+        fx1, fy1 = points[:, :2].max(axis=0) * (frame_w, frame_h)
+
+        # Face touching the crop edge means tracking is unreliable
+        if crop_box is not None:
+            cx0, cy0, cx1, cy1 = crop_box
+            margin = 2
+            if (fx0 <= cx0 + margin or fy0 <= cy0 + margin
+                    or fx1 >= cx1 - margin or fy1 >= cy1 - margin):
+                self.roi_edge_drops += 1
+                self.roi_box = None
+                return
+
+        pad_x = (fx1 - fx0) * self.roi_padding
+        pad_y = (fy1 - fy0) * self.roi_padding
+        x0 = max(0, int(fx0 - pad_x))
+        y0 = max(0, int(fy0 - pad_y))
+        x1 = min(frame_w, int(fx1 + pad_x))
+        y1 = min(frame_h, int(fy1 + pad_y))
+
+        # Degenerate box: fall back to full-frame detection
+        if x1 - x0 < 32 or y1 - y0 < 32:
+            self.roi_box = None
+            return
+
+        self.roi_box = (x0, y0, x1, y1)
+
+    def _analyze_landmarks(self, points, image_shape):
+        """
+        Measure the face landmark metrics used to determine expression
+        (see classify_features) to detect:
         - Happy: mouth corners up, slight mouth opening
         - Sad: mouth corners down, eyebrows down
         - Surprised: mouth wide open, eyebrows up, eyes wide
         - Neutral: default state
         """
-        h, w = image_shape[:2]
-
-        # Key landmark points (MediaPipe Face Mesh indices)
-        # Mouth corners: 61 (left), 291 (right)
-        # Upper lip center: 13
-        # Lower lip center: 14
-        # Mouth top: 0
-        # Mouth bottom: 17
-        # Left eyebrow inner: 70, outer: 63
-        # Right eyebrow inner: 300, outer: 293
-        # Left eye top: 159, bottom: 145
-        # Right eye top: 386, bottom: 374
-        # Nose tip: 4
-
-        # Mouth landmarks
-        mouth_left = landmarks.landmark[61]
-        mouth_right = landmarks.landmark[291]
-        upper_lip = landmarks.landmark[13]
-        lower_lip = landmarks.landmark[14]
-        mouth_top = landmarks.landmark[0]
-        mouth_bottom = landmarks.landmark[17]
-        
-        # Eyebrow landmarks
-        left_eyebrow_inner = landmarks.landmark[70]
-        left_eyebrow_outer = landmarks.landmark[63]
-        right_eyebrow_inner = landmarks.landmark[300]
-        right_eyebrow_outer = landmarks.landmark[293]
-        
-        # Eye landmarks
-        left_eye_top = landmarks.landmark[159]
-        left_eye_bottom = landmarks.landmark[145]
-        right_eye_top = landmarks.landmark[386]
-        right_eye_bottom = landmarks.landmark[374]
-        
-        # Nose (reference point)
-        nose_tip = landmarks.landmark[4]
+        features = compute_features(points, image_shape)
 
-        # Calculate metrics
-        
-        # 1. Mouth Aspect Ratio (MAR) - for mouth opening
-        mouth_height = abs(lower_lip.y - upper_lip.y) * h
-        mouth_width = abs(mouth_right.x - mouth_left.x) * w
-        mar = mouth_height / (mouth_width + 1e-6)
-        
-        # 2. Mouth corner position relative to center
-        mouth_center_y = (upper_lip.y + lower_lip.y) / 2
-        left_corner_diff = mouth_left.y - mouth_center_y
-        right_corner_diff = mouth_right.y - mouth_center_y
-        mouth_smile = -(left_corner_diff + right_corner_diff) / 2  # Negative = smile
-        
-        # 3. Eye Aspect Ratio (EAR) - for eye opening
-        left_eye_height = abs(left_eye_top.y - left_eye_bottom.y) * h
-        right_eye_height = abs(right_eye_top.y - right_eye_bottom.y) * h
-        avg_eye_height = (left_eye_height + right_eye_height) / 2
-        
-        # 4. Eyebrow position relative to eyes
-        left_eyebrow_height = (left_eye_top.y - left_eyebrow_inner.y) * h
-        right_eyebrow_height = (right_eye_top.y - right_eyebrow_inner.y) * h
-        avg_eyebrow_height = (left_eyebrow_height + right_eyebrow_height) / 2
-        
         # Store metrics for debugging/UI display
-        self.last_metrics = {
-            'mar': mar,
-            'smile': mouth_smile,
-            'eye_height': avg_eye_height,
-            'eyebrow_height': avg_eyebrow_height,
-            'mouth_height': mouth_height,
-        }
-        
+        self.last_metrics = features
+
         # Debug info
         if self.debug_mode:
-            print(f"MAR: {mar:.3f}, Smile: {mouth_smile:.4f}, Eye: {avg_eye_height:.1f}, Brow: {avg_eyebrow_height:.1f}")
-        
-        # Expression detection with improved thresholds
-        # Adjust these values to fine-tune detection sensitivity
-        
-        # SURPRISED: Mouth wide open + eyebrows raised + eyes wide
-        # Increase MAR (0.4 -> 0.5) untuk lebih strict
-        # Increase eyebrow (15 -> 18) untuk butuh alis lebih naik
-        if mar > 0.45 and avg_eyebrow_height > 16 and avg_eye_height > 9:
-            return "surprised"
-        
-        # HAPPY: Mouth corners up (smile) + moderate mouth opening
-        # Increase smile (0.003 -> 0.004) untuk butuh senyum lebih jelas
-        # Increase MAR (0.15 -> 0.18) untuk butuh mulut lebih terbuka
-        elif mouth_smile > 0.004 and mar > 0.18:
-            return "happy"
-        
-        # SAD: Mouth corners down + eyebrows slightly down
-        # Decrease smile (-0.002 -> -0.003) untuk butuh cemberut lebih jelas
-        # Keep eyebrow threshold sama
-        elif mouth_smile < -0.003 and avg_eyebrow_height < 12:
-            return "sad"
-        
-        # NEUTRAL: Default state
-        else:
-            return "neutral"
+            print(f"MAR: {features['mar']:.3f}, Smile: {features['smile']:.4f}, Eye: {features['eye_height']:.3f}, Brow: {features['eyebrow_height']:.3f}, IOD: {features['interocular_px']:.1f}px")
+
+        return features
     
     def get_last_metrics(self):
         """Get last detection metrics for debugging"""
-        return self.last_metrics
+        metrics = self.last_metrics
+        if self.roi_enabled:
+            metrics = {**metrics, **self.get_roi_stats()}
+        if self.motion_gate_enabled:
+            metrics = {**metrics, **self.get_gate_stats()}
+        return metrics
     
     def get_expression_tips(self, target_expression):
         """Get tips for user on how to make each expression"""
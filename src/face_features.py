@@ -0,0 +1,280 @@
+"""
+Face Features Module
+Vectorized expression metrics from MediaPipe Face Mesh landmarks
+
+All functions accept a single face (478, 3) or a batch (N, 478, 3) of
+normalized landmark points, so the same code drives live play and offline
+evaluation. Without refine_landmarks Face Mesh returns 468 points; only the
+iris points are missing, which the metrics do not use.
+"""
+
+import math
+
+import numpy as np
+
+# Key landmark points (MediaPipe Face Mesh indices), gathered in one indexing step
+FEATURE_LANDMARKS = np.array([
+    61, 291,  # Mouth corners: left, right
+    13, 14,  # Upper lip center, lower lip center
+    159, 386,  # Eye tops: left, right
+    145, 374,  # Eye bottoms: left, right
+    70, 300,  # Eyebrows inner: left, right
+    33, 263,  # Eye outer corners: left, right (inter-ocular distance)
+])
+
+# Positions inside FEATURE_LANDMARKS
+MOUTH_CORNERS = slice(0, 2)
+UPPER_LIP = 2
+LOWER_LIP = 3
+EYE_TOPS = slice(4, 6)
+EYE_BOTTOMS = slice(6, 8)
+EYEBROWS_INNER = slice(8, 10)
+EYE_OUTER_CORNERS = slice(10, 12)
+
+# Distances are normalized by the inter-ocular distance (IOD) so thresholds do
+# not depend on capture resolution, ROI crops or downscaled inference input.
+#
+# The original thresholds were tuned in pixels on 640x480 captures with the
+# player at kiosk distance, where the outer-eye-corner distance is about
+# REFERENCE_INTEROCULAR_PX. The calibration table maps each old threshold to
+# its normalized value: pixel / reference IOD (smile was measured as a
+# fraction of image height, so it is first converted to pixels).
+REFERENCE_INTEROCULAR_PX = 80.0
+REFERENCE_IMAGE_HEIGHT = 480
+
+
+def calibrate_threshold(old_value, unit="px", reference_iod=REFERENCE_INTEROCULAR_PX,
+                        reference_height=REFERENCE_IMAGE_HEIGHT):
+    """
+    Convert a legacy threshold to a fraction of the inter-ocular distance
+
+    Args:
+        old_value: Threshold in the legacy unit
+        unit: "px" (pixels) or "height" (fraction of image height)
+        reference_iod: Inter-ocular distance in pixels in the tuning setup
+        reference_height: Image height of the tuning setup
+    """
+    if unit == "height":
+        old_value = old_value * reference_height
+    return old_value / reference_iod
+
+
+# name: (legacy value, legacy unit, normalized value)
+THRESHOLD_CALIBRATION = {
+    name: (value, unit, calibrate_threshold(value, unit))
+    for name, (value, unit) in {
+        "surprised_eyebrow": (16, "px"),
+        "surprised_eye": (9, "px"),
+        "happy_smile": (0.004, "height"),
+        "sad_smile": (-0.003, "height"),
+        "sad_eyebrow": (12, "px"),
+    }.items()
+}
+
+# Expression thresholds (distances in inter-ocular units, MAR is a ratio)
+# Adjust these values to fine-tune detection sensitivity
+SURPRISED_MAR = 0.45  # Increase MAR (0.4 -> 0.5) untuk lebih strict
+SURPRISED_EYEBROW = THRESHOLD_CALIBRATION["surprised_eyebrow"][2]  # 16 px
+SURPRISED_EYE = THRESHOLD_CALIBRATION["surprised_eye"][2]  # 9 px
+HAPPY_SMILE = THRESHOLD_CALIBRATION["happy_smile"][2]  # 0.004 x height
+HAPPY_MAR = 0.18  # Increase MAR (0.15 -> 0.18) untuk butuh mulut lebih terbuka
+SAD_SMILE = THRESHOLD_CALIBRATION["sad_smile"][2]  # -0.003 x height
+SAD_EYEBROW = THRESHOLD_CALIBRATION["sad_eyebrow"][2]  # 12 px
+
+# Serialized NormalizedLandmark with x, y, z set: 17 bytes per landmark
+_LANDMARK_RECORD = np.dtype([
+    ("tag", "u1"), ("length", "u1"),
+    ("x_tag", "u1"), ("x", "<f4"),
+    ("y_tag", "u1"), ("y", "<f4"),
+    ("z_tag", "u1"), ("z", "<f4"),
+])
+
+
+def landmarks_to_array(landmark_list):
+    """
+    Convert a MediaPipe NormalizedLandmarkList to a (N, 3) float array
+
+    Parses the serialized protobuf in one NumPy call when every landmark
+    carries exactly x, y and z; otherwise falls back to attribute access.
+    """
+    data = landmark_list.SerializeToString()
+    record_size = _LANDMARK_RECORD.itemsize
+    count = len(data) // record_size
+    if (
+        len(data) == count * record_size
+        and data[0::record_size] == b"\x0a" * count
+        and data[1::record_size] == b"\x0f" * count
+        and data[2::record_size] == b"\x0d" * count
+        and data[7::record_size] == b"\x15" * count
+        and data[12::record_size] == b"\x1d" * count
+    ):
+        records = np.frombuffer(data, dtype=_LANDMARK_RECORD)
+        points = np.empty((count, 3), dtype=np.float64)
+        points[:, 0] = records["x"]
+        points[:, 1] = records["y"]
+        points[:, 2] = records["z"]
+        return points
+
+    return np.array(
+        [(lm.x, lm.y, lm.z) for lm in landmark_list.landmark], dtype=np.float64
+    )
+
+
+def interocular_distance(points, image_shape):
+    """
+    Distance between the outer eye corners in pixels
+
+    Args:
+        points: (478, 3) or (N, 478, 3) normalized landmarks
+        image_shape: Shape of the analyzed image (h, w, ...)
+    """
+    h, w = image_shape[:2]
+    corners = np.asarray(points)[..., FEATURE_LANDMARKS[EYE_OUTER_CORNERS], :2]
+    delta = (corners[..., 1, :] - corners[..., 0, :]) * (w, h)
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def compute_features(points, image_shape):
+    """
+    Compute expression metrics for one face or a batch of faces
+
+    Args:
+        points: (478, 3) or (N, 478, 3) normalized landmarks
+        image_shape: Shape of the analyzed image (h, w, ...)
+
+    Returns:
+        dict: mar, smile, eye_height, eyebrow_height, mouth_height (all but
+              mar in inter-ocular units) and interocular_px
+              (floats for a single face, (N,) arrays for a batch)
+    """
+    h, w = image_shape[:2]
+    points = np.asarray(points)
+    if points.ndim == 2:
+        return _single_face_features(points, w, h)
+
+    selected = points[..., FEATURE_LANDMARKS, :2] * (w, h)  # Pixel coordinates
+    xs = selected[..., 0]
+    ys = selected[..., 1]
+
+    # Inter-ocular distance (outer eye corners) as the length unit
+    corners = selected[..., EYE_OUTER_CORNERS, :]
+    delta = corners[..., 1, :] - corners[..., 0, :]
+    iod_px = np.hypot(delta[..., 0], delta[..., 1])
+    iod = iod_px + 1e-6
+
+    # 1. Mouth Aspect Ratio (MAR) - for mouth opening
+    upper_lip = ys[..., UPPER_LIP]
+    lower_lip = ys[..., LOWER_LIP]
+    corners_x = xs[..., MOUTH_CORNERS]
+    mouth_height = np.abs(lower_lip - upper_lip)
+    mouth_width = np.abs(corners_x[..., 1] - corners_x[..., 0])
+    mar = mouth_height / (mouth_width + 1e-6)
+
+    # 2. Mouth corner position relative to center (positive = smile)
+    smile = (upper_lip + lower_lip) / 2 - ys[..., MOUTH_CORNERS].mean(axis=-1)
+
+    # 3. Eye opening
+    eye_tops = ys[..., EYE_TOPS]
+    eye_height = np.abs(eye_tops - ys[..., EYE_BOTTOMS]).mean(axis=-1)
+
+    # 4. Eyebrow position relative to eyes
+    eyebrow_height = (eye_tops - ys[..., EYEBROWS_INNER]).mean(axis=-1)
+
+    features = {
+        "mar": mar,
+        "smile": smile / iod,
+        "eye_height": eye_height / iod,
+        "eyebrow_height": eyebrow_height / iod,
+        "mouth_height": mouth_height / iod,
+        "interocular_px": iod_px,
+    }
+    return features
+
+
+def _single_face_features(points, w, h):
+    """
+    compute_features() for one (478, 3) face with plain float math
+
+    The live game analyzes one face per frame; on 12 points NumPy's per-call
+    overhead costs more than the arithmetic. Same formulas as the batched
+    path; values agree up to float rounding.
+    """
+    (
+        (mouth_left_x, mouth_left_y), (mouth_right_x, mouth_right_y),
+        (_, upper_lip), (_, lower_lip),
+        (_, left_eye_top), (_, right_eye_top),
+        (_, left_eye_bottom), (_, right_eye_bottom),
+        (_, left_brow), (_, right_brow),
+        (left_corner_x, left_corner_y), (right_corner_x, right_corner_y),
+    ) = points[FEATURE_LANDMARKS, :2].tolist()
+
+    # Pixel coordinates
+    mouth_left_x *= w
+    mouth_right_x *= w
+    mouth_left_y *= h
+    mouth_right_y *= h
+    upper_lip *= h
+    lower_lip *= h
+    left_eye_top *= h
+    right_eye_top *= h
+
+    iod_px = math.hypot((right_corner_x - left_corner_x) * w, (right_corner_y - left_corner_y) * h)
+    iod = iod_px + 1e-6
+
+    mouth_height = abs(lower_lip - upper_lip)
+    mar = mouth_height / (abs(mouth_right_x - mouth_left_x) + 1e-6)
+    smile = (upper_lip + lower_lip) / 2 - (mouth_left_y + mouth_right_y) / 2
+    eye_height = (
+        abs(left_eye_top - left_eye_bottom * h) + abs(right_eye_top - right_eye_bottom * h)
+    ) / 2
+    eyebrow_height = (
+        (left_eye_top - left_brow * h) + (right_eye_top - right_brow * h)
+    ) / 2
+
+    return {
+        "mar": mar,
+        "smile": smile / iod,
+        "eye_height": eye_height / iod,
+        "eyebrow_height": eyebrow_height / iod,
+        "mouth_height": mouth_height / iod,
+        "interocular_px": iod_px,
+    }
+
+
+def classify_features(features):
+    """
+    Map metrics to expressions
+
+    Returns:
+        str for a single face, (N,) array of str for a batch
+    """
+    mar = features["mar"]
+    smile = features["smile"]
+    eye = features["eye_height"]
+    eyebrow = features["eyebrow_height"]
+
+    # Single face: plain branching is much cheaper than np.select on scalars
+    if isinstance(mar, float):
+        if mar > SURPRISED_MAR and eyebrow > SURPRISED_EYEBROW and eye > SURPRISED_EYE:
+            return "surprised"
+        if smile > HAPPY_SMILE and mar > HAPPY_MAR:
+            return "happy"
+        if smile < SAD_SMILE and eyebrow < SAD_EYEBROW:
+            return "sad"
+        return "neutral"
+
+    mar = np.asarray(mar)
+    smile = np.asarray(smile)
+    eye = np.asarray(eye)
+    eyebrow = np.asarray(eyebrow)
+
+    # SURPRISED: Mouth wide open + eyebrows raised + eyes wide
+    surprised = (mar > SURPRISED_MAR) & (eyebrow > SURPRISED_EYEBROW) & (eye > SURPRISED_EYE)
+    # HAPPY: Mouth corners up (smile) + moderate mouth opening
+    happy = (smile > HAPPY_SMILE) & (mar > HAPPY_MAR)
+    # SAD: Mouth corners down + eyebrows slightly down
+    sad = (smile < SAD_SMILE) & (eyebrow < SAD_EYEBROW)
+
+    return np.select(
+        [surprised, happy, sad], ["surprised", "happy", "sad"], "neutral"
+    )
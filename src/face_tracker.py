@@ -0,0 +1,118 @@
+"""
+Face Tracker Module
+Keeps stable face IDs across frames by matching landmark centroids
+"""
+
+import numpy as np
+
+
+class FaceTracker:
+    """
+    Assigns persistent IDs to detected faces
+
+    Each frame the face centroids are matched greedily (closest pair first)
+    to the tracked centroids. A face further than `max_distance` inter-ocular
+    distances from every track gets the lowest free ID; tracks that go
+    unmatched for more than `max_missed` frames are dropped and their ID is
+    freed. With `max_ids` set, IDs stay within 1..max_ids: when all are held,
+    the track missing the longest gives up its ID. IDs that started a new
+    track in the last update (possibly reused from an earlier face) are listed
+    in `new_ids`, so per-face state keyed by ID can be reset.
+    """
+
+    def __init__(self, max_distance=1.5, max_missed=15, max_ids=None):
+        """
+        Initialize face tracker
+
+        Args:
+            max_distance: Largest centroid jump (in inter-ocular distances)
+                          still treated as the same face
+            max_missed: Frames a face may be missing before its ID is released
+            max_ids: Highest face ID handed out (None = unbounded)
+        """
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.max_ids = max_ids
+        self.reset()
+
+    def reset(self):
+        """Forget all tracks (IDs restart at 1)"""
+        self.track_ids = []
+        self.track_centroids = np.empty((0, 2))
+        self.track_missed = []
+        self.new_ids = []
+
+    def update(self, centroids, scales):
+        """
+        Match this frame's faces to existing tracks
+
+        Args:
+            centroids: (N, 2) face centroids in pixels
+            scales: (N,) inter-ocular distances in pixels (match tolerance)
+
+        Returns:
+            list: Face ID for each input face (same order as centroids)
+        """
+        centroids = np.asarray(centroids, dtype=np.float64).reshape(-1, 2)
+        face_ids = [None] * len(centroids)
+        matched_tracks = set()
+
+        if len(centroids) and len(self.track_ids):
+            # (faces, tracks) distance matrix in units of each face's IOD
+            distances = np.linalg.norm(
+                centroids[:, None, :] - self.track_centroids[None, :, :], axis=-1
+            ) / (np.asarray(scales, dtype=np.float64)[:, None] + 1e-6)
+
+            for flat in np.argsort(distances, axis=None):
+                face, track = np.unravel_index(flat, distances.shape)
+                if distances[face, track] > self.max_distance:
+                    break
+                if face_ids[face] is not None or track in matched_tracks:
+                    continue
+                face_ids[face] = self.track_ids[track]
+                matched_tracks.add(track)
+
+        # Carry over matched and recently missed tracks
+        ids, positions, missed = [], [], []
+        for track, track_id in enumerate(self.track_ids):
+            if track in matched_tracks:
+                continue
+            if self.track_missed[track] < self.max_missed:
+                ids.append(track_id)
+                positions.append(self.track_centroids[track])
+                missed.append(self.track_missed[track] + 1)
+
+        held = set(ids) | {face_id for face_id in face_ids if face_id is not None}
+        new_ids = []
+        for face, centroid in enumerate(centroids):
+            if face_ids[face] is None:
+                face_ids[face] = self._free_id(held, ids, positions, missed)
+                held.add(face_ids[face])
+                new_ids.append(face_ids[face])
+            ids.append(face_ids[face])
+            positions.append(centroid)
+            missed.append(0)
+
+        self.track_ids = ids
+        self.track_centroids = np.array(positions).reshape(-1, 2)
+        self.track_missed = missed
+        self.new_ids = new_ids
+        return face_ids
+
+    def _free_id(self, held, ids, positions, missed):
+        """Lowest unused ID; at max_ids, take the ID of the longest missing track"""
+        face_id = 1
+        while face_id in held:
+            face_id += 1
+        if self.max_ids is None or face_id <= self.max_ids:
+            return face_id
+
+        missing = [i for i in range(len(ids)) if missed[i] > 0]
+        if not missing:
+            return face_id  # More faces in this frame than max_ids
+        stalest = max(missing, key=missed.__getitem__)
+        face_id = ids.pop(stalest)
+        positions.pop(stalest)
+        missed.pop(stalest)
+        held.discard(face_id)
+        return face_id
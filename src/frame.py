@@ -0,0 +1,101 @@
+"""
+Frame Module
+Camera frame with lazily computed, cached derived views
+"""
+
+import threading
+
+import cv2
+
+
+class Frame:
+    """
+    A captured BGR frame shared by detection and display
+
+    Derived views (RGB, mirrored, downscaled, small grayscale) are computed on first access and
+    cached on the frame, so each conversion runs at most once per frame no
+    matter how many consumers (inference worker, UI) ask for it.
+    """
+
+    def __init__(self, bgr, timestamp=None, seq=0):
+        """
+        Initialize frame
+
+        Args:
+            bgr: OpenCV BGR image (numpy array)
+            timestamp: Capture time (time.time())
+            seq: Capture sequence number
+        """
+        self.bgr = bgr
+        self.timestamp = timestamp
+        self.seq = seq
+        self.views = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def wrap(cls, frame):
+        """Return frame as a Frame (plain arrays are wrapped)"""
+        if isinstance(frame, cls):
+            return frame
+        return cls(frame)
+
+    @property
+    def shape(self):
+        return self.bgr.shape
+
+    def _get_view(self, key, build):
+        """Get cached view, building it once under the frame lock"""
+        view = self.views.get(key)
+        if view is not None:
+            return view
+        with self.lock:
+            view = self.views.get(key)
+            if view is None:
+                view = build()
+                self.views[key] = view
+        return view
+
+    @property
+    def rgb(self):
+        """RGB view (for MediaPipe)"""
+        return self._get_view("rgb", lambda: cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB))
+
+    @property
+    def mirrored(self):
+        """Horizontally mirrored BGR view (for display)"""
+        return self._get_view("mirrored", lambda: cv2.flip(self.bgr, 1))
+
+    def downscaled_rgb(self, width):
+        """
+        RGB view downscaled to the given width (aspect ratio kept)
+
+        Args:
+            width: Target width; frames already this small are returned as-is
+        """
+        h, w = self.bgr.shape[:2]
+        if width >= w:
+            return self.rgb
+
+        height = max(1, int(round(h * width / w)))
+        rgb = self.rgb  # Built outside the frame lock (the lock is not reentrant)
+        return self._get_view(
+            ("rgb", width),
+            lambda: cv2.resize(rgb, (width, height), interpolation=cv2.INTER_AREA),
+        )
+
+    def small_gray(self, width):
+        """
+        Downscaled grayscale view (for cheap frame differencing)
+
+        Args:
+            width: Target width (aspect ratio kept)
+        """
+        h, w = self.bgr.shape[:2]
+        width = min(width, w)
+        height = max(1, int(round(h * width / w)))
+
+        def build():
+            small = cv2.resize(self.bgr, (width, height), interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        return self._get_view(("gray", width), build)
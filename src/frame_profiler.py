@@ -0,0 +1,142 @@
+"""
+Frame Profiler Module
+Per-stage timing spans with a rolling window, for tuning kiosks in the field
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+# Histogram bucket upper edges in ms (last bucket is open ended)
+HISTOGRAM_EDGES_MS = (1, 2, 4, 8, 16, 33, 66)
+
+
+class _NullSpan:
+    """Span used while profiling is off: entering and leaving does nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times one stage and records it on exit"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """
+    Collects stage durations from any thread
+
+    Usage:
+        with profiler.span("face_mesh"):
+            results = face_mesh.process(rgb)
+
+    While disabled, span() returns a shared no-op context manager, so
+    instrumented code only pays for one attribute check. Each stage keeps its
+    last `window` samples; stages that run several times per frame (or on the
+    inference thread) simply record one sample per call.
+    """
+
+    def __init__(self, window=120, enabled=False):
+        """
+        Initialize profiler
+
+        Args:
+            window: Samples kept per stage (rolling)
+            enabled: Start recording immediately
+        """
+        self.window = window
+        self.enabled = enabled
+        self.samples = {}  # {stage: deque of ms}
+
+    def enable(self, enabled=True):
+        """Turn recording on or off (samples are kept until reset)"""
+        self.enabled = enabled
+
+    def span(self, name):
+        """
+        Context manager timing one stage
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Context manager (no-op while disabled)
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        """Add one duration sample (seconds) for a stage"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples.setdefault(name, deque(maxlen=self.window))
+        samples.append(seconds * 1000)
+
+    def reset(self):
+        """Drop all samples"""
+        self.samples = {}
+
+    def get_stats(self):
+        """
+        Get rolling statistics per stage
+
+        Returns:
+            dict: {stage: {"count", "mean_ms", "p50_ms", "p95_ms", "max_ms"}}
+                  in the order stages were first seen
+        """
+        stats = {}
+        # list() copies atomically, other threads may append meanwhile
+        for name, samples in list(self.samples.items()):
+            values = np.array(list(samples))
+            if not len(values):
+                continue
+            stats[name] = {
+                "count": len(values),
+                "mean_ms": float(values.mean()),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p95_ms": float(np.percentile(values, 95)),
+                "max_ms": float(values.max()),
+            }
+        return stats
+
+    def histogram(self, name):
+        """
+        Get the rolling histogram of a stage
+
+        Returns:
+            list: Sample counts per bucket of HISTOGRAM_EDGES_MS, plus one
+                  bucket for everything slower than the last edge
+        """
+        samples = self.samples.get(name)
+        if not samples:
+            return [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        buckets = np.searchsorted(HISTOGRAM_EDGES_MS, list(samples), side="right")
+        return np.bincount(buckets, minlength=len(HISTOGRAM_EDGES_MS) + 1).tolist()
+
+
+# Shared by capture, inference and render code
+profiler = FrameProfiler()
@@ -0,0 +1,262 @@
+"""
+Frame Source Module
+Replays recorded sessions (video file or image directory) in place of a camera
+"""
+
+import os
+import threading
+import time
+
+import cv2
+
+from frame import Frame
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class ReplaySource:
+    """
+    Drop-in replacement for CameraCapture that plays back a recording
+
+    Same interface as CameraCapture (start, read_latest, peek, read,
+    get_stats, isOpened, release), so it can sit behind Expressify's self.cap
+    and feed the InferenceWorker without a webcam.
+
+    - realtime=True: frames are published at the recording's frame rate and
+      readers get the latest one, exactly like a live camera.
+    - realtime=False: max speed with back-pressure; the next frame is only
+      published once the current one was taken with read_latest(), so the
+      inference consumer gets every frame in order. Displays must use
+      peek(), which does not release the next frame.
+
+    Frame timestamps are media time (start time + index / fps), so time
+    based game rules see the recording's pace even at max speed.
+    """
+
+    def __init__(self, path, realtime=True, loop=False, fps=None, width=640, height=480):
+        """
+        Initialize replay source
+
+        Args:
+            path: Video file or directory of frame images (sorted by name)
+            realtime: Pace playback at fps (False = as fast as frames are read)
+            loop: Restart from the first frame at the end of the recording
+            fps: Playback rate (defaults to the video's rate, or 30)
+            width: Frames are resized to this width when needed
+            height: Frames are resized to this height when needed
+        """
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.width = width
+        self.height = height
+
+        self.image_paths = None
+        self.cap = None
+        if os.path.isdir(path):
+            self.image_paths = sorted(
+                os.path.join(path, name)
+                for name in os.listdir(path)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            )
+            source_fps = None
+        else:
+            self.cap = cv2.VideoCapture(path)
+            source_fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.fps = fps or source_fps or 30.0
+
+        self.index = 0  # Next frame index in the recording
+        self.index_offset = 0  # Frames played in previous loops
+        self.start_time = None
+        self.latest = None
+        self.seq = 0
+        self.last_read_seq = 0
+        self.finished = False
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_dropped = 0  # Published but never read (realtime only)
+        self.read_failures = 0
+
+        self.consumed = threading.Condition()
+        self.running = False
+        self.thread = None
+
+    def _next_image(self):
+        """Decode the next recorded frame (None at the end of the recording)"""
+        if self.image_paths is not None:
+            if self.index >= len(self.image_paths):
+                return None
+            image = cv2.imread(self.image_paths[self.index])
+            if image is None:
+                self.read_failures += 1
+        else:
+            ret, image = self.cap.read()
+            if not ret:
+                return None
+
+        if image is not None and image.shape[:2] != (self.height, self.width):
+            image = cv2.resize(image, (self.width, self.height), interpolation=cv2.INTER_AREA)
+        return image
+
+    def _rewind(self):
+        """Go back to the first frame"""
+        if self.cap is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def frames(self):
+        """
+        Iterate over the recording synchronously (no thread)
+
+        Yields:
+            Frame: Every recorded frame with media timestamps (clock() follows
+                   the frame that was yielded last)
+        """
+        if self.start_time is None:
+            self.start_time = time.time()
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return
+            self.latest = frame
+            yield frame
+
+    def _next_frame(self):
+        """Read the next frame as a Frame (handles looping and the end)"""
+        image = self._next_image()
+        while image is None:
+            if self.image_paths is not None and self.index < len(self.image_paths):
+                self.index += 1  # Unreadable image file: skip it
+                image = self._next_image()
+                continue
+            if not self.loop or self.index == 0:
+                self.finished = True
+                return None
+            self._rewind()
+            self.index_offset += self.index
+            self.index = 0
+            image = self._next_image()
+
+        media_index = self.index_offset + self.index
+        self.index += 1
+        self.seq += 1
+        self.frames_captured += 1
+        return Frame(image, self.start_time + media_index / self.fps, self.seq)
+
+    def start(self):
+        """Start background playback"""
+        if self.running:
+            return self
+        self.running = True
+        self.start_time = time.time()
+        self.thread = threading.Thread(
+            target=self._playback_loop, name="ReplaySource", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def _playback_loop(self):
+        """Publish frames at the recording's pace, or as soon as they are read"""
+        while self.running:
+            if not self.realtime:
+                # Back-pressure: wait until the current frame was picked up
+                with self.consumed:
+                    while self.running and self.seq > self.last_read_seq:
+                        self.consumed.wait(timeout=0.1)
+                if not self.running:
+                    break
+
+            frame = self._next_frame()
+            if frame is None:
+                break
+
+            if self.realtime:
+                delay = frame.timestamp - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                if self.latest is not None and self.latest.seq > self.last_read_seq:
+                    self.frames_dropped += 1
+
+            self.latest = frame
+
+    def read_latest(self):
+        """
+        Take the most recently published frame without blocking
+
+        Only the inference consumer should call this: at max speed it
+        acknowledges the frame and lets playback publish the next one.
+
+        Returns:
+            Frame: Latest frame or None before the first one
+        """
+        frame = self.latest
+        if frame is None:
+            return None
+        if frame.seq > self.last_read_seq:
+            with self.consumed:
+                self.last_read_seq = frame.seq
+                self.consumed.notify()
+        return frame
+
+    def peek(self):
+        """
+        Get the most recently published frame without acknowledging it (for display)
+
+        Returns:
+            Frame: Latest frame or None before the first one
+        """
+        return self.latest
+
+    def read(self):
+        """
+        cv2.VideoCapture compatible read
+
+        Returns:
+            tuple: (ret, Frame) with the freshest available frame
+        """
+        frame = self.read_latest()
+        return frame is not None, frame
+
+    def clock(self):
+        """Media time of the latest frame (for deterministic game timing)"""
+        frame = self.latest
+        if frame is None:
+            return self.start_time if self.start_time is not None else time.time()
+        return frame.timestamp
+
+    def get_frame_age(self):
+        """Get age of the latest frame in milliseconds (None if no frame yet)"""
+        frame = self.latest
+        if frame is None:
+            return None
+        return (time.time() - frame.timestamp) * 1000
+
+    def get_stats(self):
+        """Get playback counters"""
+        return {
+            "frame_age_ms": self.get_frame_age(),
+            "frames_captured": self.frames_captured,
+            "frames_dropped": self.frames_dropped,
+            "read_failures": self.read_failures,
+        }
+
+    def is_finished(self):
+        """Check whether a non-looping recording has played to the end"""
+        return self.finished
+
+    def isOpened(self):
+        """Check whether the recording could be opened"""
+        if self.image_paths is not None:
+            return bool(self.image_paths)
+        return self.cap.isOpened()
+
+    def release(self):
+        """Stop playback and close the recording"""
+        self.running = False
+        with self.consumed:
+            self.consumed.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        if self.cap is not None:
+            self.cap.release()
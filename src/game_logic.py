@@ -5,20 +5,27 @@ Handles game state, scoring, and expression challenges
 
 import random
 import time
+from expressions import EXPRESSION_NAMES
 from sound_manager import SoundManager
 
 class GameLogic:
-    def __init__(self, game_duration=20, difficulty="medium"):
-        """Initialize game logic"""
+    def __init__(self, game_duration=20, difficulty="medium", sound_manager=None, clock=time.time):
+        """
+        Initialize game logic (pass sound_manager to reuse loaded sounds)
+        clock: time source in seconds; a replayed recording passes its media
+        clock so timing follows the recording instead of the wall clock
+        """
+        self.clock = clock
         self.difficulty = difficulty
         self.game_duration = game_duration
         self.score = 0
         self.max_score = 0
+        self.player_scores = {}  # {face_id: score} in multi-player mode
         self.current_expression = None
         self.start_time = None
         self.last_expression_time = None
         self.expression_duration = 1  # seconds per expression
-        self.sound_manager = SoundManager()
+        self.sound_manager = sound_manager if sound_manager else SoundManager()
         
         # Difficulty settings
         self.difficulty_settings = {
@@ -26,32 +33,37 @@ class GameLogic:
                 "duration": 30,
                 "expressions": ["happy", "sad"],
                 "cooldown": 1.5,
-                "name": "MUDAH"
+                "name": "MUDAH",
+                # Slow-paced: small crop, rare full-frame checks
+                "roi": {"enabled": True, "padding": 0.3, "reacquire_interval": 45},
+                # Expression must hold 3 of the last 5 inferences to count
+                "filter": {"ema_alpha": 0.5, "vote_window": 5, "votes_required": 3},
             },
             "medium": {
                 "duration": 20,
                 "expressions": ["happy", "sad", "surprised", "neutral"],
                 "cooldown": 1.0,
-                "name": "SEDANG"
+                "name": "SEDANG",
+                "roi": {"enabled": True, "padding": 0.3, "reacquire_interval": 30},
+                "filter": {"ema_alpha": 0.5, "vote_window": 5, "votes_required": 3},
             },
             "hard": {
                 "duration": 15,
                 "expressions": ["happy", "sad", "surprised", "neutral"],
                 "cooldown": 0.5,
-                "name": "SULIT"
+                "name": "SULIT",
+                # Fast head movement: wider crop, frequent full-frame checks
+                "roi": {"enabled": True, "padding": 0.45, "reacquire_interval": 15},
+                # Short cooldown: react faster, accept a little more flicker
+                "filter": {"ema_alpha": 0.6, "vote_window": 3, "votes_required": 2},
             }
         }
         
         # Set difficulty
         self.set_difficulty(difficulty)
 
-        # Expression names in Indonesian
-        self.expression_names = {
-            "happy": "😊 SENYUM LEBAR!",
-            "sad": "😢 CEMBERUT SEDIH!",
-            "surprised": "😲 KAGET MAKSIMAL!",
-            "neutral": "😐 WAJAH DATAR!",
-        }
+        # Expression names in Indonesian (shared registry)
+        self.expression_names = EXPRESSION_NAMES
     
     def set_difficulty(self, difficulty):
         """Set game difficulty"""
@@ -60,6 +72,8 @@ class GameLogic:
         self.game_duration = settings["duration"]
         self.expressions = settings["expressions"]
         self.cooldown = settings["cooldown"]
+        self.roi_settings = settings["roi"]
+        self.filter_settings = settings["filter"]
     
     def get_next_expression(self):
         """Get a different expression from the current one"""
@@ -76,21 +90,28 @@ class GameLogic:
     def start_game(self):
         """Start a new game"""
         self.score = 0
-        self.start_time = time.time()
-        self.last_expression_time = time.time()
+        self.player_scores = {}
+        self.start_time = self.clock()
+        self.last_expression_time = self.clock()
         # Random expression based on difficulty
         self.current_expression = random.choice(self.expressions)
         self.max_score = int(self.game_duration / self.expression_duration)
 
-    def update(self, detected_expression):
+    def update(self, detected_expression, frame_timestamp=None):
         """
         Update game state based on detected expression
+        frame_timestamp: capture time of the frame the expression came from;
+        results from frames older than the current challenge are ignored
         Returns: True if score increased
         """
         if not self.start_time:
             return False
 
-        current_time = time.time()
+        # Stale result (captured before this challenge was shown)
+        if frame_timestamp is not None and frame_timestamp < self.last_expression_time:
+            return False
+
+        current_time = self.clock()
 
         # Check if current challenge matches detected expression
         if detected_expression == self.current_expression:
@@ -105,12 +126,50 @@ class GameLogic:
 
         return False
 
+    def update_players(self, face_expressions, frame_timestamp=None):
+        """
+        Update multi-player game state (one face per player)
+        face_expressions: {face_id: expression} for every face in the frame
+        Every face showing the current challenge scores a point; the
+        challenge then moves on as in single-player mode.
+        self.score tracks the leading player's score.
+        Returns: list of face IDs that scored
+        """
+        if not self.start_time:
+            return []
+
+        # Stale result (captured before this challenge was shown)
+        if frame_timestamp is not None and frame_timestamp < self.last_expression_time:
+            return []
+
+        for face_id in face_expressions:
+            self.player_scores.setdefault(face_id, 0)
+
+        current_time = self.clock()
+        if current_time - self.last_expression_time < self.cooldown:
+            return []
+
+        scorers = [
+            face_id for face_id, expression in face_expressions.items()
+            if expression == self.current_expression
+        ]
+        if not scorers:
+            return []
+
+        self.sound_manager.play("true_answer")
+        for face_id in scorers:
+            self.player_scores[face_id] += 1
+        self.score = max(self.player_scores.values())
+        self.last_expression_time = current_time
+        self.current_expression = self.get_next_expression()
+        return scorers
+
     def get_remaining_time(self):
         """Get remaining game time in seconds"""
         if not self.start_time:
             return self.game_duration
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock() - self.start_time
         remaining = max(0, self.game_duration - elapsed)
         return remaining
 
@@ -128,6 +187,7 @@ class GameLogic:
         """Reset game to initial state"""
         self.score = 0
         self.max_score = 0
+        self.player_scores = {}
         self.current_expression = None
         self.start_time = None
         self.last_expression_time = None
@@ -0,0 +1,163 @@
+"""
+Inference Rate Module
+Chooses how often face mesh runs based on its cost and on face motion
+"""
+
+import numpy as np
+
+from face_features import interocular_distance
+
+# Inference rates, from most to least expensive
+RATE_EVERY_FRAME = "every_frame"
+RATE_EVERY_OTHER = "every_other"
+RATE_ON_MOTION = "on_motion"
+
+RATE_NAMES = {
+    RATE_EVERY_FRAME: "every frame",
+    RATE_EVERY_OTHER: "every other frame",
+    RATE_ON_MOTION: "on motion only",
+}
+
+
+class InferenceRateController:
+    """
+    Decides per captured frame whether face mesh should run
+
+    - Moving face, inference within budget: every frame
+    - Moving face, inference over budget: every other frame
+    - Face static for a while: only a heartbeat inference every
+      `idle_interval` frames, back to full rate as soon as it moves
+    """
+
+    def __init__(self, latency_budget_ms=25.0, motion_threshold=0.02,
+                 static_inferences=10, idle_interval=6, cost_smoothing=0.2):
+        """
+        Initialize inference rate controller
+
+        Args:
+            latency_budget_ms: Inference time per frame we can afford
+            motion_threshold: Mean landmark motion per frame (in inter-ocular
+                              distances) above which the face counts as moving
+            static_inferences: Static inferences in a row before going idle
+            idle_interval: Frames between heartbeat inferences while idle
+            cost_smoothing: EMA weight of the newest inference time
+        """
+        self.latency_budget_ms = latency_budget_ms
+        self.motion_threshold = motion_threshold
+        self.static_inferences = static_inferences
+        self.idle_interval = max(2, idle_interval)
+        self.cost_smoothing = cost_smoothing
+
+        self.strides = {
+            RATE_EVERY_FRAME: 1,
+            RATE_EVERY_OTHER: 2,
+            RATE_ON_MOTION: self.idle_interval,
+        }
+        self.reset()
+
+    def reset(self):
+        """Return to full rate and clear motion history and counters"""
+        self.mode = RATE_EVERY_FRAME
+        self.last_inferred_seq = 0
+        self.last_points = None
+        self.static_count = 0
+        self.cost_ms = None  # EMA of inference time
+        self.motion = 0.0
+
+        # Counters
+        self.frames_inferred = 0
+        self.frames_gated = 0  # Frames not inferred because of the chosen rate
+        self.cpu_saved_ms = 0.0
+        self.mode_changes = 0
+
+    def should_infer(self, seq):
+        """
+        Check whether the captured frame with this sequence number needs inference
+
+        Args:
+            seq: Capture sequence number of the newest frame
+        """
+        if self.last_inferred_seq == 0:
+            return True
+        if seq - self.last_inferred_seq >= self.strides[self.mode]:
+            return True
+
+        self.frames_gated += 1
+        if self.cost_ms is not None:
+            self.cpu_saved_ms += self.cost_ms
+        return False
+
+    def record(self, seq, inference_time, points, image_shape, reused=False):
+        """
+        Update cost and motion estimates after an inference
+
+        Args:
+            seq: Sequence number of the inferred frame
+            inference_time: Inference duration in seconds
+            points: (478, 3) or (faces, 478, 3) normalized landmarks, or None
+                    when no face was found
+            image_shape: Shape of the inferred frame
+            reused: Result came from the detector's motion gate (not a real
+                    inference, so it does not count towards the cost estimate)
+        """
+        elapsed_ms = inference_time * 1000
+        if self.cost_ms is None:
+            self.cost_ms = elapsed_ms
+        elif not reused:
+            self.cost_ms += self.cost_smoothing * (elapsed_ms - self.cost_ms)
+
+        frames = max(1, seq - self.last_inferred_seq) if self.last_inferred_seq else 1
+        self.last_inferred_seq = seq
+        self.frames_inferred += 1
+
+        if (
+            points is None
+            or self.last_points is None
+            or points.shape != self.last_points.shape
+        ):
+            # Lost, new or extra face: treat as motion so it is re-acquired quickly
+            moving = True
+            self.motion = 0.0
+        else:
+            h, w = image_shape[:2]
+            delta = (points[..., :2] - self.last_points[..., :2]) * (w, h)
+            iod = np.mean(interocular_distance(points, image_shape)) + 1e-6
+            self.motion = float(np.hypot(delta[..., 0], delta[..., 1]).mean() / iod / frames)
+            moving = self.motion >= self.motion_threshold
+        self.last_points = points
+
+        if moving:
+            self.static_count = 0
+        else:
+            self.static_count += 1
+
+        self._set_mode(self._choose_mode(moving))
+
+    def _choose_mode(self, moving):
+        """Pick the cheapest rate that still follows the face"""
+        if not moving and self.static_count >= self.static_inferences:
+            return RATE_ON_MOTION
+        if self.cost_ms > self.latency_budget_ms:
+            return RATE_EVERY_OTHER
+        return RATE_EVERY_FRAME
+
+    def _set_mode(self, mode):
+        if mode != self.mode:
+            self.mode = mode
+            self.mode_changes += 1
+
+    def get_rate_name(self):
+        """Get human readable name of the current rate"""
+        return RATE_NAMES[self.mode]
+
+    def get_stats(self):
+        """Get chosen rate, inference cost and CPU time saved"""
+        return {
+            "inference_rate": self.mode,
+            "inference_cost_ms": self.cost_ms,
+            "landmark_motion": self.motion,
+            "frames_inferred": self.frames_inferred,
+            "frames_gated": self.frames_gated,
+            "cpu_saved_ms": self.cpu_saved_ms,
+            "rate_changes": self.mode_changes,
+        }
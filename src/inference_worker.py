@@ -0,0 +1,202 @@
+"""
+Inference Worker Module
+Runs face-mesh inference off the render thread with latest-frame-wins scheduling
+"""
+
+import threading
+import time
+
+from face_features import classify_features
+from frame_profiler import profiler
+
+
+class InferenceResult:
+    """Expression result tied to the camera frame it was computed from"""
+
+    def __init__(self, expression, frame_timestamp, frame_seq, inference_time,
+                 raw_expression=None, landmarks=None, faces=None):
+        self.expression = expression  # Stable (filtered) label
+        self.frame_timestamp = frame_timestamp
+        self.frame_seq = frame_seq
+        self.inference_time = inference_time  # seconds
+        self.raw_expression = raw_expression if raw_expression else expression
+        self.landmarks = landmarks  # (N, 3) normalized landmarks or None
+        self.faces = faces  # {face_id: stable expression} in multi-face mode
+
+
+class InferenceWorker:
+    """
+    Consumes frames from a CameraCapture and publishes the newest expression
+
+    The worker always picks the most recent captured frame, so any frames that
+    arrived while inference was running are skipped instead of queued up.
+    """
+
+    def __init__(self, face_detector, capture, expression_filter=None,
+                 rate_controller=None, idle_sleep=0.005):
+        """
+        Initialize inference worker
+
+        Args:
+            face_detector: FaceDetector instance (only used from the worker thread)
+            capture: CameraCapture instance providing read_latest()
+            expression_filter: Optional ExpressionFilter smoothing the raw labels
+            rate_controller: Optional InferenceRateController gating inference
+            idle_sleep: Seconds to wait when no new frame is available
+        """
+        self.face_detector = face_detector
+        self.capture = capture
+        self.expression_filter = expression_filter
+        self.rate_controller = rate_controller
+        self.idle_sleep = idle_sleep
+
+        self.latest_result = None
+        self.last_seq = 0
+        self.multi_face = face_detector.max_faces > 1
+        self.face_filters = {}  # {face_id: ExpressionFilter} in multi-face mode
+
+        # Counters
+        self.frames_processed = 0
+        self.frames_skipped = 0  # Captured frames never sent to inference
+
+        self.active = threading.Event()
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        """Start the worker thread (paused until resume() is called)"""
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(
+            target=self._worker_loop, name="InferenceWorker", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def resume(self):
+        """Start consuming frames (e.g. when gameplay begins)"""
+        self.latest_result = None
+        if self.expression_filter is not None:
+            self.expression_filter.reset()
+        if self.rate_controller is not None:
+            self.rate_controller.reset()
+        if self.multi_face:
+            # New game: player IDs start again from 1
+            self.face_filters = {}
+            self.face_detector.face_tracker.reset()
+        self.active.set()
+
+    def pause(self):
+        """Stop consuming frames without tearing down the thread"""
+        self.active.clear()
+
+    def _worker_loop(self):
+        """Run inference on the freshest frame, skipping stale ones"""
+        while self.running:
+            if not self.active.wait(timeout=0.1):
+                continue
+
+            frame = self.capture.read_latest()
+            if frame is None or frame.seq == self.last_seq:
+                time.sleep(self.idle_sleep)
+                continue
+
+            seq = frame.seq
+            if self.last_seq and seq > self.last_seq + 1:
+                self.frames_skipped += seq - self.last_seq - 1
+            self.last_seq = seq
+
+            # Static face or expensive inference: the controller may skip this frame
+            if self.rate_controller is not None and not self.rate_controller.should_infer(seq):
+                continue
+
+            start = time.perf_counter()
+            if self.multi_face:
+                faces = self.face_detector.detect_faces(frame)
+            else:
+                features = self.face_detector.detect_features(frame)
+            elapsed = time.perf_counter() - start
+
+            if self.rate_controller is not None:
+                self.rate_controller.record(
+                    seq, elapsed, self.face_detector.last_points, frame.shape,
+                    reused=self.face_detector.last_result_reused,
+                )
+
+            if self.multi_face:
+                with profiler.span("classify"):
+                    self.latest_result = self._faces_result(faces, frame, seq, elapsed)
+                self.frames_processed += 1
+                continue
+
+            with profiler.span("classify"):
+                raw_expression = classify_features(features) if features else "neutral"
+                expression = raw_expression
+                if self.expression_filter is not None:
+                    expression = self.expression_filter.update(features, frame.timestamp)
+
+            self.latest_result = InferenceResult(
+                expression, frame.timestamp, seq, elapsed, raw_expression,
+                self.face_detector.last_points,
+            )
+            self.frames_processed += 1
+
+    def _faces_result(self, faces, frame, seq, elapsed):
+        """Build a multi-face InferenceResult, smoothing every face separately"""
+        stable_faces = dict(faces)
+        if self.expression_filter is not None:
+            face_features = self.face_detector.last_face_features
+            # A new face may reuse an earlier player's ID: start its filter fresh
+            # (a motion-gate hit reuses the last faces without a tracker update)
+            if not self.face_detector.last_result_reused:
+                for face_id in self.face_detector.face_tracker.new_ids:
+                    self.face_filters.pop(face_id, None)
+            for face_id in faces:
+                face_filter = self.face_filters.get(face_id)
+                if face_filter is None:
+                    face_filter = self.expression_filter.spawn()
+                    self.face_filters[face_id] = face_filter
+                stable_faces[face_id] = face_filter.update(
+                    face_features.get(face_id), frame.timestamp
+                )
+
+            # Drop filters of faces whose ID was released by the tracker
+            tracked = set(self.face_detector.face_tracker.track_ids)
+            for face_id in list(self.face_filters):
+                if face_id not in tracked:
+                    del self.face_filters[face_id]
+
+        return InferenceResult(
+            next(iter(stable_faces.values()), "neutral"),
+            frame.timestamp, seq, elapsed,
+            raw_expression=next(iter(faces.values()), "neutral"),
+            landmarks=self.face_detector.last_points,
+            faces=stable_faces,
+        )
+
+    def get_latest(self):
+        """Get the most recent InferenceResult (None until the first one)"""
+        return self.latest_result
+
+    def get_stats(self):
+        """Get inference throughput counters"""
+        result = self.latest_result
+        stats = {
+            "frames_processed": self.frames_processed,
+            "frames_skipped": self.frames_skipped,
+            "inference_ms": result.inference_time * 1000 if result else None,
+        }
+        if self.expression_filter is not None:
+            stats.update(self.expression_filter.get_stats())
+        if self.rate_controller is not None:
+            stats.update(self.rate_controller.get_stats())
+        return stats
+
+    def stop(self):
+        """Stop the worker thread"""
+        self.running = False
+        self.active.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
@@ -1,9 +1,19 @@
+import argparse
 import cv2
+import multiprocessing
 import pygame
 import sys
 import os
-from face_detector import FaceDetector
+import time
+from camera_capture import CameraCapture
+from expression_filter import ExpressionFilter
+from inference_rate import InferenceRateController
+from face_detector import DEFAULT_PROFILE, DETECTOR_PROFILES, FaceDetector
+from frame_profiler import profiler
+from frame_source import ReplaySource
+from inference_worker import InferenceWorker
 from game_logic import GameLogic
+from station_pool import StationPool, parse_source
 from ui import UIManager
 from sound_manager import SoundManager
 from leaderboard_manager import LeaderboardManager
@@ -24,18 +34,37 @@ def get_base_path():
 BASE_PATH = get_base_path()
 
 # 💡 Inisialisasi mixer sebelum pygame.init()
-pygame.mixer.pre_init(44100, -16, 2, 512)
-pygame.init()
+# (station processes spawned by StationPool import this module too; they need
+# neither audio nor video)
+if multiprocessing.parent_process() is None:
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.init()
 
 
 class Expressify:
-    def __init__(self):
-        """Initialize game components"""
+    def __init__(self, detector_profile=DEFAULT_PROFILE, players=1, replay=None,
+                 replay_speed="realtime", timings=False, stations=None):
+        """
+        Initialize game components
+
+        Args:
+            detector_profile: Face detector profile ("fast", "balanced", "accurate")
+            players: Players in front of the camera (> 1 enables party mode)
+            replay: Video file or frame directory to play instead of the webcam
+            replay_speed: "realtime" (recording's frame rate) or "max"
+            timings: Record per-stage frame timings from the start (printed on exit)
+            stations: Camera indices / recordings, one player each; every station
+                      captures and infers in its own processes (StationPool)
+        """
 
         # Game settings
         self.WINDOW_WIDTH = 1280
         self.WINDOW_HEIGHT = 720
         self.is_fullscreen = False
+        self.show_landmarks = False  # Debug landmark overlay (F3)
+        self.show_timings = False  # Per-stage timing overlay (F2)
+        self.record_timings = timings
+        profiler.enable(timings)
 
         # Create window (windowed mode by default)
         self.screen = pygame.display.set_mode(
@@ -44,7 +73,7 @@ class Expressify:
         pygame.display.set_caption("Expressify - Face Expression Game")
 
         # Initialize components
-        self.face_detector = FaceDetector()
+        self.players = len(stations) if stations else players
         self.ui_manager = UIManager(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
         self.sound_manager = SoundManager()
         self.leaderboard = LeaderboardManager()
@@ -52,12 +81,22 @@ class Expressify:
         # Difficulty settings
         self.difficulty = "medium"
         self.difficulty_index = 1  # 0=easy, 1=medium, 2=hard
-        self.game_logic = GameLogic(difficulty=self.difficulty)
 
-        # Camera setup
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        # Multi-camera kiosk: capture + inference for every station run in
+        # worker processes; the game reads frames and results from shared memory
+        self.station_pool = None
+        self.frame_is_current = None  # Check for frames that view shared memory
+        if stations:
+            self.station_pool = StationPool(stations, profile=detector_profile).start()
+            self.frame_is_current = lambda frame: self.station_pool.is_frame_current(0, frame)
+            self.game_clock = time.time
+        else:
+            self.start_pipeline(detector_profile, replay, replay_speed)
+
+        self.game_logic = GameLogic(
+            difficulty=self.difficulty, sound_manager=self.sound_manager,
+            clock=self.game_clock,
+        )
 
         # Game states
         self.running = True
@@ -75,6 +114,35 @@ class Expressify:
         self.leaderboard_difficulty = "medium"
         self.leaderboard_difficulty_index = 1  # 0=easy, 1=medium, 2=hard
 
+    def start_pipeline(self, detector_profile, replay, replay_speed):
+        """Start the in-process camera capture and inference worker threads"""
+        self.face_detector = FaceDetector(profile=detector_profile, max_faces=self.players)
+        self.face_detector.configure_motion_gate()
+
+        # Camera setup (captured on a background thread). A replayed recording
+        # stands in for the webcam and drives game timing with its media clock.
+        if replay:
+            self.cap = ReplaySource(
+                replay, realtime=replay_speed == "realtime", loop=True,
+                width=640, height=480,
+            )
+            self.game_clock = self.cap.clock
+        else:
+            self.cap = CameraCapture(0, width=640, height=480)
+            self.game_clock = time.time
+        self.cap.start()
+
+        # Face-mesh inference runs on its own thread, fed by the capture ring;
+        # the filter turns per-frame labels into stable decisions for scoring
+        self.expression_filter = ExpressionFilter()
+        # Infer less often when the face is static or inference is over budget
+        self.rate_controller = InferenceRateController(latency_budget_ms=25.0)
+        self.reported_inference_rate = None
+        self.inference_worker = InferenceWorker(
+            self.face_detector, self.cap, self.expression_filter, self.rate_controller
+        )
+        self.inference_worker.start()
+
     def run(self):
         """Main game loop"""
         clock = pygame.time.Clock()
@@ -82,10 +150,13 @@ class Expressify:
         menu_bgm_played = False  # 🔹 flag untuk menu BGM
 
         while self.running:
+            frame_start = time.perf_counter()
             # Reset cursor to default at start of each frame
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
-            for event in pygame.event.get():
+            with profiler.span("events"):
+                events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
@@ -118,6 +189,7 @@ class Expressify:
                 self.ui_manager.draw_difficulty_selection(self.difficulty_index)
             elif self.game_state == "playing":
                 self.play_game()
+                self.report_inference_rate()
             elif self.game_state == "results":
                 self.ui_manager.draw_results(
                     self.game_logic.score, self.game_logic.max_score
@@ -127,19 +199,92 @@ class Expressify:
                     self.leaderboard, self.leaderboard_difficulty
                 )
 
-            pygame.display.flip()
+            if self.show_timings:
+                self.ui_manager.draw_timing_overlay(
+                    profiler.get_stats(), profiler.histogram("frame")
+                )
+
+            with profiler.span("flip"):
+                pygame.display.flip()
+            if profiler.enabled:
+                profiler.record("frame", time.perf_counter() - frame_start)
             clock.tick(30)
 
         self.cleanup()
 
+    def report_inference_rate(self):
+        """Print the inference rate whenever the controller changes it"""
+        if self.station_pool is not None:
+            return  # Stations infer on every new frame
+        rate = self.rate_controller.mode
+        if rate == self.reported_inference_rate:
+            return
+        self.reported_inference_rate = rate
+
+        stats = self.rate_controller.get_stats()
+        cost = stats["inference_cost_ms"]
+        cost_text = f"{cost:.1f} ms" if cost is not None else "n/a"
+        print(
+            f"Inference rate: {self.rate_controller.get_rate_name()} "
+            f"(cost {cost_text}, CPU saved {stats['cpu_saved_ms'] / 1000:.1f} s)"
+        )
+
+    def read_inputs(self):
+        """
+        Get the camera frame to show and the newest inference result
+
+        Returns:
+            tuple: (frame, InferenceResult or None), or (None, None) before
+                   the first frame
+        """
+        if self.station_pool is not None:
+            # First station's camera is shown; every station is one player
+            frame = self.station_pool.get_frame(0)
+            if frame is None:
+                return None, None
+            return frame, self.station_pool.get_result(
+                since=self.game_logic.last_expression_time
+            )
+
+        # Only the worker takes frames: peeking keeps max-speed replay from
+        # advancing past frames the worker has not seen
+        frame = self.cap.peek()
+        if frame is None:
+            return None, None
+        # The worker may run slower than 30 FPS
+        return frame, self.inference_worker.get_latest()
+
+    def resume_inference(self):
+        """Apply the difficulty's detector settings and resume inference"""
+        if self.station_pool is not None:
+            return  # Station detectors run continuously with default settings
+        self.face_detector.configure_roi(**self.game_logic.roi_settings)
+        self.expression_filter.configure(**self.game_logic.filter_settings)
+        self.inference_worker.resume()
+
+    def pause_inference(self):
+        """Stop spending CPU on inference outside of a game"""
+        if self.station_pool is None:
+            self.inference_worker.pause()
+
     def play_game(self):
         """Game playing logic"""
-        ret, frame = self.cap.read()
-        if not ret:
+        frame, result = self.read_inputs()
+        if frame is None:
             return
 
-        expression_detected = self.face_detector.detect_expression(frame)
-        self.game_logic.update(expression_detected)
+        # Use the newest inference result
+        expression_detected = None
+        landmarks = None
+        if result:
+            expression_detected = result.expression
+            with profiler.span("game_logic"):
+                if result.faces is not None:
+                    self.game_logic.update_players(result.faces, result.frame_timestamp)
+                else:
+                    self.game_logic.update(expression_detected, result.frame_timestamp)
+            if self.show_landmarks:
+                landmarks = result.landmarks
 
         self.ui_manager.draw_game_with_debug(
             frame,
@@ -147,10 +292,14 @@ class Expressify:
             self.game_logic.score,
             self.game_logic.get_remaining_time(),
             expression_detected,
+            landmarks,
+            self.game_logic.player_scores if self.players > 1 else None,
+            self.frame_is_current,
         )
 
         if self.game_logic.is_game_over():
             self.game_state = "results"
+            self.pause_inference()
             self.sound_manager.stop("bgm")
 
             # Save score to leaderboard with player name
@@ -159,6 +308,12 @@ class Expressify:
                 self.difficulty, self.game_logic.score, player_name
             )
             print(f"Score saved! Player: {player_name}, Rank: {rank}")
+            if self.players > 1:
+                scores = ", ".join(
+                    f"P{player_id}: {player_score}"
+                    for player_id, player_score in sorted(self.game_logic.player_scores.items())
+                )
+                print(f"Party scores: {scores}")
 
             # Play sound based on score
             if self.game_logic.score >= (0.8 * self.game_logic.max_score):
@@ -177,6 +332,17 @@ class Expressify:
             self.toggle_fullscreen()
             return
 
+        # Toggle debug landmark overlay with F3
+        if key == pygame.K_F3:
+            self.show_landmarks = not self.show_landmarks
+            return
+
+        # Toggle per-stage timing overlay with F2 (profiling only runs while needed)
+        if key == pygame.K_F2:
+            self.show_timings = not self.show_timings
+            profiler.enable(self.show_timings or self.record_timings)
+            return
+
         if self.game_state == "menu":
             if key == pygame.K_LEFT:
                 self.menu_index = max(0, self.menu_index - 1)
@@ -225,12 +391,16 @@ class Expressify:
                 # Set difficulty and start game
                 difficulties = ["easy", "medium", "hard"]
                 self.difficulty = difficulties[self.difficulty_index]
-                self.game_logic = GameLogic(difficulty=self.difficulty)
+                self.game_logic = GameLogic(
+                    difficulty=self.difficulty, sound_manager=self.sound_manager,
+                    clock=self.game_clock,
+                )
                 # Stop menu BGM before starting game
                 self.sound_manager.stop("bgm")
                 self.sound_manager.play("bgm", loops=-1)
                 self.game_state = "playing"
                 self.game_logic.start_game()
+                self.resume_inference()
             elif key == pygame.K_ESCAPE:
                 self.game_state = "name_input"
 
@@ -298,11 +468,15 @@ class Expressify:
                     self.sound_manager.play("start")
                     difficulties = ["easy", "medium", "hard"]
                     self.difficulty = difficulties[self.difficulty_index]
-                    self.game_logic = GameLogic(difficulty=self.difficulty)
+                    self.game_logic = GameLogic(
+                        difficulty=self.difficulty, sound_manager=self.sound_manager,
+                        clock=self.game_clock,
+                    )
                     self.sound_manager.stop("bgm")
                     self.sound_manager.play("bgm", loops=-1)
                     self.game_state = "playing"
                     self.game_logic.start_game()
+                    self.resume_inference()
                     break
 
         elif self.game_state == "leaderboard":
@@ -370,11 +544,132 @@ class Expressify:
 
     def cleanup(self):
         """Clean up resources"""
-        self.cap.release()
+        if self.station_pool is not None:
+            for stats in self.station_pool.get_stats():
+                print(
+                    f"Station {stats['station']}: {stats['frames_captured']} frames captured, "
+                    f"{stats['frames_processed']} inferred, {stats['frames_skipped']} skipped, "
+                    f"{stats['frames_torn']} torn"
+                )
+        else:
+            self.print_pipeline_stats()
+        stats = self.ui_manager.floating_image_system.sprite_cache.get_stats()
+        print(
+            f"Sprite cache: {stats['sprites']} sprites, "
+            f"{stats['bytes'] / 2**20:.1f} / {stats['max_bytes'] / 2**20:.0f} MB, "
+            f"{stats['hit_rate'] * 100:.0f}% hits, {stats['evictions']} evicted"
+        )
+        stats = self.ui_manager.fonts.text_cache.get_stats()
+        print(
+            f"Text cache: {stats['entries']} surfaces, "
+            f"{stats['hit_rate'] * 100:.0f}% hits"
+        )
+        stats = profiler.get_stats()
+        if stats:
+            print("Frame timings (last samples, ms):")
+            for name, stage in stats.items():
+                print(
+                    f"  {name:<22} p50 {stage['p50_ms']:6.2f}  p95 {stage['p95_ms']:6.2f}  "
+                    f"max {stage['max_ms']:6.2f}"
+                )
+        if self.station_pool is not None:
+            self.station_pool.stop()
+        else:
+            self.inference_worker.stop()
+            self.cap.release()
         pygame.quit()
         cv2.destroyAllWindows()
 
+    def print_pipeline_stats(self):
+        """Print capture, detector and filter counters of the in-process pipeline"""
+        stats = self.cap.get_stats()
+        print(
+            f"Camera: {stats['frames_captured']} frames captured, "
+            f"{stats['frames_dropped']} dropped"
+        )
+        stats = self.face_detector.get_gate_stats()
+        print(
+            f"Motion gate: {stats['gate_hits']} hits, {stats['gate_misses']} misses "
+            f"({stats['gate_hit_rate'] * 100:.0f}% reused)"
+        )
+        stats = self.rate_controller.get_stats()
+        print(
+            f"Inference: {stats['frames_inferred']} frames inferred, "
+            f"{stats['frames_gated']} skipped by rate control, "
+            f"CPU saved {stats['cpu_saved_ms'] / 1000:.1f} s"
+        )
+        stats = self.expression_filter.get_stats()
+        if stats["decision_latency_frames"] is not None:
+            # Latency in ms needs capture timestamps, which plain arrays lack
+            latency_ms = stats["decision_latency_ms"]
+            ms_text = f"{latency_ms:.0f} ms" if latency_ms is not None else "n/a"
+            print(
+                f"Expression filter: {stats['switches']} switches, "
+                f"decision latency {stats['decision_latency_frames']:.1f} frames / "
+                f"{ms_text}"
+            )
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Expressify - Face Expression Game")
+    parser.add_argument(
+        "--profile",
+        choices=list(DETECTOR_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=(
+            "Face detector profile (speed vs accuracy, default: accurate); "
+            "balanced and fast are quicker but may score borderline faces differently"
+        ),
+    )
+    parser.add_argument(
+        "--players",
+        type=int,
+        choices=range(1, 5),
+        default=1,
+        help="Players in front of one camera (2-4 enables party mode)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Play a recorded video file or frame directory instead of the webcam",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        choices=["realtime", "max"],
+        default="realtime",
+        help="Replay at the recording's frame rate or as fast as frames are processed",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Record per-stage frame timings and print them on exit (F2 shows them live)",
+    )
+    parser.add_argument(
+        "--stations",
+        nargs="+",
+        type=parse_source,
+        metavar="SOURCE",
+        help=(
+            "Multi-camera kiosk: camera indices or recordings, one player each, "
+            "captured and analyzed in separate processes (first one is shown)"
+        ),
+    )
+    args = parser.parse_args()
+    if args.stations and (args.replay or args.players > 1):
+        parser.error("--stations takes one player per source; drop --replay/--players")
+    return args
+
 
 if __name__ == "__main__":
-    game = Expressify()
+    multiprocessing.freeze_support()  # Station processes in the frozen executable
+    args = parse_args()
+    game = Expressify(
+        detector_profile=args.profile,
+        players=args.players,
+        replay=args.replay,
+        replay_speed=args.replay_speed,
+        timings=args.timings,
+        stations=args.stations,
+    )
     game.run()
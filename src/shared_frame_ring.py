@@ -0,0 +1,180 @@
+"""
+Shared Frame Ring Module
+Hands camera frames between processes through shared memory, without pickling
+"""
+
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from frame import Frame
+
+# Per-slot header. "version" is a seqlock: odd while the slot is being
+# written. "seq" is the capture sequence number the slot currently holds.
+SLOT_DTYPE = np.dtype([
+    ("version", "<u8"),
+    ("seq", "<u8"),
+    ("timestamp", "<f8"),
+])
+# Ring header: sequence number of the newest published frame
+RING_DTYPE = np.dtype([("latest_seq", "<u8")])
+
+
+class SharedFrameRing:
+    """
+    Fixed pool of frame slots in one shared memory block
+
+    Layout: ring header | slot headers | slot pixels. The single writer (the
+    capture process) fills slot `seq % slots` and then publishes `seq`;
+    readers (the inference process, the display) get a Frame whose pixels are
+    a view straight into the shared block. With `slots` slots, a frame stays
+    valid until slots - 1 newer frames were written; is_current() tells a
+    reader whether the slot was reused while it was working on it.
+    """
+
+    def __init__(self, name=None, create=False, slots=4, height=480, width=640, channels=3):
+        """
+        Create or attach to a frame ring
+
+        Args:
+            name: Shared memory name (needed when attaching)
+            create: Allocate a new ring instead of attaching
+            slots: Number of frame slots
+            height: Frame height
+            width: Frame width
+            channels: Frame channels (3 = BGR)
+        """
+        self.slots = slots
+        self.frame_shape = (height, width, channels)
+        self.frame_bytes = height * width * channels
+
+        headers_offset = RING_DTYPE.itemsize
+        pixels_offset = headers_offset + SLOT_DTYPE.itemsize * slots
+        pixels_offset += -pixels_offset % 64  # Cache-line aligned pixel data
+        size = pixels_offset + self.frame_bytes * slots
+
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        self.name = self.shm.name
+
+        buf = self.shm.buf
+        self.header = np.ndarray((), dtype=RING_DTYPE, buffer=buf)
+        self.slot_headers = np.ndarray(
+            (slots,), dtype=SLOT_DTYPE, buffer=buf, offset=headers_offset
+        )
+        self.pixels = np.ndarray(
+            (slots, *self.frame_shape), dtype=np.uint8, buffer=buf, offset=pixels_offset
+        )
+        if create:
+            self.header[()] = 0
+            self.slot_headers[:] = 0
+
+        # Writer state
+        self.write_seq = int(self.header["latest_seq"])
+
+    @classmethod
+    def attach(cls, name, slots=4, height=480, width=640, channels=3):
+        """Attach to an existing ring (same geometry as the creator)"""
+        return cls(name, False, slots, height, width, channels)
+
+    # ---- Writer side -------------------------------------------------------
+
+    def begin_write(self):
+        """
+        Reserve the next slot for writing
+
+        Returns:
+            numpy.ndarray: Slot pixels to fill in place (e.g. cap.read(slot))
+        """
+        seq = self.write_seq + 1
+        index = seq % self.slots
+        header = self.slot_headers[index]
+        header["version"] += 1  # Odd: readers must not trust this slot
+        return self.pixels[index]
+
+    def end_write(self, timestamp=None):
+        """
+        Publish the slot reserved by begin_write()
+
+        Returns:
+            int: Sequence number of the published frame
+        """
+        seq = self.write_seq + 1
+        index = seq % self.slots
+        header = self.slot_headers[index]
+        header["seq"] = seq
+        header["timestamp"] = time.time() if timestamp is None else timestamp
+        header["version"] += 1  # Even again: slot complete
+        self.header["latest_seq"] = seq
+        self.write_seq = seq
+        return seq
+
+    def abort_write(self):
+        """Give up the slot reserved by begin_write() without publishing it"""
+        index = (self.write_seq + 1) % self.slots
+        header = self.slot_headers[index]
+        header["seq"] = 0  # Pixels may be clobbered: the old frame is no longer current
+        header["version"] += 1  # Even again
+
+    def write(self, image, timestamp=None):
+        """
+        Copy a frame into the next slot and publish it
+
+        Args:
+            image: BGR image with the ring's frame shape
+            timestamp: Capture time (defaults to now)
+        """
+        slot = self.begin_write()
+        np.copyto(slot, image)
+        return self.end_write(timestamp)
+
+    # ---- Reader side -------------------------------------------------------
+
+    def latest_seq(self):
+        """Sequence number of the newest published frame (0 = none yet)"""
+        return int(self.header["latest_seq"])
+
+    def read_latest(self):
+        """
+        Get the freshest frame without copying
+
+        Returns:
+            Frame: Frame whose pixels view the shared slot, or None if no frame
+        """
+        while True:
+            seq = self.latest_seq()
+            if seq == 0:
+                return None
+            index = seq % self.slots
+            header = self.slot_headers[index]
+            version = int(header["version"])
+            if version % 2 == 0 and int(header["seq"]) == seq:
+                timestamp = float(header["timestamp"])
+                if int(header["version"]) == version:
+                    return Frame(self.pixels[index], timestamp, seq)
+            # Writer lapped us while reading the header: retry with the newer seq
+
+    def read(self):
+        """
+        cv2.VideoCapture compatible read
+
+        Returns:
+            tuple: (ret, Frame) with the freshest available frame
+        """
+        frame = self.read_latest()
+        return frame is not None, frame
+
+    def is_current(self, frame):
+        """Check that the frame's slot has not been reused since it was read"""
+        header = self.slot_headers[frame.seq % self.slots]
+        return int(header["version"]) % 2 == 0 and int(header["seq"]) == frame.seq
+
+    def close(self, unlink=False):
+        """Detach from the ring (and free it when unlink is set)"""
+        # Drop the numpy views first, the buffer cannot close while exported
+        self.header = None
+        self.slot_headers = None
+        self.pixels = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
@@ -0,0 +1,427 @@
+"""
+Station Pool Module
+Runs capture + inference for several cameras in separate worker processes
+
+Each station (camera) gets a capture process and an inference process, so
+face mesh for N cameras runs on N cores instead of sharing one GIL. The
+capture process decodes frames straight into a SharedFrameRing; the
+inference process runs FaceDetector on them in place, and the host can
+display the same frames, all without pickling or copying. Results come back
+through a small shared-memory block per station that the inference process
+overwrites in place; the host only ever reads the latest result, like
+InferenceWorker.get_latest().
+"""
+
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from expressions import EXPRESSIONS
+from inference_worker import InferenceResult
+from shared_frame_ring import SharedFrameRing
+
+# Latest result of one station. "version" is a seqlock: odd while the worker
+# is writing, bumped to the next even number once the record is complete.
+RESULT_DTYPE = np.dtype([
+    ("version", "<u8"),
+    ("frame_seq", "<u8"),
+    ("frame_timestamp", "<f8"),
+    ("inference_time", "<f8"),
+    ("expression", "<i4"),  # Index into EXPRESSIONS
+    ("raw_expression", "<i4"),
+    ("frames_processed", "<u8"),
+    ("frames_skipped", "<u8"),
+    ("frames_torn", "<u8"),  # Frames overwritten while being analyzed
+])
+
+
+def parse_source(text):
+    """Station source from the command line: camera index or recording path"""
+    return int(text) if text.isdigit() else text
+
+
+class SharedResult:
+    """Single-writer, multi-reader result slot in shared memory"""
+
+    def __init__(self, name=None, create=False):
+        """
+        Create or attach to a shared result block
+
+        Args:
+            name: Shared memory name (needed when attaching)
+            create: Allocate a new block instead of attaching
+        """
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=create, size=RESULT_DTYPE.itemsize
+        )
+        self.record = np.ndarray((), dtype=RESULT_DTYPE, buffer=self.shm.buf)
+        if create:
+            self.record[()] = 0
+        self.name = self.shm.name
+
+    def write(self, frame_seq, frame_timestamp, inference_time, expression,
+              raw_expression, frames_processed, frames_skipped, frames_torn=0):
+        """Publish a new result (worker side)"""
+        record = self.record
+        version = int(record["version"])
+        record["version"] = version + 1  # Odd: write in progress
+        record["frame_seq"] = frame_seq
+        record["frame_timestamp"] = frame_timestamp
+        record["inference_time"] = inference_time
+        record["expression"] = EXPRESSIONS.index(expression)
+        record["raw_expression"] = EXPRESSIONS.index(raw_expression)
+        record["frames_processed"] = frames_processed
+        record["frames_skipped"] = frames_skipped
+        record["frames_torn"] = frames_torn
+        record["version"] = version + 2
+
+    def read(self):
+        """
+        Read the latest complete result (host side)
+
+        Returns:
+            numpy.void: Copy of the record, or None before the first result
+        """
+        while True:
+            version = int(self.record["version"])
+            if version % 2:
+                continue  # Writer is mid-update; it finishes within microseconds
+            snapshot = self.record.copy()
+            if int(self.record["version"]) == version:
+                return snapshot if version else None
+
+    def close(self, unlink=False):
+        """Detach from the block (and free it when unlink is set)"""
+        # Drop the numpy view first, the buffer cannot close while exported
+        self.record = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def run_capture(source, ring_name, ring_slots, stop_event, width, height):
+    """
+    Capture process: publish camera frames into the station's frame ring
+
+    Args:
+        source: Camera index, or video path / frame directory (replayed in
+                real time, looping)
+        ring_name: Name of the station's SharedFrameRing
+        ring_slots: Slot count of the frame ring
+        stop_event: multiprocessing.Event that ends the loop
+        width: Requested capture width (ring frame width)
+        height: Requested capture height (ring frame height)
+    """
+    frame_ring = SharedFrameRing.attach(ring_name, ring_slots, height, width)
+    try:
+        if isinstance(source, str):
+            _replay_into_ring(source, frame_ring, stop_event, width, height)
+        else:
+            _capture_into_ring(source, frame_ring, stop_event, width, height)
+    finally:
+        frame_ring.close()
+
+
+def _capture_into_ring(source, frame_ring, stop_event, width, height):
+    """Decode camera frames straight into the ring slots"""
+    import cv2
+
+    cap = cv2.VideoCapture(source)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    try:
+        while not stop_event.is_set():
+            if not cap.grab():
+                time.sleep(0.01)
+                continue
+            timestamp = time.time()
+
+            # OpenCV decodes into the slot itself when the size matches
+            slot = frame_ring.begin_write()
+            ret, image = cap.retrieve(slot)
+            if not ret:
+                frame_ring.abort_write()
+                continue
+            if image is not slot:
+                # Camera ignored the requested size
+                cv2.resize(image, (width, height), dst=slot)
+            frame_ring.end_write(timestamp)
+    finally:
+        cap.release()
+
+
+def _replay_into_ring(path, frame_ring, stop_event, width, height):
+    """Publish a recording into the ring at its frame rate, like a live camera"""
+    from frame_source import ReplaySource
+
+    replay = ReplaySource(path, loop=True, width=width, height=height)
+    try:
+        for frame in replay.frames():
+            if stop_event.is_set():
+                break
+            delay = frame.timestamp - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            frame_ring.write(frame.bgr, frame.timestamp)
+    finally:
+        replay.release()
+
+
+def run_station(result_name, ring_name, ring_slots, stop_event, profile, width, height):
+    """
+    Inference process: face mesh + filtering on frames from the station's ring
+
+    Frames are read in place from shared memory; a result is only published
+    when the slot was not reused by the capture process meanwhile.
+
+    Args:
+        result_name: Name of the station's SharedResult block
+        ring_name: Name of the station's SharedFrameRing
+        ring_slots: Slot count of the frame ring
+        stop_event: multiprocessing.Event that ends the loop
+        profile: FaceDetector profile name
+        width: Ring frame width
+        height: Ring frame height
+    """
+    # Imported here so the host process never loads MediaPipe for stations
+    from expression_filter import ExpressionFilter
+    from face_detector import FaceDetector
+    from face_features import classify_features
+
+    result = SharedResult(result_name)
+    frame_ring = SharedFrameRing.attach(ring_name, ring_slots, height, width)
+    detector = FaceDetector(profile=profile)
+    expression_filter = ExpressionFilter()
+
+    last_seq = 0
+    frames_processed = 0
+    frames_skipped = 0
+    frames_torn = 0
+    try:
+        while not stop_event.is_set():
+            frame = frame_ring.read_latest()
+            if frame is None or frame.seq == last_seq:
+                time.sleep(0.002)
+                continue
+            if last_seq and frame.seq > last_seq + 1:
+                frames_skipped += frame.seq - last_seq - 1
+            last_seq = frame.seq
+
+            start = time.perf_counter()
+            features = detector.detect_features(frame)
+            elapsed = time.perf_counter() - start
+
+            # Slot overwritten while the detector read it: drop the result
+            if not frame_ring.is_current(frame):
+                frames_torn += 1
+                continue
+
+            raw_expression = classify_features(features) if features else "neutral"
+            expression = expression_filter.update(features, frame.timestamp)
+            frames_processed += 1
+            result.write(
+                frame.seq, frame.timestamp, elapsed, expression, raw_expression,
+                frames_processed, frames_skipped, frames_torn,
+            )
+    finally:
+        frame_ring.close()
+        result.close()
+
+
+class StationPool:
+    """
+    Capture and inference processes per camera, frames and results in shared memory
+
+    Usage:
+        pool = StationPool([0, 1, 2]).start()
+        result = pool.get_latest(0)  # InferenceResult or None
+        game_input = pool.get_result()  # All stations merged (faces = players)
+        frame = pool.get_frame(0)  # Frame viewing shared memory, or None
+        pool.stop()
+    """
+
+    def __init__(self, sources, profile="accurate", width=640, height=480, ring_slots=4):
+        """
+        Initialize station pool
+
+        Args:
+            sources: Camera indices or video paths, one per station
+            profile: FaceDetector profile used by every station (default matches
+                     face_detector.DEFAULT_PROFILE, not imported by the host)
+            width: Capture width (frames are resized to it if needed)
+            height: Capture height
+            ring_slots: Frame slots per station ring
+        """
+        self.sources = list(sources)
+        self.profile = profile
+        self.width = width
+        self.height = height
+        self.ring_slots = ring_slots
+
+        # Spawn: fresh interpreters, no forked camera/MediaPipe state
+        self.context = mp.get_context("spawn")
+        self.stop_event = None
+        self.results = []
+        self.frame_rings = []
+        self.capture_processes = []
+        self.processes = []  # Inference processes
+
+    def start(self):
+        """Allocate shared blocks and start the capture and inference processes"""
+        if self.processes:
+            return self
+        self.stop_event = self.context.Event()
+        for station, source in enumerate(self.sources):
+            result = SharedResult(create=True)
+            frame_ring = SharedFrameRing(
+                create=True, slots=self.ring_slots, height=self.height, width=self.width
+            )
+            capture = self.context.Process(
+                target=run_capture,
+                args=(source, frame_ring.name, self.ring_slots, self.stop_event,
+                      self.width, self.height),
+                name=f"Capture-{station}",
+                daemon=True,
+            )
+            process = self.context.Process(
+                target=run_station,
+                args=(result.name, frame_ring.name, self.ring_slots, self.stop_event,
+                      self.profile, self.width, self.height),
+                name=f"Station-{station}",
+                daemon=True,
+            )
+            capture.start()
+            process.start()
+            self.results.append(result)
+            self.frame_rings.append(frame_ring)
+            self.capture_processes.append(capture)
+            self.processes.append(process)
+        return self
+
+    def get_latest(self, station):
+        """
+        Get the newest result of a station
+
+        Returns:
+            InferenceResult: Latest result, or None before the first one
+        """
+        record = self.results[station].read()
+        if record is None:
+            return None
+        return InferenceResult(
+            EXPRESSIONS[record["expression"]],
+            float(record["frame_timestamp"]),
+            int(record["frame_seq"]),
+            float(record["inference_time"]),
+            raw_expression=EXPRESSIONS[record["raw_expression"]],
+        )
+
+    def get_result(self, since=None):
+        """
+        Merge the newest results of all stations into one game input
+
+        Args:
+            since: Leave out stations whose latest frame is older than this
+                   (e.g. captured before the current challenge was shown)
+
+        Returns:
+            InferenceResult: With one station, its latest result. With several,
+                             faces maps player number (station + 1) to that
+                             station's expression and frame_timestamp is the
+                             oldest one included. None without any result.
+        """
+        latest = []
+        for station in range(len(self.results)):
+            result = self.get_latest(station)
+            if result is None:
+                continue
+            if since is not None and result.frame_timestamp < since:
+                continue
+            latest.append((station, result))
+        if not latest:
+            return None
+        if len(self.sources) == 1:
+            return latest[0][1]
+
+        first = latest[0][1]
+        return InferenceResult(
+            first.expression,
+            min(result.frame_timestamp for _, result in latest),
+            first.frame_seq,
+            first.inference_time,
+            raw_expression=first.raw_expression,
+            faces={station + 1: result.expression for station, result in latest},
+        )
+
+    def get_frame(self, station):
+        """
+        Get the newest camera frame of a station (no copy)
+
+        Returns:
+            Frame: Pixels view the station's shared ring slot; check
+                   is_frame_current() after using them. None before the
+                   first frame.
+        """
+        return self.frame_rings[station].read_latest()
+
+    def is_frame_current(self, station, frame):
+        """Check that a frame from get_frame() was not overwritten meanwhile"""
+        return self.frame_rings[station].is_current(frame)
+
+    def get_stats(self):
+        """Get per-station throughput counters"""
+        stats = []
+        for station, result in enumerate(self.results):
+            record = result.read()
+            stats.append({
+                "station": station,
+                "alive": (
+                    self.capture_processes[station].is_alive()
+                    and self.processes[station].is_alive()
+                ),
+                "frames_captured": self.frame_rings[station].latest_seq(),
+                "frames_processed": int(record["frames_processed"]) if record else 0,
+                "frames_skipped": int(record["frames_skipped"]) if record else 0,
+                "frames_torn": int(record["frames_torn"]) if record else 0,
+            })
+        return stats
+
+    def stop(self):
+        """Stop all station processes and free the shared memory"""
+        if self.stop_event is not None:
+            self.stop_event.set()
+        for process in self.capture_processes + self.processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        for result in self.results:
+            result.close(unlink=True)
+        for frame_ring in self.frame_rings:
+            frame_ring.close(unlink=True)
+        self.capture_processes = []
+        self.processes = []
+        self.results = []
+        self.frame_rings = []
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Headless kiosk host: python src/station_pool.py 0 1 2
+    # (python src/main.py --stations 0 1 2 plays the game on them)
+    sources = [parse_source(arg) for arg in sys.argv[1:]] or [0]
+    pool = StationPool(sources).start()
+    try:
+        while True:
+            time.sleep(1.0)
+            line = []
+            for station in range(len(sources)):
+                result = pool.get_latest(station)
+                line.append(f"[{station}] {result.expression if result else '-'}")
+            print("  ".join(line))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop()
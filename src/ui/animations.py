@@ -4,8 +4,16 @@ Animations - Particle systems and animation effects
 
 import random
 import math
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 
+# Background particle radius range and glow circles drawn around each one
+PARTICLE_MIN_SIZE = 3
+PARTICLE_MAX_SIZE = 12
+GLOW_RINGS = 3
+
 
 class Particle:
     """Single particle for background effects"""
@@ -19,10 +27,90 @@ class Particle:
         self.direction = direction
 
 
+class ParticleStore:
+    """
+    Fixed-capacity structure-of-arrays particle state
+
+    Positions, precomputed velocity vectors and sprite indices live in
+    preallocated NumPy arrays; only the first `count` entries are active, so
+    particles can be added or dropped without reallocating.
+    """
+    
+    def __init__(self, capacity):
+        """
+        Initialize particle store
+        
+        Args:
+            capacity: Maximum number of particles
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.sprite = np.zeros(capacity, dtype=np.intp)
+    
+    def add(self, x, y, speed, direction, sprite):
+        """
+        Append one particle
+        
+        Returns:
+            bool: False when the store is full
+        """
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(direction) * speed
+        self.vy[i] = math.sin(direction) * speed
+        self.sprite[i] = sprite
+        self.count += 1
+        return True
+    
+    def truncate(self, count):
+        """Keep only the first `count` particles"""
+        self.count = max(0, min(count, self.count))
+    
+    def step(self, width, height):
+        """Move every active particle and wrap it around the screen"""
+        n = self.count
+        for values, velocity, limit in ((self.x, self.vx, width), (self.y, self.vy, height)):
+            values = values[:n]
+            values += velocity[:n]
+            above = values > limit
+            values[values < 0] = limit
+            values[above] = 0
+    
+    def outside(self, area, margin=0):
+        """
+        Mask of active particles outside a rectangle (expanded by margin)
+        
+        Args:
+            area: Tuple (x, y, width, height)
+            margin: Extra border around the area
+        """
+        ax, ay, aw, ah = area
+        x = self.x[:self.count]
+        y = self.y[:self.count]
+        return (
+            (x < ax - margin) | (x > ax + aw + margin)
+            | (y < ay - margin) | (y > ay + ah + margin)
+        )
+
+
 class ParticleSystem:
-    """Manages background particles"""
+    """
+    Manages background particles
+
+    Each particle's glow (GLOW_RINGS concentric circles) is pre-rendered once
+    per (size, color) into a sprite atlas; particle state lives in a
+    ParticleStore, is updated in one vectorized step and drawn with a single
+    Surface.blits call.
+    """
     
-    def __init__(self, width, height, colors, particle_count=30):
+    def __init__(self, width, height, colors, particle_count=30, capacity=None):
         """
         Initialize particle system
         
@@ -31,29 +119,55 @@ class ParticleSystem:
             height: Screen height
             colors: Colors instance
             particle_count: Number of particles to create
+            capacity: Maximum particle count (defaults to particle_count)
         """
         self.width = width
         self.height = height
         self.colors = colors
-        self.particles = []
-        self.init_particles(particle_count)
-    
-    def init_particles(self, count):
-        """Initialize floating particles for background"""
-        color_choices = [
+        self.color_choices = [
             self.colors.PURPLE, self.colors.PINK, self.colors.CYAN,
             self.colors.ORANGE, self.colors.YELLOW, self.colors.LIGHT_BLUE
         ]
+        self.sizes = list(range(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1))
+        self.atlas, self.sprite_offsets = self._build_atlas()
+        self.store = ParticleStore(max(particle_count, capacity or 0))
+        self.init_particles(particle_count)
+    
+    def _build_atlas(self):
+        """
+        Pre-render a glow sprite for every (size, color) pair
         
+        Returns:
+            tuple: (list of sprites, numpy array of sprite center offsets);
+                   sprite index = size index * color count + color index
+        """
+        atlas = []
+        offsets = []
+        for size in self.sizes:
+            for color in self.color_choices:
+                atlas.append(render_glow_sprite(size, color))
+                offsets.append(size * GLOW_RINGS)
+        return atlas, np.array(offsets)
+    
+    def init_particles(self, count):
+        """Add floating particles for background (up to the store's capacity)"""
         for _ in range(count):
-            self.particles.append({
-                'x': random.randint(0, self.width),
-                'y': random.randint(0, self.height),
-                'size': random.randint(3, 12),
-                'speed': random.uniform(0.5, 2),
-                'color': random.choice(color_choices),
-                'direction': random.uniform(0, 2 * math.pi)
-            })
+            x = random.randint(0, self.width)
+            y = random.randint(0, self.height)
+            size = random.randint(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE)
+            speed = random.uniform(0.5, 2)
+            color = random.randrange(len(self.color_choices))
+            direction = random.uniform(0, 2 * math.pi)
+            sprite = self.sizes.index(size) * len(self.color_choices) + color
+            if not self.store.add(x, y, speed, direction, sprite):
+                break
+    
+    def set_particle_count(self, count):
+        """Grow or shrink the number of particles (bounded by capacity)"""
+        if count < self.store.count:
+            self.store.truncate(count)
+        else:
+            self.init_particles(count - self.store.count)
     
     def update_and_draw(self, screen, exclude_area=None):
         """
@@ -63,46 +177,46 @@ class ParticleSystem:
             screen: Pygame screen surface
             exclude_area: Optional tuple (x, y, width, height) to exclude from rendering
         """
-        for particle in self.particles:
-            # Update position
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            
-            # Wrap around screen
-            if particle['x'] < 0:
-                particle['x'] = self.width
-            elif particle['x'] > self.width:
-                particle['x'] = 0
-            if particle['y'] < 0:
-                particle['y'] = self.height
-            elif particle['y'] > self.height:
-                particle['y'] = 0
-            
-            # Check if particle is in excluded area
-            if exclude_area:
-                ex, ey, ew, eh = exclude_area
-                margin = 30  # Smaller margin for particles
-                if (ex - margin <= particle['x'] <= ex + ew + margin and 
-                    ey - margin <= particle['y'] <= ey + eh + margin):
-                    continue  # Skip rendering this particle
-            
-            # Draw particle with glow effect
-            for i in range(3, 0, -1):
-                alpha_surface = pygame.Surface(
-                    (particle['size'] * i * 2, particle['size'] * i * 2), 
-                    pygame.SRCALPHA
-                )
-                color_with_alpha = (*particle['color'], 50 // i)
-                pygame.draw.circle(
-                    alpha_surface, color_with_alpha,
-                    (particle['size'] * i, particle['size'] * i),
-                    particle['size'] * i
-                )
-                screen.blit(
-                    alpha_surface,
-                    (int(particle['x']) - particle['size'] * i,
-                     int(particle['y']) - particle['size'] * i)
-                )
+        store = self.store
+        store.step(self.width, self.height)
+        
+        n = store.count
+        x = store.x[:n]
+        y = store.y[:n]
+        sprites = store.sprite[:n]
+        if exclude_area:
+            visible = store.outside(exclude_area, margin=30)  # Smaller margin for particles
+            x = x[visible]
+            y = y[visible]
+            sprites = sprites[visible]
+        
+        offsets = self.sprite_offsets[sprites]
+        left = (x.astype(int) - offsets).tolist()
+        top = (y.astype(int) - offsets).tolist()
+        screen.blits(
+            list(zip(map(self.atlas.__getitem__, sprites.tolist()), zip(left, top))),
+            doreturn=False,
+        )
+
+
+def render_glow_sprite(size, color):
+    """
+    Render one particle glow: GLOW_RINGS circles, faint and wide to solid and small
+    
+    Args:
+        size: Particle radius of the innermost circle
+        color: RGB color
+    
+    Returns:
+        pygame.Surface: SRCALPHA sprite of side size * GLOW_RINGS * 2
+    """
+    center = size * GLOW_RINGS
+    sprite = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+    for i in range(GLOW_RINGS, 0, -1):
+        ring = pygame.Surface((size * i * 2, size * i * 2), pygame.SRCALPHA)
+        pygame.draw.circle(ring, (*color, 50 // i), (size * i, size * i), size * i)
+        sprite.blit(ring, (center - size * i, center - size * i))
+    return sprite
 
 
 class FloatingImage:
@@ -140,10 +254,115 @@ class FloatingImage:
         self.rotation += self.rotation_speed
 
 
+class SpriteCache:
+    """
+    LRU cache of scaled, rotated, alpha-applied floating image sprites
+
+    Rotation is quantized to `rotation_step` degree buckets. The cache is
+    bounded by the pixel memory of its sprites (max_bytes); least recently
+    used sprites are evicted first.
+    """
+    
+    def __init__(self, rotation_step=3, max_bytes=32 * 1024 * 1024):
+        """
+        Initialize sprite cache
+        
+        Args:
+            rotation_step: Rotation bucket width in degrees
+            max_bytes: Maximum pixel memory of cached sprites (~24 MB holds
+                every bucket of the default 8 floating images)
+        """
+        self.rotation_step = rotation_step
+        self.buckets = int(round(360 / rotation_step))
+        self.max_bytes = max_bytes
+        self.sprites = OrderedDict()
+        self.scaled = {}  # {(expression, size): pre-scaled image}
+        self.source_images = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def clear(self):
+        """Drop every cached sprite"""
+        self.sprites.clear()
+        self.scaled.clear()
+        self.bytes = 0
+    
+    def get(self, expression_images, expression, size, rotation, alpha):
+        """
+        Get the sprite of an expression image at a size, rotation and alpha
+        
+        Args:
+            expression_images: Dictionary of expression images (cache is
+                               cleared when a different dictionary is passed)
+            expression: Expression key
+            size: Scaled size in pixels
+            rotation: Rotation in degrees (snapped to the nearest bucket)
+            alpha: Opacity 0-255, pre-applied to the sprite's pixels
+        """
+        if expression_images is not self.source_images:
+            self.clear()
+            self.source_images = expression_images
+        
+        bucket = int(round(rotation / self.rotation_step)) % self.buckets
+        key = (expression, size, bucket, alpha)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        
+        self.misses += 1
+        sprite = self.build(expression_images, expression, size, bucket * self.rotation_step, alpha)
+        self.sprites[key] = sprite
+        self.bytes += self.sprite_bytes(sprite)
+        while self.bytes > self.max_bytes and len(self.sprites) > 1:
+            _, evicted = self.sprites.popitem(last=False)
+            self.bytes -= self.sprite_bytes(evicted)
+            self.evictions += 1
+        return sprite
+    
+    def build(self, expression_images, expression, size, rotation, alpha):
+        """Scale (once per size), rotate and apply alpha to an expression image"""
+        scaled = self.scaled.get((expression, size))
+        if scaled is None:
+            scaled = pygame.transform.scale(expression_images[expression], (size, size))
+            self.scaled[(expression, size)] = scaled
+        
+        rotated = pygame.transform.rotate(scaled, rotation)
+        sprite = pygame.Surface(rotated.get_size(), pygame.SRCALPHA)
+        sprite.blit(rotated, (0, 0))
+        
+        # Bake the opacity into the pixels so drawing is a plain blit
+        pixels_alpha = pygame.surfarray.pixels_alpha(sprite)
+        pixels_alpha[...] = (pixels_alpha.astype(np.uint16) * alpha // 255).astype(np.uint8)
+        del pixels_alpha  # Unlock the surface
+        return sprite
+    
+    @staticmethod
+    def sprite_bytes(sprite):
+        """Pixel memory of a sprite"""
+        return sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+    
+    def get_stats(self):
+        """Get cache size and hit counters"""
+        total = self.hits + self.misses
+        return {
+            "sprites": len(self.sprites),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
 class FloatingImageSystem:
-    """Manages floating expression images"""
+    """Manages floating expression images (drawn from a SpriteCache)"""
     
-    def __init__(self, width, height, image_count=8):
+    def __init__(self, width, height, image_count=8, sprite_cache=None):
         """
         Initialize floating image system
         
@@ -151,11 +370,13 @@ class FloatingImageSystem:
             width: Screen width
             height: Screen height
             image_count: Number of floating images
+            sprite_cache: SpriteCache to draw from (a default one is created)
         """
         self.width = width
         self.height = height
         self.floating_images = []
         self.animation_time = 0
+        self.sprite_cache = sprite_cache if sprite_cache else SpriteCache()
         self.init_floating_images(image_count)
     
     def init_floating_images(self, count):
@@ -201,28 +422,19 @@ class FloatingImageSystem:
                     ey - margin <= img.y <= ey + eh + margin):
                     continue  # Skip rendering this image
             
-            # Get expression image
+            # Scaled, rotated and faded sprite (cached per rotation bucket)
             if img.expression in expression_images:
-                original_image = expression_images[img.expression]
-                
-                # Scale down the image
-                small_image = pygame.transform.scale(original_image, (img.size, img.size))
-                
-                # Apply rotation
-                rotated_image = pygame.transform.rotate(small_image, img.rotation)
-                
-                # Create surface with alpha for transparency
-                alpha_surface = pygame.Surface(rotated_image.get_size(), pygame.SRCALPHA)
-                alpha_surface.blit(rotated_image, (0, 0))
-                alpha_surface.set_alpha(img.alpha)
+                sprite = self.sprite_cache.get(
+                    expression_images, img.expression, img.size, img.rotation, img.alpha
+                )
                 
                 # Add bobbing motion
                 bob = math.sin(self.animation_time * 0.5 + img.bob_offset) * 8
                 
                 # Draw the floating image
-                final_x = int(img.x - rotated_image.get_width() // 2)
-                final_y = int(img.y + bob - rotated_image.get_height() // 2)
-                screen.blit(alpha_surface, (final_x, final_y))
+                final_x = int(img.x - sprite.get_width() // 2)
+                final_y = int(img.y + bob - sprite.get_height() // 2)
+                screen.blit(sprite, (final_x, final_y))
 
 
 class ConfettiSystem:
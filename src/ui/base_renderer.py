@@ -4,6 +4,88 @@ Base UI Components - Common rendering utilities
 
 import pygame
 import colorsys
+from collections import OrderedDict
+
+import numpy as np
+
+
+class GradientCache:
+    """
+    LRU cache of vertical gradients keyed by (colors, height)
+
+    Each gradient is stored as a 1-px-wide column and stretched over the
+    target when drawn, so a cached gradient costs a few KB instead of a
+    full-screen surface and every screen's gradients fit at once.
+    """
+
+    def __init__(self, max_entries=64):
+        """
+        Initialize gradient cache
+
+        Args:
+            max_entries: Maximum number of cached columns (~3 KB each at
+                720 px; the animated menu and results screens use
+                GRADIENT_ANIMATION_STEPS + 1 each)
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, color1, color2, height):
+        """Get the 1-px-wide gradient column, building it on a cache miss"""
+        key = (tuple(color1), tuple(color2), height)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.build(color1, color2, 1, height)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def draw(self, target, color1, color2):
+        """Fill the whole target with the gradient (column stretched in one pass)"""
+        column = self.get(color1, color2, target.get_height())
+        pygame.transform.scale(column, target.get_size(), target)
+
+    def get_stats(self):
+        """Get cache size and hit counters"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    @staticmethod
+    def build(color1, color2, width, height):
+        """Build a vertical gradient surface with a single vectorized fill"""
+        progress = (np.arange(height) / height)[:, None]
+        column = np.asarray(color1, dtype=np.float64) * (1 - progress) + np.asarray(
+            color2, dtype=np.float64
+        ) * progress
+
+        pixels = np.empty((width, height, 3), dtype=np.uint8)
+        pixels[:] = column.astype(np.uint8)
+        surface = pygame.surfarray.make_surface(pixels)
+
+        # Match display format for fast blits
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+
+# Shared across UIManager instances (the UI is rebuilt on every resize)
+gradient_cache = GradientCache()
+
+# Number of levels animated gradients are snapped to
+GRADIENT_ANIMATION_STEPS = 12
 
 
 class UIRenderer:
@@ -25,44 +107,39 @@ class UIRenderer:
         self.height = screen.get_height()
 
     def draw_gradient_background(self, color1, color2):
-        """Draw a vertical gradient background"""
-        for y in range(self.height):
-            progress = y / self.height
-            r = int(color1[0] * (1 - progress) + color2[0] * progress)
-            g = int(color1[1] * (1 - progress) + color2[1] * progress)
-            b = int(color1[2] * (1 - progress) + color2[2] * progress)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
-
-    def draw_text_with_shadow(self, text, font, color, x, y, shadow_offset=4):
-        """Draw text with shadow for depth effect"""
-        # Shadow
-        shadow = font.render(text, True, (20, 20, 40))
-        shadow_rect = shadow.get_rect(center=(x + shadow_offset, y + shadow_offset))
-        self.screen.blit(shadow, shadow_rect)
-
-        # Main text
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        """Draw a vertical gradient background (cached per colors and height)"""
+        gradient_cache.draw(self.screen, color1, color2)
+
+    def quantize_phase(self, t, steps=GRADIENT_ANIMATION_STEPS):
+        """
+        Snap an animation phase in [0, 1] to a fixed number of levels
+
+        Animated gradients computed from a quantized phase only ever produce
+        steps + 1 distinct color pairs, so they stay inside the gradient cache.
+        """
+        return round(t * steps) / steps
+
+    def draw_text_with_shadow(self, text, font, color, x, y, shadow_offset=4,
+                              shadow_color=(20, 20, 40)):
+        """Draw text with shadow for depth effect (pre-composited, cached)"""
+        surface = self.fonts.render_shadowed(
+            font, text, color, shadow_color, shadow_offset
+        )
+        text_rect = pygame.Rect(
+            0, 0, surface.get_width() - shadow_offset, surface.get_height() - shadow_offset
+        )
+        text_rect.center = (x, y)
+        self.screen.blit(surface, text_rect)
         return text_rect
 
     def draw_text_with_glow(self, text, font, color, x, y):
-        """Draw text with glow effect"""
-        # Glow layers
-        for i in range(5, 0, -1):
-            glow_surface = font.render(text, True, (*color, 50 // i))
-            glow_rect = glow_surface.get_rect(center=(x, y))
-
-            alpha_surface = pygame.Surface(
-                (glow_rect.width + i * 4, glow_rect.height + i * 4), pygame.SRCALPHA
-            )
-            alpha_surface.blit(glow_surface, (i * 2, i * 2))
-            self.screen.blit(alpha_surface, (glow_rect.x - i * 2, glow_rect.y - i * 2))
-
-        # Main text
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        """Draw text with glow effect (glow layers pre-composited, cached)"""
+        # Glow layers: the text again at alpha 50 // i, i = 5..1
+        surface = self.fonts.render_glowing(
+            font, text, color, glow_alphas=[50 // i for i in range(5, 0, -1)]
+        )
+        text_rect = surface.get_rect(center=(x, y))
+        self.screen.blit(surface, text_rect)
 
     def draw_fancy_button(self, text, x, y, color, pulse_size, is_hovered=False):
         """Draw a fancy button with animation and hover detection"""
@@ -98,8 +175,8 @@ class UIRenderer:
         )
 
         # Text - always use symbol font for consistent unicode support
-        text_surface = self.fonts.get_symbol_font().render(
-            text, True, self.colors.WHITE
+        text_surface = self.fonts.render(
+            self.fonts.get_symbol_font(), text, True, self.colors.WHITE
         )
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
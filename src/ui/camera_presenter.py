@@ -0,0 +1,150 @@
+"""
+Camera Presenter - Fast camera frame to pygame surface path
+"""
+
+import cv2
+import numpy as np
+import pygame
+from frame import Frame
+
+
+class CameraPresenter:
+    """
+    Presents camera frames through a persistent, rounded-corner target surface
+
+    The target surface wraps a BGRA buffer owned by this class (the byte order
+    of the usual 32-bit display format, so blits need no pixel conversion).
+    Its alpha channel (the rounded-corner mask) is written once; each frame
+    the mirrored camera image (resized by OpenCV when needed) is copied
+    straight into the BGR channels of that buffer, so no per-frame surfaces
+    are allocated.
+    """
+
+    def __init__(self, width, height, colors, border_radius=12):
+        """
+        Initialize camera presenter
+
+        Args:
+            width: Displayed camera width
+            height: Displayed camera height
+            colors: Colors instance
+            border_radius: Corner radius of the camera feed
+        """
+        self.width = width
+        self.height = height
+        self.colors = colors
+        self.border_radius = border_radius
+
+        # Persistent BGRA buffer + zero-copy surface view onto it
+        self.buffer = np.zeros((height, width, 4), dtype=np.uint8)
+        self.buffer[:, :, 3] = self._build_corner_mask()
+        self.surface = pygame.image.frombuffer(self.buffer, (width, height), "BGRA")
+
+        # Scratch buffer for the mirrored (and resized) frame
+        self.mirrored = np.empty((height, width, 3), dtype=np.uint8)
+        self.remap_source_size = None
+        self.map_x = None
+        self.map_y = None
+
+        self.glow_surface = self._build_glow_surface()
+
+    def _build_corner_mask(self):
+        """Build alpha mask with rounded corners (255 inside, 0 outside)"""
+        mask_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            mask_surface, (255, 255, 255, 255),
+            (0, 0, self.width, self.height), border_radius=self.border_radius
+        )
+        return pygame.surfarray.array_alpha(mask_surface).T
+
+    def _build_glow_surface(self):
+        """Pre-composite the border glow layers into one surface"""
+        pad = 8
+        glow_surface = pygame.Surface(
+            (self.width + pad * 2, self.height + pad * 2), pygame.SRCALPHA
+        )
+        # Transparent cyan so blending layers keeps the glow color
+        glow_surface.fill((*self.colors.CYAN, 0))
+
+        for i in range(4, 0, -1):
+            glow_alpha = 30 - i * 5
+            layer = pygame.Surface(
+                (self.width + i * 4, self.height + i * 4), pygame.SRCALPHA
+            )
+            pygame.draw.rect(
+                layer, (*self.colors.CYAN, glow_alpha),
+                layer.get_rect(), border_radius=15
+            )
+            glow_surface.blit(layer, (pad - i * 2, pad - i * 2))
+        return glow_surface
+
+    def _update_remap(self, source_width, source_height):
+        """Precompute a mirror + resize lookup for the given source size"""
+        scale_x = source_width / self.width
+        scale_y = source_height / self.height
+        xs = (self.width - 1 - np.arange(self.width) + 0.5) * scale_x - 0.5
+        ys = (np.arange(self.height) + 0.5) * scale_y - 0.5
+        self.map_x = np.ascontiguousarray(
+            np.broadcast_to(xs, (self.height, self.width)), dtype=np.float32
+        )
+        self.map_y = np.ascontiguousarray(
+            np.broadcast_to(ys[:, None], (self.height, self.width)), dtype=np.float32
+        )
+        self.remap_source_size = (source_width, source_height)
+
+    def update(self, frame, is_current=None):
+        """
+        Write a camera frame into the target surface
+
+        Args:
+            frame: Frame or OpenCV BGR array (any size)
+            is_current: Optional check run after the frame was copied; when it
+                        fails (the frame's memory was overwritten meanwhile)
+                        the surface keeps showing the previous frame
+
+        Returns:
+            pygame.Surface: Persistent camera surface (valid until next update)
+        """
+        frame = Frame.wrap(frame)
+        source_height, source_width = frame.shape[:2]
+
+        if (source_width, source_height) == (self.width, self.height):
+            # Mirror into the scratch buffer (no per-frame allocation)
+            cv2.flip(frame.bgr, 1, dst=self.mirrored)
+        else:
+            # Mirror + resize fused into one remap
+            if self.remap_source_size != (source_width, source_height):
+                self._update_remap(source_width, source_height)
+            cv2.remap(
+                frame.bgr, self.map_x, self.map_y, cv2.INTER_LINEAR, dst=self.mirrored
+            )
+
+        # Torn copy: keep the previous frame in the buffer
+        if is_current is not None and not is_current(frame):
+            return self.surface
+
+        # BGR into the color channels of the BGRA buffer; alpha stays untouched
+        cv2.mixChannels(
+            [self.mirrored], [self.buffer], [0, 0, 1, 1, 2, 2]
+        )
+        return self.surface
+
+    def draw(self, screen, frame, x, y, overlay=None, is_current=None):
+        """
+        Draw glow, camera frame and border at (x, y)
+
+        Args:
+            overlay: Optional callable drawing onto the camera surface before it
+                     is blitted (e.g. debug landmarks)
+            is_current: Optional frame check, see update()
+        """
+        screen.blit(self.glow_surface, (x - 8, y - 8))
+        surface = self.update(frame, is_current)
+        if overlay is not None:
+            overlay(surface)
+        screen.blit(surface, (x, y))
+        pygame.draw.rect(
+            screen, self.colors.CYAN,
+            (x, y, self.width, self.height),
+            width=3, border_radius=self.border_radius
+        )
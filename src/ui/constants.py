@@ -2,6 +2,9 @@
 UI Constants - Colors, dimensions, and configuration values
 """
 
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 
 
@@ -31,11 +34,99 @@ class Dimensions:
     BUTTON_BORDER_RADIUS = 25
 
 
+def composite_layers(size, layers):
+    """
+    Alpha-composite surfaces into one SRCALPHA surface
+
+    Uses the exact "over" operator, so blitting the result looks the same as
+    blitting every layer in turn (plain SRCALPHA-onto-SRCALPHA blits darken
+    edges where two translucent layers overlap).
+
+    Args:
+        size: (width, height) of the result
+        layers: List of (surface, (x, y)), bottom layer first
+
+    Returns:
+        pygame.Surface: Composited surface
+    """
+    width, height = size
+    color = np.zeros((width, height, 3))  # Premultiplied
+    alpha = np.zeros((width, height))
+    for surface, (x, y) in layers:
+        layer_w, layer_h = surface.get_size()
+        layer_alpha = pygame.surfarray.array_alpha(surface) / 255.0
+        layer_color = pygame.surfarray.array3d(surface) / 255.0
+        region = (slice(x, x + layer_w), slice(y, y + layer_h))
+        color[region] = (
+            layer_color * layer_alpha[..., None]
+            + color[region] * (1 - layer_alpha[..., None])
+        )
+        alpha[region] = layer_alpha + alpha[region] * (1 - layer_alpha)
+
+    result = pygame.Surface(size, pygame.SRCALPHA)
+    covered = alpha > 0
+    rgb = np.zeros_like(color)
+    rgb[covered] = color[covered] / alpha[covered][..., None]
+    pixels = pygame.surfarray.pixels3d(result)
+    pixels[...] = np.round(rgb * 255).astype(np.uint8)
+    del pixels  # Unlock the surface
+    pixels_alpha = pygame.surfarray.pixels_alpha(result)
+    pixels_alpha[...] = np.round(alpha * 255).astype(np.uint8)
+    del pixels_alpha
+    return result
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color, effect)"""
+
+    def __init__(self, max_entries=256):
+        """
+        Initialize text cache
+
+        Args:
+            max_entries: Maximum number of cached surfaces
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """Get a cached surface (None on a miss)"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def store(self, key, surface):
+        """Cache a surface, evicting the least recently used one when full"""
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def get_stats(self):
+        """Get cache size and hit counters"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
 class FontManager:
     """Manages font loading and caching"""
     
     def __init__(self):
         """Initialize fonts"""
+        # Rendered text surfaces (returned surfaces are shared: never modify them)
+        self.text_cache = TextCache()
+
         # Try to load system fonts that support emoji
         try:
             self.emoji_font = pygame.font.SysFont('segoeuiemoji', 72)
@@ -70,3 +161,56 @@ class FontManager:
     
     def get_small_font(self):
         return self.small_font
+    
+    def render(self, font, text, antialias, color):
+        """Render text through the cache (same arguments as Font.render)"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.text_cache.lookup(key)
+        if surface is None:
+            surface = self.text_cache.store(key, font.render(text, antialias, color))
+        return surface
+    
+    def render_shadowed(self, font, text, color, shadow_color=(20, 20, 40), offset=4):
+        """
+        Render text with its drop shadow pre-composited (cached)
+        
+        Returns:
+            pygame.Surface: Text at (0, 0), shadow at (offset, offset); the
+                            surface is `offset` pixels wider and taller than the text
+        """
+        key = (font, text, tuple(color), ("shadow", tuple(shadow_color), offset))
+        surface = self.text_cache.lookup(key)
+        if surface is None:
+            text_surface = font.render(text, True, color)
+            width, height = text_surface.get_size()
+            surface = composite_layers(
+                (width + offset, height + offset),
+                [(font.render(text, True, shadow_color), (offset, offset)), (text_surface, (0, 0))],
+            )
+            surface = self.text_cache.store(key, surface)
+        return surface
+    
+    def render_glowing(self, font, text, color, glow_color=None, glow_alphas=(10, 12, 16, 25, 50)):
+        """
+        Render text over stacked translucent copies of itself (cached)
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+            glow_color: Glow color (defaults to the text color)
+            glow_alphas: Alpha of each glow layer, drawn in order
+        """
+        glow_color = tuple(glow_color or color)
+        key = (font, text, tuple(color), ("glow", glow_color, tuple(glow_alphas)))
+        surface = self.text_cache.lookup(key)
+        if surface is None:
+            text_surface = font.render(text, True, color)
+            layers = [
+                (font.render(text, True, (*glow_color, alpha)), (0, 0))
+                for alpha in glow_alphas
+            ]
+            layers.append((text_surface, (0, 0)))
+            surface = composite_layers(text_surface.get_size(), layers)
+            surface = self.text_cache.store(key, surface)
+        return surface
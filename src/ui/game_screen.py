@@ -2,9 +2,10 @@
 Game Screen - Game playing screen rendering
 """
 
-import cv2
-import numpy as np
 import pygame
+from expressions import EXPRESSIONS, get_expression_name, split_expression_name
+from frame_profiler import profiler
+from .camera_presenter import CameraPresenter
 
 
 class GameScreen:
@@ -28,11 +29,26 @@ class GameScreen:
         self.width = width
         self.height = height
         self.dimensions = dimensions
+        
+        # Reusable camera surface, mask and glow
+        self.camera_presenter = CameraPresenter(
+            dimensions.CAMERA_WIDTH, dimensions.CAMERA_HEIGHT, colors
+        )
+        self.landmark_overlay = None  # Created on first debug use
+        
+        # Pre-rendered challenge labels per expression
+        self.challenge_labels = {}
+        for expression in EXPRESSIONS:
+            self._get_challenge_label(expression)
+        
+        # Player score panel backgrounds per row count (multi-player mode)
+        self.player_panels = {}
     
     def draw(self, screen, frame, current_challenge, score, remaining_time):
         """Draw game playing screen"""
         # Draw soft gradient background
-        self.renderer.draw_gradient_background((25, 20, 45), (15, 25, 50))
+        with profiler.span("draw_background"):
+            self.renderer.draw_gradient_background((25, 20, 45), (15, 25, 50))
         
         # Convert and draw camera feed
         self._draw_camera_feed(screen, frame)
@@ -47,33 +63,39 @@ class GameScreen:
         self._draw_timer_panel(screen, remaining_time)
     
     def draw_with_debug(self, screen, frame, current_challenge, score, remaining_time, 
-                       detected_expression, image_manager):
+                       detected_expression, image_manager, landmarks=None,
+                       player_scores=None, frame_is_current=None):
         """Draw game screen with debug info and animated images"""
         # Draw soft gradient background
-        self.renderer.draw_gradient_background((25, 20, 45), (15, 25, 50))
+        with profiler.span("draw_background"):
+            self.renderer.draw_gradient_background((25, 20, 45), (15, 25, 50))
         
-        # Convert and draw camera feed
-        self._draw_camera_feed(screen, frame)
+        # Convert and draw camera feed (with landmark overlay when given)
+        self._draw_camera_feed(screen, frame, landmarks, frame_is_current)
         
         # Draw animated expression images on both sides
         if current_challenge and image_manager:
-            left_x = 150
-            left_y = 350
-            image_manager.draw_animated_expression_image(
-                screen, current_challenge, left_x, left_y, self.colors
-            )
-            
-            right_x = self.width - 150
-            right_y = 350
-            image_manager.draw_animated_expression_image(
-                screen, current_challenge, right_x, right_y, self.colors
-            )
+            with profiler.span("draw_expression_images"):
+                image_manager.advance_animation()
+                left_x = 150
+                left_y = 350
+                image_manager.draw_animated_expression_image(
+                    screen, current_challenge, left_x, left_y, self.colors
+                )
+
+                right_x = self.width - 150
+                right_y = 350
+                image_manager.draw_animated_expression_image(
+                    screen, current_challenge, right_x, right_y, self.colors
+                )
         
         # Draw challenge text
         self._draw_challenge_header(screen, current_challenge)
         
         # Draw score panel
         self._draw_score_panel(screen, score)
+        if player_scores:
+            self._draw_player_scores(screen, player_scores)
         
         # Draw timer panel
         self._draw_timer_panel(screen, remaining_time)
@@ -91,103 +113,73 @@ class GameScreen:
         camera_y = 120
         return (camera_x, camera_y, camera_width, camera_height)
     
-    def _draw_camera_feed(self, screen, frame):
+    def _draw_camera_feed(self, screen, frame, landmarks=None, frame_is_current=None):
         """Draw camera feed with border"""
-        # Convert OpenCV frame to Pygame surface
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_rgb = np.fliplr(frame_rgb)  # Mirror horizontally
-        frame_surface = pygame.surfarray.make_surface(np.transpose(frame_rgb, (1, 0, 2)))
-        
-        # Scale and position
-        camera_width = self.dimensions.CAMERA_WIDTH
-        camera_height = self.dimensions.CAMERA_HEIGHT
-        camera_x = (self.width - camera_width) // 2
-        camera_y = 120
-        frame_surface = pygame.transform.scale(frame_surface, (camera_width, camera_height))
-        
-        # Draw border glow
-        for i in range(4, 0, -1):
-            glow_alpha = 30 - i * 5
-            glow_rect = pygame.Rect(
-                camera_x - i * 2, camera_y - i * 2,
-                camera_width + i * 4, camera_height + i * 4
+        camera_x, camera_y, _, _ = self.get_camera_area()
+        overlay = None
+        if landmarks is not None:
+            landmark_overlay = self._get_landmark_overlay()
+            overlay = lambda surface: landmark_overlay.draw(surface, landmarks)
+        with profiler.span("draw_camera"):
+            self.camera_presenter.draw(
+                screen, frame, camera_x, camera_y, overlay, frame_is_current
             )
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(
-                glow_surface, (*self.colors.CYAN, glow_alpha),
-                glow_surface.get_rect(), border_radius=15
+    
+    def _get_landmark_overlay(self):
+        """Get the debug landmark overlay (imported on first use)"""
+        if self.landmark_overlay is None:
+            from .landmark_overlay import LandmarkOverlay
+            self.landmark_overlay = LandmarkOverlay(
+                self.colors, self.camera_presenter.border_radius
             )
-            screen.blit(glow_surface, (glow_rect.x, glow_rect.y))
-        
-        # Create surface with rounded corners for camera feed
-        camera_surface = pygame.Surface((camera_width, camera_height), pygame.SRCALPHA)
-        
-        # Draw the frame on the surface
-        camera_surface.blit(frame_surface, (0, 0))
-        
-        # Create mask with rounded corners
-        mask_surface = pygame.Surface((camera_width, camera_height), pygame.SRCALPHA)
-        pygame.draw.rect(mask_surface, (255, 255, 255, 255), (0, 0, camera_width, camera_height), border_radius=12)
-        
-        # Apply mask to create rounded corners
-        camera_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        
-        # Draw camera feed with rounded corners
-        screen.blit(camera_surface, (camera_x, camera_y))
-        
-        # Draw border with matching rounded corners
-        pygame.draw.rect(
-            screen, self.colors.CYAN,
-            (camera_x, camera_y, camera_width, camera_height),
-            width=3, border_radius=12
-        )
+        return self.landmark_overlay
     
-    def _draw_challenge_header(self, screen, expression_key):
-        """Draw challenge text with emoji support"""
-        if not expression_key:
-            return
-        
-        from game_logic import GameLogic
+    def _get_challenge_label(self, expression_key):
+        """Get cached challenge label surface (emoji + text) for an expression"""
+        if expression_key in self.challenge_labels:
+            return self.challenge_labels[expression_key]
         
-        game_logic = GameLogic()
-        full_text = game_logic.expression_names.get(expression_key, "")
+        full_text = get_expression_name(expression_key)
         if not full_text:
-            return
-        
-        # Try to split emoji from text
-        emoji_char = None
-        label_text = full_text
-        
-        if " " in full_text:
-            possible_emoji, remainder = full_text.split(" ", 1)
-            if not possible_emoji.isascii():
-                emoji_char = possible_emoji
-                label_text = remainder
+            self.challenge_labels[expression_key] = None
+            return None
         
-        center_x = self.width // 2
-        y_pos = 50
+        emoji_char, label_text = split_expression_name(full_text)
         
         if emoji_char:
-            emoji_surface = self.fonts.get_emoji_font().render(emoji_char, True, self.colors.WHITE)
-            text_surface = self.fonts.get_large_font().render(label_text, True, self.colors.YELLOW)
+            emoji_surface = self.fonts.render(self.fonts.get_emoji_font(), emoji_char, True, self.colors.WHITE)
+            text_surface = self.fonts.render(self.fonts.get_large_font(), label_text, True, self.colors.YELLOW)
             
             spacing = 18
             total_width = emoji_surface.get_width() + spacing + text_surface.get_width()
-            emoji_pos = (
-                center_x - total_width // 2,
-                y_pos - emoji_surface.get_height() // 2
+            total_height = max(emoji_surface.get_height(), text_surface.get_height())
+            
+            label_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
+            label_surface.blit(
+                emoji_surface, (0, (total_height - emoji_surface.get_height()) // 2)
             )
-            text_pos = (
-                emoji_pos[0] + emoji_surface.get_width() + spacing,
-                y_pos - text_surface.get_height() // 2
+            label_surface.blit(
+                text_surface,
+                (emoji_surface.get_width() + spacing,
+                 (total_height - text_surface.get_height()) // 2)
             )
-            
-            screen.blit(emoji_surface, emoji_pos)
-            screen.blit(text_surface, text_pos)
         else:
-            text_surface = self.fonts.get_large_font().render(full_text, True, self.colors.YELLOW)
-            text_rect = text_surface.get_rect(center=(center_x, y_pos))
-            screen.blit(text_surface, text_rect)
+            label_surface = self.fonts.render(self.fonts.get_large_font(), full_text, True, self.colors.YELLOW)
+        
+        self.challenge_labels[expression_key] = label_surface
+        return label_surface
+    
+    def _draw_challenge_header(self, screen, expression_key):
+        """Draw challenge text with emoji support"""
+        if not expression_key:
+            return
+        
+        label_surface = self._get_challenge_label(expression_key)
+        if not label_surface:
+            return
+        
+        label_rect = label_surface.get_rect(center=(self.width // 2, 50))
+        screen.blit(label_surface, label_rect)
     
     def _draw_score_panel(self, screen, score):
         """Draw score panel"""
@@ -197,9 +189,25 @@ class GameScreen:
         pygame.draw.rect(score_bg, self.colors.GREEN, score_bg.get_rect(), width=2, border_radius=10)
         screen.blit(score_bg, (30, 20))
         
-        score_surface = self.fonts.get_medium_font().render(score_text, True, self.colors.GREEN)
+        score_surface = self.fonts.render(self.fonts.get_medium_font(), score_text, True, self.colors.GREEN)
         screen.blit(score_surface, (50, 30))
     
+    def _draw_player_scores(self, screen, player_scores):
+        """Draw per-player scores below the score panel (multi-player mode)"""
+        line_height = 28
+        panel_bg = self.player_panels.get(len(player_scores))
+        if panel_bg is None:
+            panel_bg = pygame.Surface((180, 16 + line_height * len(player_scores)), pygame.SRCALPHA)
+            pygame.draw.rect(panel_bg, (30, 25, 50, 200), panel_bg.get_rect(), border_radius=10)
+            pygame.draw.rect(panel_bg, self.colors.GREEN, panel_bg.get_rect(), width=2, border_radius=10)
+            self.player_panels[len(player_scores)] = panel_bg
+        screen.blit(panel_bg, (30, 80))
+        
+        for i, (player_id, player_score) in enumerate(sorted(player_scores.items())):
+            text = f"P{player_id}: {player_score}"
+            text_surface = self.fonts.render(self.fonts.get_small_font(), text, True, self.colors.WHITE)
+            screen.blit(text_surface, (50, 88 + i * line_height))
+    
     def _draw_timer_panel(self, screen, remaining_time):
         """Draw timer panel"""
         time_text = f"Waktu: {int(remaining_time)}s"
@@ -213,6 +221,6 @@ class GameScreen:
         time_bg_rect = time_bg.get_rect(topright=(self.width - 30, 20))
         screen.blit(time_bg, time_bg_rect)
         
-        time_surface = self.fonts.get_medium_font().render(time_text, True, time_color)
+        time_surface = self.fonts.render(self.fonts.get_medium_font(), time_text, True, time_color)
         time_rect = time_surface.get_rect(topright=(self.width - 50, 30))
         screen.blit(time_surface, time_rect)
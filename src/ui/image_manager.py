@@ -7,6 +7,9 @@ import sys
 import math
 import pygame
 
+# Tilt resolution of the cached expression image animation (degrees)
+ANIMATION_ROTATION_STEP = 0.5
+
 
 def get_base_path():
     """Get base path for assets"""
@@ -29,6 +32,7 @@ class ImageManager:
         self.image_size = image_size
         self.expression_images = {}
         self.animation_time = 0
+        self.animation_frames = {}  # {(expression, rotation step): frame}
         self.load_expression_images()
     
     def load_expression_images(self):
@@ -63,6 +67,16 @@ class ImageManager:
         """Get dictionary of loaded expression images"""
         return self.expression_images
     
+    def advance_animation(self, step=0.2):
+        """
+        Advance the sway animation (call once per frame)
+        
+        Args:
+            step: Animation time per frame (0.2 keeps the pace the images had
+                  when each of the two draw calls per frame advanced it by 0.1)
+        """
+        self.animation_time += step
+    
     def draw_animated_expression_image(self, screen, expression, x, y, colors):
         """
         Draw expression image with swaying animation
@@ -77,9 +91,6 @@ class ImageManager:
         if expression not in self.expression_images:
             return
         
-        # Update animation time
-        self.animation_time += 0.1
-        
         # Calculate swaying motion (left-right)
         sway_amount = 30
         sway_offset = math.sin(self.animation_time) * sway_amount
@@ -92,41 +103,63 @@ class ImageManager:
         rotation_amount = 5  # degrees
         rotation = math.sin(self.animation_time * 0.8) * rotation_amount
         
+        # Glow + rotated image, composited once per rotation step
+        frame = self._get_animation_frame(expression, rotation, colors)
+        
+        # Calculate final position with animations (frame includes the glow margin)
+        final_x = x + sway_offset - frame.get_width() // 2
+        final_y = y + bob_offset - frame.get_height() // 2
+        screen.blit(frame, (final_x, final_y))
+    
+    def _get_animation_frame(self, expression, rotation, colors):
+        """
+        Get the cached animation frame for an expression at a tilt
+        
+        The tilt swings between -5 and 5 degrees, so each expression loops
+        through at most 10 / ANIMATION_ROTATION_STEP + 1 frames.
+        """
+        step = round(rotation / ANIMATION_ROTATION_STEP)
+        key = (expression, step)
+        frame = self.animation_frames.get(key)
+        if frame is None:
+            frame = self._build_animation_frame(
+                expression, step * ANIMATION_ROTATION_STEP, colors
+            )
+            self.animation_frames[key] = frame
+        return frame
+    
+    def _build_animation_frame(self, expression, rotation, colors):
+        """Composite the glow layers and the rotated image into one surface"""
         # Get image and apply rotation
         image = self.expression_images[expression]
         rotated_image = pygame.transform.rotate(image, rotation)
         
-        # Calculate final position with animations
-        final_x = x + sway_offset - rotated_image.get_width() // 2
-        final_y = y + bob_offset - rotated_image.get_height() // 2
-        
         # Add glow effect around image
-        glow_surface = pygame.Surface(
+        frame = pygame.Surface(
             (rotated_image.get_width() + 40, rotated_image.get_height() + 40),
             pygame.SRCALPHA
         )
         
+        # Color based on expression
+        if expression == "happy":
+            glow_rgb = colors.YELLOW
+        elif expression == "sad":
+            glow_rgb = colors.BLUE
+        elif expression == "surprised":
+            glow_rgb = colors.ORANGE
+        else:  # neutral
+            glow_rgb = colors.GRAY
+        
         # Multiple glow layers
         for i in range(5, 0, -1):
             alpha = 30 - i * 5
             glow_size = (rotated_image.get_width() + i * 8, rotated_image.get_height() + i * 8)
             temp_surface = pygame.Surface(glow_size, pygame.SRCALPHA)
-            
-            # Color based on expression
-            if expression == "happy":
-                glow_color = (*colors.YELLOW, alpha)
-            elif expression == "sad":
-                glow_color = (*colors.BLUE, alpha)
-            elif expression == "surprised":
-                glow_color = (*colors.ORANGE, alpha)
-            else:  # neutral
-                glow_color = (*colors.GRAY, alpha)
-            
-            pygame.draw.rect(temp_surface, glow_color, temp_surface.get_rect(), border_radius=20)
-            glow_surface.blit(temp_surface, (20 - i * 4, 20 - i * 4))
-        
-        # Draw glow
-        screen.blit(glow_surface, (final_x - 20, final_y - 20))
+            pygame.draw.rect(
+                temp_surface, (*glow_rgb, alpha), temp_surface.get_rect(), border_radius=20
+            )
+            frame.blit(temp_surface, (20 - i * 4, 20 - i * 4))
         
-        # Draw the image
-        screen.blit(rotated_image, (final_x, final_y))
+        # Image on top of its glow
+        frame.blit(rotated_image, (20, 20))
+        return frame
@@ -0,0 +1,60 @@
+"""
+Landmark Overlay - Debug drawing of face mesh landmarks on the camera feed
+
+Only imported when the overlay is switched on, so the production render path
+never loads drawing code.
+"""
+
+import numpy as np
+import pygame
+from mediapipe.python.solutions.face_mesh_connections import FACEMESH_CONTOURS
+
+
+class LandmarkOverlay:
+    """Draws landmark points and face contours onto the camera surface"""
+
+    def __init__(self, colors, border_radius=12):
+        """
+        Initialize landmark overlay
+
+        Args:
+            colors: Colors instance
+            border_radius: Corner radius of the camera feed (kept clear so the
+                           rounded-corner alpha is never overwritten)
+        """
+        self.point_color = colors.GREEN
+        self.contour_color = colors.CYAN
+        self.border_radius = border_radius
+        self.contours = np.array(sorted(FACEMESH_CONTOURS))
+
+    def draw(self, surface, landmarks, mirrored=True):
+        """
+        Draw landmarks onto the camera surface
+
+        Args:
+            surface: Camera surface (frame stretched to the surface size)
+            landmarks: (N, 3) or (faces, N, 3) normalized landmarks of the full
+                       camera frame
+            mirrored: Surface shows the horizontally mirrored frame
+        """
+        width, height = surface.get_size()
+        points = landmarks[..., :2] * (width, height)
+        if mirrored:
+            points[..., 0] = width - 1 - points[..., 0]
+        points = points.astype(int).reshape(-1, landmarks.shape[-2], 2)
+
+        inset = self.border_radius
+        previous_clip = surface.get_clip()
+        surface.set_clip(
+            pygame.Rect(inset, inset, width - inset * 2, height - inset * 2)
+        )
+
+        for face_points in points:
+            for start, end in self.contours:
+                pygame.draw.line(
+                    surface, self.contour_color, face_points[start], face_points[end]
+                )
+            for x, y in face_points:
+                surface.fill(self.point_color, (x - 1, y - 1, 2, 2))
+
+        surface.set_clip(previous_clip)
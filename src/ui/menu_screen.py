@@ -59,7 +59,7 @@ class MenuScreen:
         self.menu_time += 0.05
 
         # Animated gradient background
-        t = math.sin(self.menu_time * 0.5) * 0.5 + 0.5
+        t = self.renderer.quantize_phase(math.sin(self.menu_time * 0.5) * 0.5 + 0.5)
         color1 = (int(20 + t * 20), int(10 + t * 30), int(40 + t * 40))
         color2 = (int(60 + t * 30), int(20 + t * 20), int(80 + t * 40))
         self.renderer.draw_gradient_background(color1, color2)
@@ -119,6 +119,7 @@ class MenuScreen:
         for i, char in enumerate(title_text):
             hue = (self.menu_time * 50 + i * 30) % 360
             color = self.renderer.hsv_to_rgb(hue, 100, 100)
+            # Not through the text cache: the color changes every frame
             char_surface = self.fonts.get_title_font().render(char, True, color)
             char_surfaces.append(char_surface)
             total_width += char_surface.get_width()
@@ -126,8 +127,8 @@ class MenuScreen:
         x_offset = (self.width - total_width) // 2
         for i, char_surface in enumerate(char_surfaces):
             char_bounce = math.sin(self.menu_time * 2 + i * 0.3) * 8
-            shadow = self.fonts.get_title_font().render(
-                title_text[i], True, (20, 20, 40)
+            shadow = self.fonts.render(
+                self.fonts.get_title_font(), title_text[i], True, (20, 20, 40)
             )
             screen.blit(shadow, (x_offset + 4, title_y + char_bounce + 4))
             screen.blit(char_surface, (x_offset, title_y + char_bounce))
@@ -173,8 +174,8 @@ class MenuScreen:
                 screen, self.colors.WHITE, (box_rect.x + 50, y_offset + 10), 4
             )
 
-            text_surface = self.fonts.get_small_font().render(
-                text, True, self.colors.WHITE
+            text_surface = self.fonts.render(
+                self.fonts.get_small_font(), text, True, self.colors.WHITE
             )
             screen.blit(text_surface, (box_rect.x + 80, y_offset))
             y_offset += 50
@@ -253,7 +254,7 @@ class MenuScreen:
                 if (is_selected or is_hovered)
                 else self.fonts.get_small_font()
             )
-            text_surface = text_font.render(option["text"], True, text_color)
+            text_surface = self.fonts.render(text_font, option["text"], True, text_color)
             text_rect = text_surface.get_rect(
                 center=(box_x + box_width // 2, menu_y + box_height // 2)
             )
@@ -263,8 +264,8 @@ class MenuScreen:
         """Draw navigation instructions"""
         inst_y = 520
         text_nav = " untuk navigasi • ENTER untuk pilih"
-        text_nav_surface = self.fonts.get_small_font().render(
-            text_nav, True, self.colors.GRAY
+        text_nav_surface = self.fonts.render(
+            self.fonts.get_small_font(), text_nav, True, self.colors.GRAY
         )
         icon_width = 20 if self.icon_exchange else 0
         total_width = icon_width + text_nav_surface.get_width()
@@ -274,7 +275,7 @@ class MenuScreen:
             screen.blit(self.icon_exchange, (start_x, inst_y))
             start_x += icon_width + 5
         else:
-            fallback = self.fonts.get_small_font().render("← →", True, self.colors.GRAY)
+            fallback = self.fonts.render(self.fonts.get_small_font(), "← →", True, self.colors.GRAY)
             screen.blit(fallback, (start_x, inst_y))
             start_x += fallback.get_width()
 
@@ -287,13 +288,13 @@ class MenuScreen:
         pygame.draw.rect(team_bg, (0, 0, 0, 120), team_bg.get_rect())
         screen.blit(team_bg, (0, team_y))
 
-        team_title = self.fonts.get_small_font().render(
-            "Tim Pengembang:", True, self.colors.YELLOW
+        team_title = self.fonts.render(
+            self.fonts.get_small_font(), "Tim Pengembang:", True, self.colors.YELLOW
         )
         team_rect = team_title.get_rect(center=(self.width // 2, team_y + 25))
         screen.blit(team_title, team_rect)
 
         members = "Falih Dzakwan Zuhdi • Hamka Putra Andiyan • Bayu Ega Ferdana"
-        text = self.fonts.get_small_font().render(members, True, self.colors.LIGHT_BLUE)
+        text = self.fonts.render(self.fonts.get_small_font(), members, True, self.colors.LIGHT_BLUE)
         text_rect = text.get_rect(center=(self.width // 2, team_y + 60))
         screen.blit(text, text_rect)
@@ -73,18 +73,15 @@ class DifficultyScreen:
         )
 
         # Title
-        title = self.fonts.get_title_font().render(
-            "PILIH KESULITAN", True, self.colors.YELLOW
+        self.renderer.draw_text_with_shadow(
+            "PILIH KESULITAN",
+            self.fonts.get_title_font(),
+            self.colors.YELLOW,
+            self.width // 2,
+            100,
+            shadow_offset=3,
+            shadow_color=(50, 50, 50),
         )
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-
-        # Shadow
-        title_shadow = self.fonts.get_title_font().render(
-            "PILIH KESULITAN", True, (50, 50, 50)
-        )
-        shadow_rect = title_shadow.get_rect(center=(self.width // 2 + 3, 103))
-        screen.blit(title_shadow, shadow_rect)
-        screen.blit(title, title_rect)
 
         # Difficulty options
         difficulties = [
@@ -151,22 +148,22 @@ class DifficultyScreen:
         screen.blit(box_surface, (box_x, y_pos))
 
         # Difficulty name
-        name_surface = self.fonts.get_large_font().render(
-            diff["name"], True, diff["color"]
+        name_surface = self.fonts.render(
+            self.fonts.get_large_font(), diff["name"], True, diff["color"]
         )
         name_rect = name_surface.get_rect(left=box_x + 30, centery=y_pos + 35)
         screen.blit(name_surface, name_rect)
 
         # Description
-        desc_surface = self.fonts.get_small_font().render(
-            diff["desc"], True, self.colors.WHITE
+        desc_surface = self.fonts.render(
+            self.fonts.get_small_font(), diff["desc"], True, self.colors.WHITE
         )
         desc_rect = desc_surface.get_rect(left=box_x + 30, centery=y_pos + 70)
         screen.blit(desc_surface, desc_rect)
 
         # Emoji
-        emoji_surface = self.fonts.get_emoji_font().render(
-            diff["emoji"], True, self.colors.WHITE
+        emoji_surface = self.fonts.render(
+            self.fonts.get_emoji_font(), diff["emoji"], True, self.colors.WHITE
         )
         emoji_rect = emoji_surface.get_rect(
             right=box_x + box_width - 30, centery=y_pos + 50
@@ -180,8 +177,8 @@ class DifficultyScreen:
         text_pilih = (
             " untuk pilih • ENTER untuk mulai • L untuk Leaderboard • ESC untuk keluar"
         )
-        text_pilih_surface = self.fonts.get_small_font().render(
-            text_pilih, True, self.colors.GRAY
+        text_pilih_surface = self.fonts.render(
+            self.fonts.get_small_font(), text_pilih, True, self.colors.GRAY
         )
         icon_width = 20 if self.icon_up_down else 0
         total_width = icon_width + text_pilih_surface.get_width()
@@ -192,7 +189,7 @@ class DifficultyScreen:
             screen.blit(self.icon_up_down, (start_x, inst_y))
             start_x += icon_width + 5
         else:
-            fallback = self.fonts.get_small_font().render("↑↓", True, self.colors.GRAY)
+            fallback = self.fonts.render(self.fonts.get_small_font(), "↑↓", True, self.colors.GRAY)
             screen.blit(fallback, (start_x, inst_y))
             start_x += fallback.get_width()
 
@@ -261,8 +258,8 @@ class LeaderboardScreen:
         )
 
         # Title
-        title = self.fonts.get_title_font().render(
-            "LEADERBOARD", True, self.colors.YELLOW
+        title = self.fonts.render(
+            self.fonts.get_title_font(), "LEADERBOARD", True, self.colors.YELLOW
         )
         title_rect = title.get_rect(center=(self.width // 2, 80))
         screen.blit(title, title_rect)
@@ -315,8 +312,8 @@ class LeaderboardScreen:
                 pygame.draw.rect(screen, tab_color, tab_rect, border_radius=10, width=3)
                 text_color = tab_color
 
-            tab_text = self.fonts.get_medium_font().render(
-                diff_names[diff], True, text_color
+            tab_text = self.fonts.render(
+                self.fonts.get_medium_font(), diff_names[diff], True, text_color
             )
             tab_text_rect = tab_text.get_rect(center=tab_rect.center)
             screen.blit(tab_text, tab_text_rect)
@@ -341,33 +338,33 @@ class LeaderboardScreen:
 
                 # Rank
                 rank_text = f"#{i + 1}"
-                rank_surface = self.fonts.get_medium_font().render(
-                    rank_text, True, rank_color
+                rank_surface = self.fonts.render(
+                    self.fonts.get_medium_font(), rank_text, True, rank_color
                 )
                 screen.blit(rank_surface, (150, rank_y))
 
                 # Name
-                name_surface = self.fonts.get_medium_font().render(
-                    entry["name"], True, self.colors.WHITE
+                name_surface = self.fonts.render(
+                    self.fonts.get_medium_font(), entry["name"], True, self.colors.WHITE
                 )
                 screen.blit(name_surface, (250, rank_y))
 
                 # Score
                 score_text = f"{entry['score']} poin"
-                score_surface = self.fonts.get_medium_font().render(
-                    score_text, True, self.colors.GREEN
+                score_surface = self.fonts.render(
+                    self.fonts.get_medium_font(), score_text, True, self.colors.GREEN
                 )
                 screen.blit(score_surface, (550, rank_y))
 
                 # Date
-                date_surface = self.fonts.get_small_font().render(
-                    entry["date"], True, self.colors.GRAY
+                date_surface = self.fonts.render(
+                    self.fonts.get_small_font(), entry["date"], True, self.colors.GRAY
                 )
                 screen.blit(date_surface, (800, rank_y + 5))
         else:
             no_scores = "Belum ada skor tercatat"
-            no_scores_surface = self.fonts.get_large_font().render(
-                no_scores, True, self.colors.GRAY
+            no_scores_surface = self.fonts.render(
+                self.fonts.get_large_font(), no_scores, True, self.colors.GRAY
             )
             no_scores_rect = no_scores_surface.get_rect(center=(self.width // 2, 400))
             screen.blit(no_scores_surface, no_scores_rect)
@@ -376,8 +373,8 @@ class LeaderboardScreen:
         """Draw navigation instructions with icon"""
         inst_y = self.height - 50
         text_nav = " untuk ganti difficulty • ESC untuk kembali"
-        text_nav_surface = self.fonts.get_small_font().render(
-            text_nav, True, self.colors.GRAY
+        text_nav_surface = self.fonts.render(
+            self.fonts.get_small_font(), text_nav, True, self.colors.GRAY
         )
         icon_width = 20 if self.icon_exchange else 0
         total_width = icon_width + text_nav_surface.get_width()
@@ -387,7 +384,7 @@ class LeaderboardScreen:
             screen.blit(self.icon_exchange, (start_x, inst_y))
             start_x += icon_width + 5
         else:
-            fallback = self.fonts.get_small_font().render("← →", True, self.colors.GRAY)
+            fallback = self.fonts.render(self.fonts.get_small_font(), "← →", True, self.colors.GRAY)
             screen.blit(fallback, (start_x, inst_y))
             start_x += fallback.get_width()
 
@@ -421,22 +418,20 @@ class NameInputScreen:
         )
 
         # Title
-        title = self.fonts.get_title_font().render(
-            "MASUKKAN NAMA", True, self.colors.YELLOW
+        self.renderer.draw_text_with_shadow(
+            "MASUKKAN NAMA",
+            self.fonts.get_title_font(),
+            self.colors.YELLOW,
+            self.width // 2,
+            150,
+            shadow_offset=3,
+            shadow_color=(50, 50, 50),
         )
-        title_rect = title.get_rect(center=(self.width // 2, 150))
-
-        title_shadow = self.fonts.get_title_font().render(
-            "MASUKKAN NAMA", True, (50, 50, 50)
-        )
-        shadow_rect = title_shadow.get_rect(center=(self.width // 2 + 3, 153))
-        screen.blit(title_shadow, shadow_rect)
-        screen.blit(title, title_rect)
 
         # Subtitle
         subtitle = "Nama kamu akan muncul di leaderboard!"
-        subtitle_surface = self.fonts.get_medium_font().render(
-            subtitle, True, self.colors.LIGHT_BLUE
+        subtitle_surface = self.fonts.render(
+            self.fonts.get_medium_font(), subtitle, True, self.colors.LIGHT_BLUE
         )
         subtitle_rect = subtitle_surface.get_rect(center=(self.width // 2, 220))
         screen.blit(subtitle_surface, subtitle_rect)
@@ -452,8 +447,8 @@ class NameInputScreen:
 
         # Examples
         examples = "Contoh: Player1, Falih, GamerPro"
-        example_surface = self.fonts.get_small_font().render(
-            examples, True, self.colors.CYAN
+        example_surface = self.fonts.render(
+            self.fonts.get_small_font(), examples, True, self.colors.CYAN
         )
         example_rect = example_surface.get_rect(center=(self.width // 2, 550))
         screen.blit(example_surface, example_rect)
@@ -479,8 +474,8 @@ class NameInputScreen:
         # Display text
         display_text = current_name if current_name else "Ketik nama kamu..."
         text_color = self.colors.WHITE if current_name else self.colors.GRAY
-        name_surface = self.fonts.get_large_font().render(
-            display_text, True, text_color
+        name_surface = self.fonts.render(
+            self.fonts.get_large_font(), display_text, True, text_color
         )
         name_rect = name_surface.get_rect(center=(self.width // 2, box_y + 40))
         screen.blit(name_surface, name_rect)
@@ -495,8 +490,8 @@ class NameInputScreen:
         """Draw character limit indicator"""
         limit_text = f"{len(current_name)}/15 karakter"
         limit_color = self.colors.RED if len(current_name) >= 15 else self.colors.GRAY
-        limit_surface = self.fonts.get_small_font().render(
-            limit_text, True, limit_color
+        limit_surface = self.fonts.render(
+            self.fonts.get_small_font(), limit_text, True, limit_color
         )
         limit_rect = limit_surface.get_rect(center=(self.width // 2, 410))
         screen.blit(limit_surface, limit_rect)
@@ -510,8 +505,8 @@ class NameInputScreen:
 
         inst_y = 450
         for inst in instructions:
-            inst_surface = self.fonts.get_small_font().render(
-                inst, True, self.colors.GRAY
+            inst_surface = self.fonts.render(
+                self.fonts.get_small_font(), inst, True, self.colors.GRAY
             )
             inst_rect = inst_surface.get_rect(center=(self.width // 2, inst_y))
             screen.blit(inst_surface, inst_rect)
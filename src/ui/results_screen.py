@@ -26,6 +26,9 @@ class ResultsScreen:
         self.width = width
         self.height = height
         self.menu_time = 0
+        # Loaded once (loading a font every frame is slow and defeats the text cache)
+        self.rank_font = pygame.font.Font(None, 140)
+        self.score_font = pygame.font.Font(None, 48)
 
     def get_button_rects(self):
         """Get button rectangles for mouse click detection"""
@@ -44,7 +47,7 @@ class ResultsScreen:
         self.menu_time += 0.05
 
         # Animated gradient background
-        t = math.sin(self.menu_time * 0.5) * 0.5 + 0.5
+        t = self.renderer.quantize_phase(math.sin(self.menu_time * 0.5) * 0.5 + 0.5)
         color1 = (int(10 + t * 30), int(5 + t * 20), int(30 + t * 50))
         color2 = (int(40 + t * 40), int(10 + t * 30), int(60 + t * 60))
         self.renderer.draw_gradient_background(color1, color2)
@@ -136,16 +139,14 @@ class ResultsScreen:
         bounce = math.sin(self.menu_time * 2.5) * 8
         title_y = 120 + bounce
 
-        # Glow effect
-        for i in range(5, 0, -1):
-            glow_alpha = 40 - i * 6
-            glow_surface = self.fonts.get_title_font().render(
-                "SELESAI!", True, (*rank_info["color"], glow_alpha)
-            )
-            glow_rect = glow_surface.get_rect(center=(self.width // 2, title_y))
-            screen.blit(glow_surface, glow_rect)
-
-        title = self.fonts.get_title_font().render("SELESAI!", True, self.colors.WHITE)
+        # Title over its glow layers (alpha 40 - i * 6, i = 5..1), pre-composited
+        title = self.fonts.render_glowing(
+            self.fonts.get_title_font(),
+            "SELESAI!",
+            self.colors.WHITE,
+            glow_color=rank_info["color"],
+            glow_alphas=[40 - i * 6 for i in range(5, 0, -1)],
+        )
         title_rect = title.get_rect(center=(self.width // 2, title_y))
         screen.blit(title, title_rect)
 
@@ -175,8 +176,9 @@ class ResultsScreen:
         screen.blit(rank_bg_surface, (self.width // 2 - rank_size, rank_y - rank_size))
 
         # Rank text
-        rank_font = pygame.font.Font(None, 140)
-        rank_surface = rank_font.render(rank_info["rank"], True, self.colors.WHITE)
+        rank_surface = self.fonts.render(
+            self.rank_font, rank_info["rank"], True, self.colors.WHITE
+        )
         rank_rect = rank_surface.get_rect(center=(self.width // 2, rank_y))
         screen.blit(rank_surface, rank_rect)
 
@@ -245,18 +247,14 @@ class ResultsScreen:
         # Score
         score_pulse = math.sin(self.menu_time * 4) * 3
         score_text = f"SKOR: {score} / {max_score}"
-        score_font = pygame.font.Font(None, 48)
-        score_surface = score_font.render(score_text, True, self.colors.YELLOW)
-        score_rect = score_surface.get_rect(
-            center=(self.width // 2, box_y + 90 + score_pulse)
+        # Score with its shadow 3 px down-right (pre-composited)
+        score_surface = self.fonts.render_shadowed(
+            self.score_font, score_text, self.colors.YELLOW, (20, 20, 40), 3
         )
-
-        # Score shadow
-        shadow_surface = score_font.render(score_text, True, (20, 20, 40))
-        shadow_rect = shadow_surface.get_rect(
-            center=(self.width // 2 + 3, box_y + 93 + score_pulse)
+        score_rect = pygame.Rect(
+            0, 0, score_surface.get_width() - 3, score_surface.get_height() - 3
         )
-        screen.blit(shadow_surface, shadow_rect)
+        score_rect.center = (self.width // 2, box_y + 90 + score_pulse)
         screen.blit(score_surface, score_rect)
 
         # Percentage bar
@@ -321,8 +319,8 @@ class ResultsScreen:
 
         # Percentage text
         percent_text = f"{int(percentage)}%"
-        percent_surface = self.fonts.get_medium_font().render(
-            percent_text, True, self.colors.WHITE
+        percent_surface = self.fonts.render(
+            self.fonts.get_medium_font(), percent_text, True, self.colors.WHITE
         )
         percent_rect = percent_surface.get_rect(
             center=(self.width // 2, bar_y + bar_height // 2)
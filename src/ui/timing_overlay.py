@@ -0,0 +1,87 @@
+"""
+Timing Overlay - On-screen per-stage frame timings (debug/field tuning)
+
+Only imported when the overlay is switched on.
+"""
+
+import pygame
+from frame_profiler import HISTOGRAM_EDGES_MS
+
+
+class TimingOverlay:
+    """Draws a table of stage timings, cache hit rates and a frame time histogram"""
+
+    def __init__(self, colors):
+        """
+        Initialize timing overlay
+
+        Args:
+            colors: Colors instance
+        """
+        self.colors = colors
+        self.font = pygame.font.Font(None, 22)  # Denser than the UI fonts
+        self.line_height = 18
+        self.padding = 10
+        self.width = 370
+        self.bar_height = 40
+        labels = [f"<{edge}" for edge in HISTOGRAM_EDGES_MS]
+        self.bucket_labels = labels + [f"{HISTOGRAM_EDGES_MS[-1]}+"]
+
+    def draw(self, screen, stats, frame_histogram=None, cache_stats=None):
+        """
+        Draw the overlay in the top-left corner
+
+        Args:
+            screen: Target surface
+            stats: FrameProfiler.get_stats() result
+            frame_histogram: FrameProfiler.histogram("frame") bucket counts
+            cache_stats: {cache name: (hit rate, entries)} of the render caches
+        """
+        rows = [("stage", "p50", "p95", "max")]
+        for name, stage in stats.items():
+            rows.append((
+                name,
+                f"{stage['p50_ms']:.1f}",
+                f"{stage['p95_ms']:.1f}",
+                f"{stage['max_ms']:.1f}",
+            ))
+        headers = {0}
+        if cache_stats:
+            headers.add(len(rows))
+            rows.append(("cache", "hits", "items", ""))
+            for name, (hit_rate, entries) in cache_stats.items():
+                rows.append((name, f"{hit_rate * 100:.0f}%", str(entries), ""))
+
+        histogram_height = self.bar_height + self.line_height if frame_histogram else 0
+        height = self.padding * 2 + len(rows) * self.line_height + histogram_height
+        panel = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        columns = (0, 190, 250, 310)
+        y = self.padding
+        for index, row in enumerate(rows):
+            color = self.colors.YELLOW if index in headers else self.colors.WHITE
+            for column, text in zip(columns, row):
+                surface = self.font.render(text, True, color)
+                panel.blit(surface, (self.padding + column, y))
+            y += self.line_height
+
+        if frame_histogram:
+            self._draw_histogram(panel, frame_histogram, y)
+
+        screen.blit(panel, (10, 10))
+
+    def _draw_histogram(self, panel, counts, top):
+        """Draw frame time bucket counts as bars (labels in ms)"""
+        peak = max(max(counts), 1)
+        bar_width = (self.width - self.padding * 2) // len(counts)
+        for index, count in enumerate(counts):
+            x = self.padding + index * bar_width
+            bar = int(self.bar_height * count / peak)
+            color = self.colors.GREEN if index < len(counts) - 2 else self.colors.RED
+            if bar:
+                pygame.draw.rect(
+                    panel, color, (x + 2, top + self.bar_height - bar, bar_width - 4, bar)
+                )
+            label = self.font.render(self.bucket_labels[index], True, self.colors.GRAY)
+            panel.blit(label, (x + 2, top + self.bar_height + 2))
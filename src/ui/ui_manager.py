@@ -3,8 +3,9 @@ UI Manager - Main orchestrator for all UI components
 """
 
 import pygame
+from frame_profiler import profiler
 from .constants import Colors, Dimensions, FontManager
-from .base_renderer import UIRenderer
+from .base_renderer import UIRenderer, gradient_cache
 from .animations import ParticleSystem, FloatingImageSystem, ConfettiSystem
 from .image_manager import ImageManager
 from .menu_screen import MenuScreen
@@ -74,6 +75,7 @@ class UIManager:
         self.name_input_screen = NameInputScreen(
             self.renderer, self.colors, self.fonts, width, height
         )
+        self.timing_overlay = None  # Created on first use
 
     def draw_menu(self, selected_index=0):
         """
@@ -82,64 +84,81 @@ class UIManager:
         Args:
             selected_index: Index of currently selected menu option
         """
-        self.menu_screen.draw(self.screen, selected_index)
-        self.particle_system.update_and_draw(self.screen)
-        self.floating_image_system.update_and_draw(
-            self.screen, self.image_manager.get_expression_images()
-        )
+        with profiler.span("draw_screen"):
+            self.menu_screen.draw(self.screen, selected_index)
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen)
+        with profiler.span("draw_floating_images"):
+            self.floating_image_system.update_and_draw(
+                self.screen, self.image_manager.get_expression_images()
+            )
 
     def draw_game(self, frame, current_challenge, score, remaining_time):
         """
         Draw game playing screen
 
         Args:
-            frame: Camera frame from OpenCV
+            frame: Camera Frame (or OpenCV BGR array)
             current_challenge: Current expression challenge key
             score: Current player score
             remaining_time: Remaining time in seconds
         """
-        self.game_screen.draw(
-            self.screen, frame, current_challenge, score, remaining_time
-        )
+        with profiler.span("draw_screen"):
+            self.game_screen.draw(
+                self.screen, frame, current_challenge, score, remaining_time
+            )
         # Pass camera area to avoid particles and floating images overlapping the camera feed
         camera_area = self.game_screen.get_camera_area()
-        self.particle_system.update_and_draw(self.screen, exclude_area=camera_area)
-        self.floating_image_system.update_and_draw(
-            self.screen,
-            self.image_manager.get_expression_images(),
-            exclude_area=camera_area,
-        )
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen, exclude_area=camera_area)
+        with profiler.span("draw_floating_images"):
+            self.floating_image_system.update_and_draw(
+                self.screen,
+                self.image_manager.get_expression_images(),
+                exclude_area=camera_area,
+            )
 
     def draw_game_with_debug(
-        self, frame, current_challenge, score, remaining_time, detected_expression
+        self, frame, current_challenge, score, remaining_time, detected_expression,
+        landmarks=None, player_scores=None, frame_is_current=None,
     ):
         """
         Draw game screen with debug information
 
         Args:
-            frame: Camera frame from OpenCV
+            frame: Camera Frame (or OpenCV BGR array)
             current_challenge: Current expression challenge key
             score: Current player score
             remaining_time: Remaining time in seconds
             detected_expression: Currently detected expression
-        """
-        self.game_screen.draw_with_debug(
-            self.screen,
-            frame,
-            current_challenge,
-            score,
-            remaining_time,
-            detected_expression,
-            self.image_manager,
-        )
+            landmarks: Face landmarks to overlay on the camera feed (debug only)
+            player_scores: {player_id: score} in multi-player mode
+            frame_is_current: Optional check that the frame was not overwritten
+                              while it was copied (frames in shared memory)
+        """
+        with profiler.span("draw_screen"):
+            self.game_screen.draw_with_debug(
+                self.screen,
+                frame,
+                current_challenge,
+                score,
+                remaining_time,
+                detected_expression,
+                self.image_manager,
+                landmarks,
+                player_scores,
+                frame_is_current,
+            )
         # Pass camera area to avoid particles and floating images overlapping the camera feed
         camera_area = self.game_screen.get_camera_area()
-        self.particle_system.update_and_draw(self.screen, exclude_area=camera_area)
-        self.floating_image_system.update_and_draw(
-            self.screen,
-            self.image_manager.get_expression_images(),
-            exclude_area=camera_area,
-        )
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen, exclude_area=camera_area)
+        with profiler.span("draw_floating_images"):
+            self.floating_image_system.update_and_draw(
+                self.screen,
+                self.image_manager.get_expression_images(),
+                exclude_area=camera_area,
+            )
 
     def draw_results(self, score, max_score):
         """
@@ -149,8 +168,10 @@ class UIManager:
             score: Final player score
             max_score: Maximum possible score
         """
-        self.results_screen.draw(self.screen, score, max_score)
-        self.particle_system.update_and_draw(self.screen)
+        with profiler.span("draw_screen"):
+            self.results_screen.draw(self.screen, score, max_score)
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen)
 
     def draw_difficulty_selection(self, selected_index=0):
         """
@@ -159,8 +180,10 @@ class UIManager:
         Args:
             selected_index: Index of currently selected difficulty
         """
-        self.difficulty_screen.draw(self.screen, selected_index)
-        self.particle_system.update_and_draw(self.screen)
+        with profiler.span("draw_screen"):
+            self.difficulty_screen.draw(self.screen, selected_index)
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen)
 
     def draw_leaderboard(self, leaderboard_manager, difficulty="medium"):
         """
@@ -170,8 +193,10 @@ class UIManager:
             leaderboard_manager: LeaderboardManager instance
             difficulty: Current difficulty filter ("easy", "medium", "hard")
         """
-        self.leaderboard_screen.draw(self.screen, leaderboard_manager, difficulty)
-        self.particle_system.update_and_draw(self.screen)
+        with profiler.span("draw_screen"):
+            self.leaderboard_screen.draw(self.screen, leaderboard_manager, difficulty)
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen)
 
     def draw_name_input(self, current_name=""):
         """
@@ -180,5 +205,38 @@ class UIManager:
         Args:
             current_name: Currently entered name
         """
-        self.name_input_screen.draw(self.screen, current_name)
-        self.particle_system.update_and_draw(self.screen)
+        with profiler.span("draw_screen"):
+            self.name_input_screen.draw(self.screen, current_name)
+        with profiler.span("draw_particles"):
+            self.particle_system.update_and_draw(self.screen)
+
+    def get_cache_stats(self):
+        """
+        Get hit rate and size of the render caches
+
+        Returns:
+            dict: {cache name: (hit rate, cached entries)}
+        """
+        text = self.fonts.text_cache.get_stats()
+        sprites = self.floating_image_system.sprite_cache.get_stats()
+        gradients = gradient_cache.get_stats()
+        return {
+            "text": (text["hit_rate"], text["entries"]),
+            "sprites": (sprites["hit_rate"], sprites["sprites"]),
+            "gradients": (gradients["hit_rate"], gradients["entries"]),
+        }
+
+    def draw_timing_overlay(self, stats, frame_histogram=None):
+        """
+        Draw per-stage frame timings and cache hit rates on top of the current screen
+
+        Args:
+            stats: FrameProfiler.get_stats() result
+            frame_histogram: Frame time histogram bucket counts
+        """
+        if self.timing_overlay is None:
+            from .timing_overlay import TimingOverlay
+            self.timing_overlay = TimingOverlay(self.colors)
+        self.timing_overlay.draw(
+            self.screen, stats, frame_histogram, self.get_cache_stats()
+        )